@@ -4,6 +4,8 @@ Admin configuration for campaigns app.
 
 from django.contrib import admin
 from .models import Campaign
+from .cache import invalidate_campaign_detail_cache
+from .listing import bump_listing_generation
 
 
 @admin.register(Campaign)
@@ -13,5 +15,30 @@ class CampaignAdmin(admin.ModelAdmin):
     list_display = ['name', 'advertiser', 'status', 'recruitment_start_date', 'recruitment_end_date', 'recruitment_count', 'created_at']
     list_filter = ['status', 'created_at']
     search_fields = ['name', 'advertiser__name', 'advertiser__email']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = [
+        'total_proposals',
+        'submitted_proposals',
+        'selected_proposals',
+        'rejected_proposals',
+        'created_at',
+        'updated_at',
+    ]
     ordering = ['-created_at']
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if change:
+            invalidate_campaign_detail_cache(obj.id)
+
+    def delete_model(self, request, obj):
+        campaign_id = obj.id
+        super().delete_model(request, obj)
+        invalidate_campaign_detail_cache(campaign_id)
+        # 카드는 CASCADE로 삭제되므로 목록 세대만 올린다
+        bump_listing_generation()
+
+    def delete_queryset(self, request, queryset):
+        campaign_ids = list(queryset.values_list('id', flat=True))
+        super().delete_queryset(request, queryset)
+        invalidate_campaign_detail_cache(*campaign_ids)
+        bump_listing_generation()
@@ -1,6 +1,17 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate, pre_migrate
 
 
 class CampaignsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.campaigns'
+
+    def ready(self):
+        from . import checks  # noqa: F401
+        from .search_index import (
+            drop_search_triggers_before_migrate, restore_search_triggers_after_migrate
+        )
+
+        # SQLite 검색 트리거는 migrate 동안 내려 두었다가 끝나면 다시 만든다 (apps.campaigns.search_index)
+        pre_migrate.connect(drop_search_triggers_before_migrate, sender=self)
+        post_migrate.connect(restore_search_triggers_after_migrate, sender=self)
@@ -0,0 +1,66 @@
+"""
+Cache of the rendered, user-independent part of the campaign detail page.
+
+One entry per campaign (`campaigns:detail:<id>`) holds a version - the
+campaign's `updated_at` and its advertiser profile's `updated_at`
+(company name) - and the rendered HTML. The version is read from the
+database on every request (get_campaign_summary), and an entry with
+another version is treated as a miss. Every campaign write (services,
+cron close, admin) stamps `updated_at`, so a stale fragment is never
+served, whichever process cached it.
+
+Services that change a campaign and the admin also delete the entry
+right away (see `invalidate_campaign_detail_cache`) to free it. With the
+default per-process cache (CACHE_URL unset) the delete only reaches the
+process that made the write; other processes drop their copy on the
+version check.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils.safestring import SafeString, mark_safe
+
+from .models import Campaign
+
+DETAIL_FRAGMENT_TEMPLATE = 'campaigns/_campaign_detail_body.html'
+
+
+def campaign_detail_cache_key(campaign_id: int) -> str:
+    return f'campaigns:detail:{campaign_id}'
+
+
+def get_campaign_detail_fragment(campaign: Campaign) -> SafeString:
+    """
+    Return the cached detail fragment, rendering and storing it on a miss.
+
+    Args:
+        campaign: Campaign from CampaignSelector.get_campaign_summary (`id`,
+            `updated_at` and `advertiser_profile_updated_at` loaded)
+
+    Returns:
+        SafeString: Rendered campaign information (header, dates, benefits, mission)
+    """
+    from .selectors.campaign_selectors import CampaignSelector
+
+    key = campaign_detail_cache_key(campaign.id)
+    profile_updated_at = campaign.advertiser_profile_updated_at
+    version = (
+        campaign.updated_at.isoformat(),
+        profile_updated_at.isoformat() if profile_updated_at else None,
+    )
+
+    cached = cache.get(key)
+    if cached is not None and cached[0] == version:
+        return mark_safe(cached[1])
+
+    html = render_to_string(DETAIL_FRAGMENT_TEMPLATE, {
+        'campaign': CampaignSelector.get_campaign_detail(campaign.id),
+    })
+    cache.set(key, (version, html), settings.CAMPAIGN_DETAIL_CACHE_TIMEOUT)
+    return mark_safe(html)
+
+
+def invalidate_campaign_detail_cache(*campaign_ids: int) -> None:
+    """Drop cached detail fragments of the given campaigns"""
+    cache.delete_many([campaign_detail_cache_key(campaign_id) for campaign_id in campaign_ids])
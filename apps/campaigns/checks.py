@@ -0,0 +1,23 @@
+"""
+System checks for the campaigns app.
+"""
+
+from django.core.checks import Error, Tags, register
+from django.db import connections
+
+from .search_index import missing_search_triggers
+
+
+@register(Tags.database)
+def check_search_triggers(app_configs, databases=None, **kwargs):
+    """campaigns.E001: SQLite search index sync triggers are missing"""
+    errors = []
+    for alias in databases or []:
+        missing = missing_search_triggers(connections[alias])
+        if missing:
+            errors.append(Error(
+                f"Campaign search index triggers are missing on '{alias}': {', '.join(missing)}",
+                hint='Run `python manage.py migrate` to recreate them and rebuild the index.',
+                id='campaigns.E001',
+            ))
+    return errors
@@ -3,12 +3,12 @@ Data Transfer Objects for campaigns app.
 """
 
 from dataclasses import dataclass
-from datetime import date
-from typing import List
+from datetime import date, datetime
+from typing import List, Optional
 from apps.common.dto.base import BaseDTO
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CampaignCreateDTO(BaseDTO):
     """DTO for creating a new campaign"""
     name: str
@@ -19,20 +19,20 @@ class CampaignCreateDTO(BaseDTO):
     mission: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CampaignCloseDTO(BaseDTO):
     """DTO for closing campaign recruitment"""
     campaign_id: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InfluencerSelectionDTO(BaseDTO):
     """DTO for selecting influencers for a campaign"""
     campaign_id: int
     selected_proposal_ids: List[int]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InfluencerSelectionResultDTO(BaseDTO):
     """DTO for influencer selection result"""
     campaign_id: int
@@ -41,9 +41,15 @@ class InfluencerSelectionResultDTO(BaseDTO):
     campaign_status: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProposalDetailDTO(BaseDTO):
-    """DTO for proposal details (for display purposes)"""
+    """
+    DTO for proposal details (for display purposes).
+
+    Field order matches CampaignSelector.PROPOSAL_DETAIL_FIELDS so rows
+    from values_list() map positionally; created_at is formatted in the
+    template (|date), not per row in Python.
+    """
     proposal_id: int
     influencer_name: str
     influencer_email: str
@@ -52,4 +58,46 @@ class ProposalDetailDTO(BaseDTO):
     cover_letter: str
     desired_visit_date: date
     status: str
-    created_at: str
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class CampaignPageDTO(BaseDTO):
+    """DTO for a keyset-paginated page of campaigns"""
+    campaigns: list
+    next_cursor: Optional[str]
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+@dataclass(frozen=True, slots=True)
+class CampaignSearchPageDTO(BaseDTO):
+    """DTO for a page of campaign search hits (ordered by relevance)"""
+    query: str
+    campaigns: list
+    page: int
+    has_next: bool
+
+
+@dataclass(frozen=True, slots=True)
+class ApplicantPageDTO(BaseDTO):
+    """DTO for a page of a campaign's applicants (advertiser detail)"""
+    proposals: List[ProposalDetailDTO]
+    page: int
+    has_next: bool
+    status: Optional[str]
+    search: str
+    sort: str
+
+    @property
+    def has_previous(self) -> bool:
+        return self.page > 1
+
+
+@dataclass(frozen=True, slots=True)
+class ProposalCounterReconcileResultDTO(BaseDTO):
+    """DTO for proposal counter reconciliation result"""
+    checked_count: int
+    repaired_count: int
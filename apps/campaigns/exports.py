@@ -0,0 +1,84 @@
+"""
+Streaming CSV export of campaign applicants.
+
+Rows are written to the response as they are read from the cursor, so the
+header goes out before the query has finished and memory does not grow
+with the number of applicants.
+"""
+
+import csv
+from typing import Iterable, Iterator
+
+from django.conf import settings
+from django.utils import timezone
+
+from .selectors.campaign_selector import CampaignSelector
+
+APPLICANT_EXPORT_HEADER = (
+    '이름', '이메일', '연락처', 'SNS', '각오 한마디', '방문 희망일', '상태', '지원일',
+)
+
+STATUS_LABELS = {
+    'submitted': '신청완료',
+    'selected': '선정',
+    'rejected': '반려',
+}
+
+# 스프레드시트에서 수식으로 해석되는 셀 시작 문자 (CSV injection 방지)
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+# Excel이 UTF-8 CSV의 한글을 깨뜨리지 않도록 BOM을 붙인다
+UTF8_BOM = '\ufeff'
+
+
+class _Echo:
+    """File-like object whose write() returns the value instead of buffering it"""
+
+    def write(self, value):
+        return value
+
+
+def _safe_cell(value) -> str:
+    text = '' if value is None else str(value)
+    if text.startswith(FORMULA_PREFIXES):
+        return "'" + text
+    return text
+
+
+def _format_row(row, tz) -> list:
+    name, email, contact, sns_link, cover_letter, visit_date, status, created_at = row
+    return [
+        _safe_cell(name),
+        _safe_cell(email),
+        _safe_cell(contact),
+        _safe_cell(sns_link),
+        _safe_cell(cover_letter),
+        visit_date.isoformat(),
+        STATUS_LABELS.get(status, status),
+        created_at.astimezone(tz).strftime('%Y-%m-%d %H:%M'),
+    ]
+
+
+def stream_applicants_csv(rows: Iterable[tuple]) -> Iterator[str]:
+    """
+    Yield CSV lines for applicant rows, header first.
+
+    Args:
+        rows: Tuples from CampaignSelector.iter_applicant_export_rows()
+
+    Yields:
+        CSV-encoded lines
+    """
+    writer = csv.writer(_Echo())
+    tz = timezone.get_current_timezone()
+    yield UTF8_BOM + writer.writerow(APPLICANT_EXPORT_HEADER)
+    for row in rows:
+        yield writer.writerow(_format_row(row, tz))
+
+
+def applicant_export_rows(campaign_id: int) -> Iterator[tuple]:
+    """Applicant rows of a campaign, fetched in APPLICANT_EXPORT_CHUNK_SIZE chunks"""
+    return CampaignSelector.iter_applicant_export_rows(
+        campaign_id,
+        chunk_size=settings.APPLICANT_EXPORT_CHUNK_SIZE
+    )
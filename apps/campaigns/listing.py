@@ -0,0 +1,111 @@
+"""
+Maintenance of the home listing read model (CampaignListingCard).
+
+A card holds the fields the home card renders (name, advertiser name,
+dates, recruitment count, benefits excerpt) for each recruiting campaign,
+so the listing reads one narrow table without touching campaigns.benefits
+/ mission or joining users.
+
+Writers:
+- Campaign.save() calls sync_listing_card() (create, close, admin edits)
+- services that change status with QuerySet.update() call
+  remove_listing_cards() (expired auto-close)
+- UserAdmin calls refresh_advertiser_listing_cards() on a name change
+- seed_load_data bulk-inserts cards built with build_listing_card()
+
+Every card write also bumps the listing generation (ListingGeneration)
+in the same transaction; it versions the cached home page
+(apps.campaigns.page_cache). It lives in the database rather than the
+cache, so a bump by any process - including the close_expired_campaigns
+cron - reaches every web worker whatever the cache backend, and it
+commits or rolls back with the cards it versions. The counter starts from
+the current time in nanoseconds, so a recreated row never restarts at a
+value an older cached page was stored under.
+"""
+
+import time
+
+from django.db.models import F
+from django.utils.text import Truncator
+
+from .models import Campaign, CampaignListingCard, ListingGeneration
+
+# 홈 카드에 노출되는 혜택 요약 길이 (단어 수)
+BENEFITS_EXCERPT_WORDS = 15
+
+CARD_UPDATE_FIELDS = [
+    'name',
+    'advertiser_name',
+    'recruitment_start_date',
+    'recruitment_end_date',
+    'recruitment_count',
+    'benefits_excerpt',
+    'created_at',
+]
+
+
+def benefits_excerpt(benefits: str) -> str:
+    """Card excerpt of a campaign's benefits (word-truncated, column-bounded)"""
+    max_length = CampaignListingCard._meta.get_field('benefits_excerpt').max_length
+    excerpt = Truncator(benefits).words(BENEFITS_EXCERPT_WORDS)
+    return Truncator(excerpt).chars(max_length)
+
+
+def build_listing_card(campaign: Campaign, advertiser_name: str = None) -> CampaignListingCard:
+    """Build (not save) the card of a campaign"""
+    return CampaignListingCard(
+        campaign_id=campaign.id,
+        name=campaign.name,
+        advertiser_name=advertiser_name if advertiser_name is not None else campaign.advertiser.name,
+        recruitment_start_date=campaign.recruitment_start_date,
+        recruitment_end_date=campaign.recruitment_end_date,
+        recruitment_count=campaign.recruitment_count,
+        benefits_excerpt=benefits_excerpt(campaign.benefits),
+        created_at=campaign.created_at,
+    )
+
+
+def sync_listing_card(campaign: Campaign) -> None:
+    """Upsert the card of a recruiting campaign, or remove it otherwise (one query)"""
+    if campaign.status != 'recruiting':
+        remove_listing_cards(campaign.id)
+        return
+
+    CampaignListingCard.objects.bulk_create(
+        [build_listing_card(campaign)],
+        update_conflicts=True,
+        unique_fields=['campaign'],
+        update_fields=CARD_UPDATE_FIELDS,
+    )
+    bump_listing_generation()
+
+
+def remove_listing_cards(*campaign_ids: int) -> None:
+    """Drop the cards of campaigns that stopped recruiting"""
+    CampaignListingCard.objects.filter(campaign_id__in=campaign_ids).delete()
+    bump_listing_generation()
+
+
+def refresh_advertiser_listing_cards(advertiser_id: int, advertiser_name: str) -> None:
+    """Copy a changed advertiser name onto the advertiser's cards"""
+    CampaignListingCard.objects.filter(
+        campaign__advertiser_id=advertiser_id
+    ).update(advertiser_name=advertiser_name)
+    bump_listing_generation()
+
+
+def get_listing_generation() -> int:
+    """Current listing generation (one primary-key lookup on the primary)"""
+    value = ListingGeneration.objects.filter(pk=1).values_list('value', flat=True).first()
+    return value if value is not None else 0
+
+
+def bump_listing_generation() -> None:
+    """
+    Make every page cached under the current generation unreachable.
+
+    Call it in the transaction that changes the cards: the row lock orders
+    concurrent bumps and the new value becomes visible with the cards.
+    """
+    if not ListingGeneration.objects.filter(pk=1).update(value=F('value') + 1):
+        ListingGeneration.objects.get_or_create(pk=1, defaults={'value': time.time_ns()})
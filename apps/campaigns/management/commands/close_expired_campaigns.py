@@ -0,0 +1,32 @@
+"""
+Close recruitment for every campaign past its recruitment_end_date.
+
+start.sh runs it on every deploy. The daily run right after midnight
+(TIME_ZONE, Asia/Seoul) is not part of the deploy config and has to be set
+up by hand, see docs/techstack.md. Railway cron schedules are in UTC:
+    5 15 * * *  python manage.py close_expired_campaigns
+
+Usage:
+    python manage.py close_expired_campaigns [--batch-size 500]
+"""
+
+from django.core.management.base import BaseCommand
+from apps.campaigns.services.campaign_management import ExpiredCampaignCloseService
+
+
+class Command(BaseCommand):
+    help = "Move recruiting campaigns past recruitment_end_date to 'recruitment_ended'"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of campaigns updated per statement (default: 500)'
+        )
+
+    def handle(self, *args, **options):
+        closed = ExpiredCampaignCloseService().execute(
+            batch_size=options['batch_size']
+        )
+        self.stdout.write(self.style.SUCCESS(f"Closed {closed} expired campaigns."))
@@ -0,0 +1,30 @@
+"""
+Recount proposals and repair drifted counters on Campaign.
+
+Usage:
+    python manage.py reconcile_proposal_counters [--batch-size 1000]
+"""
+
+from django.core.management.base import BaseCommand
+from apps.campaigns.services.proposal_counters import ProposalCounterReconcileService
+
+
+class Command(BaseCommand):
+    help = 'Repair Campaign proposal counters that drifted from the proposals table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of campaigns checked per batch (default: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        result = ProposalCounterReconcileService().execute(
+            batch_size=options['batch_size']
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Checked {result.checked_count} campaigns, "
+            f"repaired {result.repaired_count}."
+        ))
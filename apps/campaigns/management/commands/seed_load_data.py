@@ -0,0 +1,298 @@
+"""
+Generate load-test data with bulk_create.
+
+Users, profiles and campaigns are built (not saved) with the factory_boy
+factories and inserted with bulk_create in batches; proposals, the
+high-volume table, are inserted with executemany. Every user shares one
+precomputed password hash, so no per-user hashing happens.
+
+One million proposals (20k influencers, 5k campaigns) seed in ~35s on SQLite.
+
+Distributions:
+- campaigns: 60% recruiting, 25% recruitment_ended, 15% selection_complete
+- proposals per campaign: log-normal (a few popular campaigns, a long tail)
+- proposals of selection_complete campaigns are selected up to
+  recruitment_count and rejected otherwise; all others stay submitted
+
+Campaign proposal counters and the home listing cards of recruiting
+campaigns are written together with the campaigns, so no reconcile run
+is needed afterwards.
+
+Usage:
+    python manage.py seed_load_data [--advertisers 100] [--influencers 10000]
+        [--campaigns 2000] [--proposals 100000] [--batch-size 5000]
+        [--password loadtest1234] [--prefix load] [--seed 42]
+"""
+
+import random
+from datetime import date, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.campaigns.factories import CampaignFactory
+from apps.campaigns.listing import build_listing_card, bump_listing_generation
+from apps.campaigns.models import Campaign, CampaignListingCard
+from apps.proposals.models import Proposal
+from apps.users.factories import (
+    AdvertiserFactory,
+    AdvertiserProfileFactory,
+    InfluencerFactory,
+    InfluencerProfileFactory,
+)
+from apps.users.models import AdvertiserProfile, InfluencerProfile, User
+
+CAMPAIGN_STATUS_WEIGHTS = {
+    'recruiting': 60,
+    'recruitment_ended': 25,
+    'selection_complete': 15,
+}
+
+PROPOSAL_INSERT_FIELDS = (
+    'campaign', 'influencer', 'cover_letter', 'desired_visit_date',
+    'status', 'created_at', 'updated_at',
+)
+
+COVER_LETTER = '블로그 방문자 일 평균 500명, 맛집/여행 리뷰를 주로 작성합니다.'
+
+
+class Command(BaseCommand):
+    help = 'Bulk-generate advertisers, influencers, campaigns and proposals for load testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--advertisers', type=int, default=100)
+        parser.add_argument('--influencers', type=int, default=10000)
+        parser.add_argument('--campaigns', type=int, default=2000)
+        parser.add_argument('--proposals', type=int, default=100000)
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Rows per INSERT statement (default: 5000)'
+        )
+        parser.add_argument(
+            '--password',
+            default='loadtest1234',
+            help='Password shared by every generated user'
+        )
+        parser.add_argument(
+            '--prefix',
+            default='load',
+            help='Email/contact prefix of generated users (max 8 characters)'
+        )
+        parser.add_argument('--seed', type=int, default=None, help='Random seed')
+
+    def handle(self, *args, **options):
+        self._validate(options)
+        self.random = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.prefix = options['prefix']
+        self.today = date.today()
+
+        password_hash = make_password(options['password'])
+
+        if connection.vendor == 'sqlite':
+            # 무작위 순서로 들어가는 지원자 인덱스(influencer, created_at)의
+            # 페이지 교체를 줄이기 위해 이 연결의 페이지 캐시를 키운다 (256MB)
+            with connection.cursor() as cursor:
+                cursor.execute('PRAGMA cache_size = -262144')
+
+        with transaction.atomic():
+            advertisers = self._create_users(
+                'a', options['advertisers'], password_hash,
+                AdvertiserFactory, AdvertiserProfileFactory, AdvertiserProfile,
+                lambda i: {'company_name': f'부하 테스트 광고주 {i}'}
+            )
+            influencer_ids = [user.id for user in self._create_users(
+                'i', options['influencers'], password_hash,
+                InfluencerFactory, InfluencerProfileFactory, InfluencerProfile,
+                lambda i: {
+                    'birth_date': date(1970 + i % 35, 1 + i % 12, 1 + i % 28),
+                    'sns_link': f'https://blog.naver.com/{self.prefix}{i}',
+                }
+            )]
+            plan = self._plan_proposals(
+                options['campaigns'], options['proposals'], len(influencer_ids)
+            )
+            campaigns = self._create_campaigns(advertisers, plan)
+            proposal_count = self._create_proposals(campaigns, plan, influencer_ids)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {len(advertisers)} advertisers, {len(influencer_ids)} influencers, "
+            f"{len(campaigns)} campaigns, {proposal_count} proposals."
+        ))
+
+    def _validate(self, options):
+        for name in ('advertisers', 'influencers', 'campaigns', 'proposals'):
+            if options[name] < 0:
+                raise CommandError(f'--{name} must not be negative')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be positive')
+        if options['campaigns'] and not options['advertisers']:
+            raise CommandError('--campaigns requires at least one advertiser')
+        if options['proposals'] > options['campaigns'] * options['influencers']:
+            raise CommandError(
+                '--proposals exceeds campaigns x influencers '
+                '(one proposal per campaign and influencer)'
+            )
+        if not 0 < len(options['prefix']) <= 8:
+            raise CommandError('--prefix must be 1-8 characters')
+        if User.objects.filter(email__startswith=f"{options['prefix']}-").exists():
+            raise CommandError(
+                f"Users with prefix '{options['prefix']}' already exist; use another --prefix"
+            )
+
+    def _create_users(self, kind, count, password_hash, user_factory, profile_factory,
+                      profile_model, profile_fields):
+        """
+        Insert users and their profiles, returning the saved users.
+
+        Faker-backed factory fields are passed explicitly: generating fake
+        names/URLs costs more than the INSERTs themselves at this volume.
+        """
+        created = []
+        for start in range(0, count, self.batch_size):
+            indexes = range(start, min(start + self.batch_size, count))
+            users = [
+                user_factory.build(
+                    email=f'{self.prefix}-{kind}{i}@loadtest.local',
+                    name=f'{self.prefix}-{kind}{i}',
+                    contact=f'{self.prefix}-{kind}{i:08d}',
+                    password=password_hash,
+                )
+                for i in indexes
+            ]
+            User.objects.bulk_create(users)
+            profile_model.objects.bulk_create([
+                profile_factory.build(user=user, **profile_fields(i))
+                for i, user in zip(indexes, users)
+            ])
+            created.extend(users)
+        return created
+
+    def _plan_proposals(self, campaign_count, proposal_count, influencer_count):
+        """
+        Decide status and proposal count per campaign.
+
+        Returns:
+            list of (status, proposal_count) tuples, one per campaign
+        """
+        if not campaign_count:
+            return []
+
+        statuses = self.random.choices(
+            list(CAMPAIGN_STATUS_WEIGHTS),
+            weights=list(CAMPAIGN_STATUS_WEIGHTS.values()),
+            k=campaign_count
+        )
+
+        weights = [self.random.lognormvariate(0, 1) for _ in range(campaign_count)]
+        total_weight = sum(weights)
+        counts = [
+            min(int(proposal_count * weight / total_weight), influencer_count)
+            for weight in weights
+        ]
+
+        # 반올림/상한으로 남은 지원 수를 여유 있는 체험단에 나눠 배정한다
+        remaining = proposal_count - sum(counts)
+        while remaining:
+            for index in range(campaign_count):
+                if not remaining:
+                    break
+                if counts[index] < influencer_count:
+                    counts[index] += 1
+                    remaining -= 1
+
+        return list(zip(statuses, counts))
+
+    def _create_campaigns(self, advertisers, plan):
+        """Insert campaigns with dates and counters consistent with their status"""
+        campaigns = []
+        for index, (status, proposal_count) in enumerate(plan):
+            recruitment_count = self.random.choice((5, 10, 10, 20, 30))
+            if status == 'recruiting':
+                start = self.today - timedelta(days=self.random.randint(0, 10))
+                end = self.today + timedelta(days=self.random.randint(1, 20))
+            else:
+                end = self.today - timedelta(days=self.random.randint(1, 60))
+                start = end - timedelta(days=self.random.randint(7, 21))
+
+            selected = rejected = 0
+            if status == 'selection_complete':
+                selected = min(recruitment_count, proposal_count)
+                rejected = proposal_count - selected
+
+            campaigns.append(CampaignFactory.build(
+                advertiser=self.random.choice(advertisers),
+                name=f'부하 테스트 체험단 {index}',
+                recruitment_start_date=start,
+                recruitment_end_date=end,
+                recruitment_count=recruitment_count,
+                status=status,
+                total_proposals=proposal_count,
+                submitted_proposals=proposal_count - selected - rejected,
+                selected_proposals=selected,
+                rejected_proposals=rejected,
+            ))
+
+        for start in range(0, len(campaigns), self.batch_size):
+            Campaign.objects.bulk_create(campaigns[start:start + self.batch_size])
+
+        # bulk_create는 save()를 거치지 않으므로 홈 목록 카드를 직접 넣는다
+        CampaignListingCard.objects.bulk_create(
+            [build_listing_card(c) for c in campaigns if c.status == 'recruiting'],
+            batch_size=self.batch_size
+        )
+        bump_listing_generation()
+        return campaigns
+
+    def _create_proposals(self, campaigns, plan, influencer_ids):
+        """
+        Insert proposals in batches; each campaign samples distinct influencers.
+
+        Proposals bypass model instantiation and per-value SQL compilation
+        (which dominate bulk_create at this volume) and go through one
+        prepared INSERT with executemany. Values are adapted with the
+        backend's own date/datetime adapters.
+        """
+        meta = Proposal._meta
+        fields = [meta.get_field(name) for name in PROPOSAL_INSERT_FIELDS]
+        quote = connection.ops.quote_name
+        sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            quote(meta.db_table),
+            ', '.join(quote(field.column) for field in fields),
+            ', '.join(['%s'] * len(fields)),
+        )
+        now = connection.ops.adapt_datetimefield_value(timezone.now())
+
+        created = 0
+        batch = []
+        with connection.cursor() as cursor:
+            for campaign, (status, proposal_count) in zip(campaigns, plan):
+                visit_date = connection.ops.adapt_datefield_value(
+                    campaign.recruitment_end_date + timedelta(days=7)
+                )
+                influencers = self.random.sample(influencer_ids, proposal_count)
+                for position, influencer_id in enumerate(influencers):
+                    if status == 'selection_complete':
+                        proposal_status = (
+                            'selected' if position < campaign.selected_proposals else 'rejected'
+                        )
+                    else:
+                        proposal_status = 'submitted'
+
+                    batch.append((
+                        campaign.id, influencer_id, COVER_LETTER, visit_date,
+                        proposal_status, now, now,
+                    ))
+                    if len(batch) >= self.batch_size:
+                        cursor.executemany(sql, batch)
+                        created += len(batch)
+                        batch = []
+
+            if batch:
+                cursor.executemany(sql, batch)
+                created += len(batch)
+        return created
@@ -0,0 +1,118 @@
+"""
+Full-text search index for recruiting campaigns.
+
+- SQLite: FTS5 virtual table (trigram tokenizer) holding recruiting campaigns,
+  kept in sync by triggers on campaigns / users / advertiser_profiles.
+- PostgreSQL: pg_trgm GIN indexes on every searched column.
+"""
+
+from django.db import migrations
+
+INDEX_ROWS_SQL = """
+INSERT INTO campaign_search_index (rowid, name, benefits, mission, advertiser_name, company_name)
+SELECT c.id, c.name, c.benefits, c.mission, u.name, COALESCE(p.company_name, '')
+FROM campaigns c
+JOIN users u ON u.id = c.advertiser_id
+LEFT JOIN advertiser_profiles p ON p.user_id = u.id
+WHERE c.status = 'recruiting' AND {condition};
+"""
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE campaign_search_index USING fts5(
+        name, benefits, mission, advertiser_name, company_name,
+        tokenize = 'trigram'
+    );
+    """,
+    INDEX_ROWS_SQL.format(condition='1 = 1'),
+    """
+    CREATE TRIGGER campaign_search_ai AFTER INSERT ON campaigns BEGIN
+    """ + INDEX_ROWS_SQL.format(condition='c.id = new.id') + """
+    END;
+    """,
+    """
+    CREATE TRIGGER campaign_search_au
+    AFTER UPDATE OF name, benefits, mission, status, advertiser_id ON campaigns BEGIN
+        DELETE FROM campaign_search_index WHERE rowid = old.id;
+    """ + INDEX_ROWS_SQL.format(condition='c.id = new.id') + """
+    END;
+    """,
+    """
+    CREATE TRIGGER campaign_search_ad AFTER DELETE ON campaigns BEGIN
+        DELETE FROM campaign_search_index WHERE rowid = old.id;
+    END;
+    """,
+    """
+    CREATE TRIGGER campaign_search_user_au AFTER UPDATE OF name ON users BEGIN
+        DELETE FROM campaign_search_index
+        WHERE rowid IN (SELECT id FROM campaigns WHERE advertiser_id = new.id);
+    """ + INDEX_ROWS_SQL.format(condition='c.advertiser_id = new.id') + """
+    END;
+    """,
+    """
+    CREATE TRIGGER campaign_search_profile_ai AFTER INSERT ON advertiser_profiles BEGIN
+        DELETE FROM campaign_search_index
+        WHERE rowid IN (SELECT id FROM campaigns WHERE advertiser_id = new.user_id);
+    """ + INDEX_ROWS_SQL.format(condition='c.advertiser_id = new.user_id') + """
+    END;
+    """,
+    """
+    CREATE TRIGGER campaign_search_profile_au
+    AFTER UPDATE OF company_name ON advertiser_profiles BEGIN
+        DELETE FROM campaign_search_index
+        WHERE rowid IN (SELECT id FROM campaigns WHERE advertiser_id = new.user_id);
+    """ + INDEX_ROWS_SQL.format(condition='c.advertiser_id = new.user_id') + """
+    END;
+    """,
+]
+
+SQLITE_REVERSE = [
+    'DROP TRIGGER IF EXISTS campaign_search_profile_au;',
+    'DROP TRIGGER IF EXISTS campaign_search_profile_ai;',
+    'DROP TRIGGER IF EXISTS campaign_search_user_au;',
+    'DROP TRIGGER IF EXISTS campaign_search_ad;',
+    'DROP TRIGGER IF EXISTS campaign_search_au;',
+    'DROP TRIGGER IF EXISTS campaign_search_ai;',
+    'DROP TABLE IF EXISTS campaign_search_index;',
+]
+
+POSTGRESQL_FORWARD = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm;',
+    'CREATE INDEX IF NOT EXISTS campaigns_name_trgm ON campaigns USING gin (name gin_trgm_ops);',
+    'CREATE INDEX IF NOT EXISTS campaigns_benefits_trgm ON campaigns USING gin (benefits gin_trgm_ops);',
+    'CREATE INDEX IF NOT EXISTS campaigns_mission_trgm ON campaigns USING gin (mission gin_trgm_ops);',
+    'CREATE INDEX IF NOT EXISTS users_name_trgm ON users USING gin (name gin_trgm_ops);',
+    'CREATE INDEX IF NOT EXISTS advertiser_profiles_company_name_trgm '
+    'ON advertiser_profiles USING gin (company_name gin_trgm_ops);',
+]
+
+POSTGRESQL_REVERSE = [
+    'DROP INDEX IF EXISTS advertiser_profiles_company_name_trgm;',
+    'DROP INDEX IF EXISTS users_name_trgm;',
+    'DROP INDEX IF EXISTS campaigns_mission_trgm;',
+    'DROP INDEX IF EXISTS campaigns_benefits_trgm;',
+    'DROP INDEX IF EXISTS campaigns_name_trgm;',
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        statements = statements_by_vendor.get(schema_editor.connection.vendor, [])
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0001_initial'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRESQL_FORWARD}),
+            _run({'sqlite': SQLITE_REVERSE, 'postgresql': POSTGRESQL_REVERSE}),
+        ),
+    ]
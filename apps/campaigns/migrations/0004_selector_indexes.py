@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-17 22:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0003_campaign_proposal_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['advertiser', '-created_at'], name='campaigns_advertiser_created'),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(condition=models.Q(('status', 'recruiting')), fields=['-created_at', '-id'], name='campaigns_recruiting_created'),
+        ),
+    ]
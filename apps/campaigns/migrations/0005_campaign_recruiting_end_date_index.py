@@ -0,0 +1,19 @@
+# Generated by Django 5.1.3 on 2026-10-17 22:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0004_selector_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(condition=models.Q(('status', 'recruiting')), fields=['recruitment_end_date'], name='campaigns_recruiting_end_date'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.1.3 on 2026-10-17 23:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+
+def build_listing_cards(apps, schema_editor):
+    """Create cards for campaigns that are recruiting now"""
+    Campaign = apps.get_model('campaigns', 'Campaign')
+    CampaignListingCard = apps.get_model('campaigns', 'CampaignListingCard')
+
+    campaigns = Campaign.objects.filter(status='recruiting').select_related('advertiser')
+    cards = [
+        CampaignListingCard(
+            campaign_id=campaign.id,
+            name=campaign.name,
+            advertiser_name=campaign.advertiser.name,
+            recruitment_start_date=campaign.recruitment_start_date,
+            recruitment_end_date=campaign.recruitment_end_date,
+            recruitment_count=campaign.recruitment_count,
+            benefits_excerpt=Truncator(Truncator(campaign.benefits).words(15)).chars(255),
+            created_at=campaign.created_at,
+        )
+        for campaign in campaigns.iterator(chunk_size=2000)
+    ]
+    CampaignListingCard.objects.bulk_create(cards, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0005_campaign_recruiting_end_date_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CampaignListingCard',
+            fields=[
+                ('campaign', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='listing_card', serialize=False, to='campaigns.campaign')),
+                ('name', models.CharField(max_length=255)),
+                ('advertiser_name', models.CharField(max_length=100)),
+                ('recruitment_start_date', models.DateField()),
+                ('recruitment_end_date', models.DateField()),
+                ('recruitment_count', models.IntegerField()),
+                ('benefits_excerpt', models.CharField(max_length=255)),
+                ('created_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'campaign listing card',
+                'verbose_name_plural': 'campaign listing cards',
+                'db_table': 'campaign_listing_cards',
+                'indexes': [models.Index(fields=['-created_at', '-campaign'], name='listing_cards_created')],
+            },
+        ),
+        migrations.RunPython(build_listing_cards, migrations.RunPython.noop),
+    ]
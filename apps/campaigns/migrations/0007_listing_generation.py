@@ -0,0 +1,32 @@
+# Generated by Django 5.1.3 on 2026-10-18 01:04
+
+import time
+
+from django.db import migrations, models
+
+
+def create_generation(apps, schema_editor):
+    """Start the generation from the current time (above any cache-held value)"""
+    ListingGeneration = apps.get_model('campaigns', 'ListingGeneration')
+    ListingGeneration.objects.create(pk=1, value=time.time_ns())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0006_campaign_listing_cards'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ListingGeneration',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'campaign_listing_generation',
+            },
+        ),
+        migrations.RunPython(create_generation, migrations.RunPython.noop),
+    ]
@@ -6,6 +6,13 @@ from django.db import models
 from django.conf import settings
 
 
+# 홈 목록 카드에 복사되는 Campaign 필드
+LISTING_CARD_SOURCE_FIELDS = frozenset({
+    'advertiser', 'advertiser_id', 'name', 'recruitment_start_date',
+    'recruitment_end_date', 'recruitment_count', 'benefits', 'status',
+})
+
+
 class Campaign(models.Model):
     """Campaign model for experiencer programs"""
 
@@ -33,6 +40,13 @@ class Campaign(models.Model):
         default='recruiting'
     )
 
+    # 지원 현황 카운터 (ProposalCreationService / InfluencerSelectionService가 갱신,
+    # reconcile_proposal_counters 명령으로 실제 값과 동기화)
+    total_proposals = models.PositiveIntegerField(default=0)
+    submitted_proposals = models.PositiveIntegerField(default=0)
+    selected_proposals = models.PositiveIntegerField(default=0)
+    rejected_proposals = models.PositiveIntegerField(default=0)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -41,10 +55,40 @@ class Campaign(models.Model):
         verbose_name = 'campaign'
         verbose_name_plural = 'campaigns'
         ordering = ['-created_at']
+        indexes = [
+            # 광고주별 체험단 목록 (advertiser_id = ? ORDER BY created_at DESC)
+            models.Index(
+                fields=['advertiser', '-created_at'],
+                name='campaigns_advertiser_created'
+            ),
+            # 홈 모집 중 목록 / 키셋 페이지네이션 (status = 'recruiting' ORDER BY created_at DESC, id DESC)
+            models.Index(
+                fields=['-created_at', '-id'],
+                condition=models.Q(status='recruiting'),
+                name='campaigns_recruiting_created'
+            ),
+            # 모집 기간 만료 체험단 자동 마감 (status = 'recruiting' AND recruitment_end_date < ?)
+            models.Index(
+                fields=['recruitment_end_date'],
+                condition=models.Q(status='recruiting'),
+                name='campaigns_recruiting_end_date'
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        # 홈 목록 카드(CampaignListingCard)는 카드 필드가 바뀐 저장에서만 다시 쓴다.
+        # QuerySet.update()/bulk_create()는 save()를 거치지 않으므로 호출한 쪽에서
+        # apps.campaigns.listing 함수로 직접 반영한다.
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or LISTING_CARD_SOURCE_FIELDS.intersection(update_fields):
+            from .listing import sync_listing_card
+            sync_listing_card(self)
+
     def is_recruiting(self):
         """Check if campaign is currently recruiting"""
         return self.status == 'recruiting'
@@ -57,3 +101,72 @@ class Campaign(models.Model):
             self.status == 'recruiting' and
             self.recruitment_start_date <= today <= self.recruitment_end_date
         )
+
+
+class CampaignListingCard(models.Model):
+    """
+    Read model of the home recruiting listing: one row per recruiting
+    campaign holding exactly the fields the home card renders.
+
+    Rows exist only while the campaign is recruiting; they are written by
+    apps.campaigns.listing (Campaign.save(), services using update(),
+    admin, seed_load_data) and never edited directly.
+    """
+
+    campaign = models.OneToOneField(
+        Campaign,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='listing_card'
+    )
+    name = models.CharField(max_length=255)
+    advertiser_name = models.CharField(max_length=100)
+    recruitment_start_date = models.DateField()
+    recruitment_end_date = models.DateField()
+    recruitment_count = models.IntegerField()
+    benefits_excerpt = models.CharField(max_length=255)
+    # 체험단 등록 시각 (키셋 페이지네이션 키)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'campaign_listing_cards'
+        verbose_name = 'campaign listing card'
+        verbose_name_plural = 'campaign listing cards'
+        indexes = [
+            # 홈 목록 / 키셋 페이지네이션 (ORDER BY created_at DESC, campaign_id DESC)
+            models.Index(
+                fields=['-created_at', '-campaign'],
+                name='listing_cards_created'
+            ),
+        ]
+
+    def __str__(self):
+        return self.name
+
+    # 카드는 Campaign 대신 템플릿/자격 확인에 그대로 넘길 수 있도록 같은 이름을 제공한다
+    @property
+    def id(self):
+        return self.campaign_id
+
+    @property
+    def status(self):
+        return 'recruiting'
+
+
+class ListingGeneration(models.Model):
+    """
+    Version of the home listing (single row, pk=1).
+
+    Card writers increment it in the same transaction as the card change
+    (apps.campaigns.listing), so every process - web workers, the
+    close_expired_campaigns cron - sees a change the moment it commits;
+    the cached home page is keyed by it (apps.campaigns.page_cache).
+    """
+
+    value = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'campaign_listing_generation'
+
+    def __str__(self):
+        return str(self.value)
@@ -0,0 +1,139 @@
+"""
+Full-page cache of the home page (first listing page, no search).
+
+The page is rendered once per audience - anonymous, advertiser,
+influencer - since the hero CTA and signup buttons differ only by role.
+Entries (`campaigns:home:<generation>:<audience>`) are keyed by the
+listing generation (apps.campaigns.listing), so any card write (create,
+edit, close, advertiser rename) makes every cached page unreachable;
+leftovers expire after HOME_PAGE_CACHE_TIMEOUT seconds.
+
+Per-user parts are left in the cached shell as hole markers
+(`<!--page-hole:<name>-->`) and rendered on every request:
+- navbar (user name, logout form CSRF token) for logged-in users
+- flash messages
+- eligibility badges of influencer cards (from the cached applied set)
+
+The shell is stored gzip-compressed. An anonymous request without
+pending messages that accepts gzip gets the stored bytes as-is; the
+unfilled messages marker is an HTML comment and renders as nothing.
+"""
+
+import gzip
+import re
+from typing import Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.contrib import messages
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.utils.cache import patch_vary_headers
+
+from apps.common.routers import read_from_primary
+from .listing import get_listing_generation
+from .models import CampaignListingCard
+from .selectors.campaign_selectors import CampaignSelector
+
+# 검색/다음 페이지 요청은 캐시하지 않는다
+LISTING_QUERY_PARAMS = ('q', 'cursor', 'page')
+
+# 대상별로 요청마다 채우는 구멍
+AUDIENCE_HOLES = {
+    'anonymous': ('messages',),
+    'advertiser': ('navbar', 'messages'),
+    'influencer': ('navbar', 'messages', 'badges'),
+}
+
+HOLE_PATTERN = re.compile(r'<!--page-hole:([\w:]+)-->')
+ACCEPTS_GZIP = re.compile(r'\bgzip\b')
+
+
+def home_page_cache_key(generation: int, audience: str) -> str:
+    return f'campaigns:home:{generation}:{audience}'
+
+
+def is_cacheable_home_request(request) -> bool:
+    """Whether the request asks for the plain first listing page"""
+    return (
+        settings.HOME_PAGE_CACHE_ENABLED
+        and request.method in ('GET', 'HEAD')
+        and not any(param in request.GET for param in LISTING_QUERY_PARAMS)
+    )
+
+
+def _audience(user) -> str:
+    if not user.is_authenticated:
+        return 'anonymous'
+    return 'advertiser' if user.role == 'advertiser' else 'influencer'
+
+
+def cached_home_response(request, template_name: str, get_context: Callable[[], Dict]) -> HttpResponse:
+    """
+    Serve the home page from the page cache, rendering and storing it on a miss.
+
+    Args:
+        request: HTTP request (plain first listing page, see is_cacheable_home_request)
+        template_name: Home page template
+        get_context: Builds the full page context; only called on a miss
+
+    Returns:
+        HttpResponse: The page with this user's holes filled
+    """
+    audience = _audience(request.user)
+    holes = AUDIENCE_HOLES[audience]
+    # 렌더링 전에 세대를 읽어, 렌더링 중에 올라간 세대로 낡은 페이지가 저장되지 않게 한다
+    key = home_page_cache_key(get_listing_generation(), audience)
+
+    entry = cache.get(key)
+    eligibility = None
+    if entry is None:
+        # 세대 단위로 캐시되므로 복제 지연이 있는 레플리카가 아닌 primary에서 렌더링한다
+        with read_from_primary():
+            context = get_context()
+        html = render_to_string(template_name, {**context, 'page_cache_holes': holes}, request)
+        # 배지 구멍을 채울 카드 (인플루언서 페이지만)
+        cards = list(context['campaigns']) if 'badges' in holes else []
+        # 렌더링하면서 이미 계산한 이 사용자의 지원 가능 여부는 구멍 채우기에 다시 쓴다
+        eligibility = {campaign.id: result for campaign, result in context['campaign_cards']}
+        entry = (cards, gzip.compress(html.encode(), mtime=0))
+        cache.set(key, entry, settings.HOME_PAGE_CACHE_TIMEOUT)
+    cards, body = entry
+
+    if (
+        audience == 'anonymous'
+        and not len(messages.get_messages(request))
+        and ACCEPTS_GZIP.search(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+    ):
+        response = HttpResponse(body)
+        response['Content-Encoding'] = 'gzip'
+    else:
+        html = gzip.decompress(body).decode()
+        response = HttpResponse(_fill_holes(request, html, cards, eligibility))
+
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
+def _fill_holes(
+    request, html: str, cards: List[CampaignListingCard], eligibility: Optional[Dict] = None
+) -> str:
+    """Render this request's personal fragments into the cached shell"""
+    fragments = {'messages': render_to_string('_messages.html', request=request)}
+    if request.user.is_authenticated:
+        fragments['navbar'] = render_to_string('_navbar.html', request=request)
+
+    if cards:
+        # 배지는 결과 종류(지원 완료/가능/마감)별로 한 번만 렌더링한다
+        rendered = {}
+        if eligibility is None:
+            eligibility = CampaignSelector.check_user_can_apply_bulk(cards, request.user)
+        for campaign_id, result in eligibility.items():
+            shape = (result['already_applied'], result['can_apply'], result['reason'])
+            if shape not in rendered:
+                rendered[shape] = render_to_string(
+                    'campaigns/_eligibility_badge.html', {'eligibility': result}
+                )
+            fragments[f'badge:{campaign_id}'] = rendered[shape]
+
+    return HOLE_PATTERN.sub(lambda match: fragments.get(match.group(1), ''), html)
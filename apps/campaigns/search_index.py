@@ -0,0 +1,120 @@
+"""
+DDL for the SQLite FTS5 campaign search index.
+
+The index table holds recruiting campaigns only and is kept in sync by
+triggers on campaigns / users / advertiser_profiles.
+
+SQLite rebuilds a table (create, copy, drop, rename) for most ALTER
+operations, which silently drops triggers on that table and makes the
+rename fail for triggers on other tables that reference it. Instead of
+every migration touching those tables wrapping its operations, a
+`migrate` run that applies anything drops the triggers first
+(pre_migrate) and recreates them with fresh index rows afterwards
+(post_migrate, see CampaignsConfig.ready). Migration 0002 creates the
+table and triggers; on a fresh database that happens mid-run, so 0003
+drops the triggers itself before rebuilding campaigns. The campaigns.E001 database
+check reports triggers that are still missing, e.g. after a failed
+migration. All helpers are no-ops on other database backends.
+"""
+
+from typing import List
+
+from django.db import connections, transaction
+
+SEARCH_INDEX_TABLE = 'campaign_search_index'
+
+INDEX_ROWS_SQL = """
+INSERT INTO campaign_search_index (rowid, name, benefits, mission, advertiser_name, company_name)
+SELECT c.id, c.name, c.benefits, c.mission, u.name, COALESCE(p.company_name, '')
+FROM campaigns c
+JOIN users u ON u.id = c.advertiser_id
+LEFT JOIN advertiser_profiles p ON p.user_id = u.id
+WHERE c.status = 'recruiting' AND {condition};
+"""
+
+TRIGGERS = {
+    'campaign_search_ai': (
+        "AFTER INSERT ON campaigns BEGIN"
+        + INDEX_ROWS_SQL.format(condition='c.id = new.id')
+        + "END;"
+    ),
+    'campaign_search_au': (
+        "AFTER UPDATE OF name, benefits, mission, status, advertiser_id ON campaigns BEGIN "
+        "DELETE FROM campaign_search_index WHERE rowid = old.id;"
+        + INDEX_ROWS_SQL.format(condition='c.id = new.id')
+        + "END;"
+    ),
+    'campaign_search_ad': (
+        "AFTER DELETE ON campaigns BEGIN "
+        "DELETE FROM campaign_search_index WHERE rowid = old.id; "
+        "END;"
+    ),
+    'campaign_search_user_au': (
+        "AFTER UPDATE OF name ON users BEGIN "
+        "DELETE FROM campaign_search_index "
+        "WHERE rowid IN (SELECT id FROM campaigns WHERE advertiser_id = new.id);"
+        + INDEX_ROWS_SQL.format(condition='c.advertiser_id = new.id')
+        + "END;"
+    ),
+    'campaign_search_profile_ai': (
+        "AFTER INSERT ON advertiser_profiles BEGIN "
+        "DELETE FROM campaign_search_index "
+        "WHERE rowid IN (SELECT id FROM campaigns WHERE advertiser_id = new.user_id);"
+        + INDEX_ROWS_SQL.format(condition='c.advertiser_id = new.user_id')
+        + "END;"
+    ),
+    'campaign_search_profile_au': (
+        "AFTER UPDATE OF company_name ON advertiser_profiles BEGIN "
+        "DELETE FROM campaign_search_index "
+        "WHERE rowid IN (SELECT id FROM campaigns WHERE advertiser_id = new.user_id);"
+        + INDEX_ROWS_SQL.format(condition='c.advertiser_id = new.user_id')
+        + "END;"
+    ),
+}
+
+
+def _create_triggers_statements() -> List[str]:
+    return [
+        *(f'CREATE TRIGGER IF NOT EXISTS {name} {body}' for name, body in TRIGGERS.items()),
+        f'DELETE FROM {SEARCH_INDEX_TABLE};',
+        INDEX_ROWS_SQL.format(condition='1 = 1'),
+    ]
+
+
+def _drop_triggers_statements() -> List[str]:
+    return [f'DROP TRIGGER IF EXISTS {name};' for name in reversed(list(TRIGGERS))]
+
+
+def missing_search_triggers(connection) -> List[str]:
+    """Names of sync triggers absent from a SQLite database that has the index table"""
+    if connection.vendor != 'sqlite':
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT type, name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+        existing = {(kind, name) for kind, name in cursor.fetchall()}
+    if ('table', SEARCH_INDEX_TABLE) not in existing:
+        return []
+    return [name for name in TRIGGERS if ('trigger', name) not in existing]
+
+
+def drop_search_triggers_before_migrate(sender, using, plan=None, **kwargs):
+    """pre_migrate: keep triggers out of table rebuilds of the migrations about to run"""
+    connection = connections[using]
+    if connection.vendor != 'sqlite' or not plan:
+        return
+    _execute(using, _drop_triggers_statements())
+
+
+def restore_search_triggers_after_migrate(sender, using, **kwargs):
+    """post_migrate: recreate missing triggers and rebuild the index rows"""
+    connection = connections[using]
+    if not missing_search_triggers(connection):
+        return
+    _execute(using, _create_triggers_statements())
+
+
+def _execute(using: str, statements: List[str]) -> None:
+    # 시그널은 스키마 편집기 밖(테스트에서는 트랜잭션 안)에서도 불리므로 커서로 실행한다
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
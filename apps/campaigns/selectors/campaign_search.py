@@ -0,0 +1,152 @@
+"""
+Backend-specific full-text search over recruiting campaigns.
+
+- SQLite: FTS5 virtual table `campaign_search_index` (trigram tokenizer),
+  maintained by triggers created in migration 0002.
+- PostgreSQL: the matching campaign IDs are a UNION of one lookup per
+  table - campaigns (name/benefits/mission), users (name) and
+  advertiser_profiles (company_name) - so each ILIKE is served by that
+  table's pg_trgm GIN index (an OR across joined tables is not, and
+  degrades to a joined sequential scan). Only the matches are joined and
+  ranked by trigram word similarity.
+- Other backends: plain icontains filters ordered by newest first.
+
+Queries shorter than three characters (e.g. two-syllable Korean words)
+cannot use a trigram index on any backend. They only scan the recruiting
+listing cards (CampaignListingCard: name, advertiser name, benefits
+excerpt) - one narrow table without joins, holding only recruiting
+campaigns - newest first; mission and company name are not searched.
+"""
+
+from typing import List
+from django.db import connections, router
+from django.db.models import Q
+from apps.campaigns.models import Campaign, CampaignListingCard
+from apps.campaigns.search_index import SEARCH_INDEX_TABLE
+
+# trigram 인덱스(FTS5 trigram, pg_trgm)는 3글자 미만 검색어를 처리할 수 없다
+TRIGRAM_MIN_LENGTH = 3
+
+# bm25 가중치: name, benefits, mission, advertiser_name, company_name
+BM25_WEIGHTS = (10.0, 2.0, 1.0, 5.0, 5.0)
+
+SEARCH_FIELDS = (
+    'name',
+    'benefits',
+    'mission',
+    'advertiser__name',
+    'advertiser__advertiser_profile__company_name',
+)
+
+# 테이블별 검색 필드 (PostgreSQL에서 테이블마다 따로 인덱스로 찾아 UNION한다)
+CAMPAIGN_SEARCH_FIELDS = ('name', 'benefits', 'mission')
+ADVERTISER_SEARCH_FIELDS = ('advertiser__name', 'advertiser__advertiser_profile__company_name')
+
+# 짧은 검색어가 훑는 홈 목록 카드 필드
+LISTING_CARD_SEARCH_FIELDS = ('name', 'advertiser_name', 'benefits_excerpt')
+
+
+def normalize_search_query(query: str) -> str:
+    """연속된 공백을 하나로 합치고 앞뒤 공백을 제거한다"""
+    return ' '.join(query.split())
+
+
+def search_recruiting_campaign_ids(query: str, limit: int, offset: int) -> List[int]:
+    """
+    검색어를 부분 문자열로 포함하는 모집 중 체험단 ID를 관련도 순으로 반환한다.
+
+    Args:
+        query: 정규화된 검색어
+        limit: 최대 반환 개수
+        offset: 건너뛸 개수
+
+    Returns:
+        관련도 순으로 정렬된 Campaign ID 목록
+    """
+    # ORM 조회와 같은 DB(레플리카 라우팅 포함)에서 검색한다
+    connection = connections[router.db_for_read(Campaign)]
+
+    if len(query) < TRIGRAM_MIN_LENGTH:
+        return _search_listing_cards(query, limit, offset)
+
+    if connection.vendor == 'sqlite':
+        return _search_sqlite_fts(connection, query, limit, offset)
+
+    if connection.vendor == 'postgresql':
+        return _search_postgresql_trigram(query, limit, offset)
+
+    return _search_fallback(query, limit, offset)
+
+
+def _query_filter(query: str, fields=SEARCH_FIELDS) -> Q:
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f'{field}__icontains': query})
+    return condition
+
+
+def matching_campaign_ids(query: str):
+    """
+    IDs of campaigns matching the query, as a UNION of per-table lookups.
+
+    The campaigns arm ORs columns of one table (a BitmapOr of its trigram
+    indexes); each advertiser arm finds users/profiles through their own
+    index and reaches campaigns through the advertiser foreign key index.
+    """
+    lookups = Campaign.objects.filter(
+        _query_filter(query, CAMPAIGN_SEARCH_FIELDS)
+    ).order_by().values('id')
+    for field in ADVERTISER_SEARCH_FIELDS:
+        lookups = lookups.union(
+            Campaign.objects.filter(**{f'{field}__icontains': query}).order_by().values('id')
+        )
+    return lookups
+
+
+def _search_sqlite_fts(connection, query: str, limit: int, offset: int) -> List[int]:
+    # 검색어 전체를 phrase로 감싸 FTS5 문법 문자를 이스케이프한다
+    match = '"{}"'.format(query.replace('"', '""'))
+    weights = ', '.join(str(weight) for weight in BM25_WEIGHTS)
+    sql = (
+        f'SELECT c.id FROM {SEARCH_INDEX_TABLE} s '
+        f'JOIN campaigns c ON c.id = s.rowid '
+        f'WHERE {SEARCH_INDEX_TABLE} MATCH %s AND c.status = %s '
+        f'ORDER BY bm25({SEARCH_INDEX_TABLE}, {weights}), c.created_at DESC, c.id DESC '
+        f'LIMIT %s OFFSET %s'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [match, 'recruiting', limit, offset])
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _search_postgresql_trigram(query: str, limit: int, offset: int) -> List[int]:
+    from django.contrib.postgres.search import TrigramWordSimilarity
+
+    rank = (
+        TrigramWordSimilarity(query, 'name') * 2 +
+        TrigramWordSimilarity(query, 'advertiser__name') +
+        TrigramWordSimilarity(query, 'advertiser__advertiser_profile__company_name')
+    )
+    queryset = Campaign.objects.filter(
+        id__in=matching_campaign_ids(query),
+        status='recruiting'
+    ).annotate(rank=rank).order_by('-rank', '-created_at', '-id')
+
+    return list(queryset.values_list('id', flat=True)[offset:offset + limit])
+
+
+def _search_listing_cards(query: str, limit: int, offset: int) -> List[int]:
+    queryset = CampaignListingCard.objects.filter(
+        _query_filter(query, LISTING_CARD_SEARCH_FIELDS)
+    ).order_by('-created_at', '-campaign_id')
+
+    return list(queryset.values_list('campaign_id', flat=True)[offset:offset + limit])
+
+
+def _search_fallback(query: str, limit: int, offset: int) -> List[int]:
+    queryset = Campaign.objects.filter(
+        _query_filter(query),
+        status='recruiting'
+    ).order_by('-created_at', '-id')
+
+    return list(queryset.values_list('id', flat=True)[offset:offset + limit])
@@ -2,12 +2,41 @@
 Selector layer for campaign queries.
 """
 
-from typing import List, Optional
-from django.db.models import QuerySet, Count, Q
+from itertools import starmap
+from typing import Iterator, List, Optional, Tuple
+from django.db.models import QuerySet, F
 from apps.campaigns.models import Campaign
 from apps.proposals.models import Proposal
 from apps.common.selectors.base import BaseSelector
-from apps.campaigns.dto import ProposalDetailDTO
+from apps.campaigns.dto import ApplicantPageDTO, ProposalDetailDTO
+
+APPLICANTS_PAGE_SIZE = 20
+
+# 지원자 목록 페이지 번호 상한 (OFFSET이 DB 정수 범위를 넘지 않게)
+MAX_APPLICANTS_PAGE = 10000
+
+# 지원자 목록 정렬 키 -> ORDER BY (id는 같은 값 사이의 페이지 경계를 고정한다)
+APPLICANT_SORTS = {
+    'newest': ('-created_at', '-id'),
+    'oldest': ('created_at', 'id'),
+    'visit_date': ('desired_visit_date', 'id'),
+    'visit_date_desc': ('-desired_visit_date', '-id'),
+}
+
+APPLICANT_STATUSES = ('submitted', 'selected', 'rejected')
+
+# values_list() 열 순서 = ProposalDetailDTO 필드 순서 (행 tuple을 그대로 DTO로 변환)
+PROPOSAL_DETAIL_FIELDS = (
+    'id',
+    'influencer__name',
+    'influencer__email',
+    'influencer__contact',
+    'influencer__influencer_profile__sns_link',
+    'cover_letter',
+    'desired_visit_date',
+    'status',
+    'created_at',
+)
 
 
 class CampaignSelector(BaseSelector):
@@ -30,7 +59,7 @@ class CampaignSelector(BaseSelector):
         """
         특정 광고주가 등록한 모든 체험단을 조회합니다.
 
-        - 지원자 수(proposal_count)를 함께 조회
+        - 지원자 수(proposal_count)를 함께 조회 (저장된 카운터 사용, JOIN/GROUP BY 없음)
         - 최신순 정렬
         - N+1 쿼리 방지
 
@@ -43,7 +72,7 @@ class CampaignSelector(BaseSelector):
         return Campaign.objects.filter(
             advertiser_id=advertiser_id
         ).select_related('advertiser').annotate(
-            proposal_count=Count('proposals')
+            proposal_count=F('total_proposals')
         ).order_by('-created_at')
 
     @staticmethod
@@ -70,28 +99,18 @@ class CampaignSelector(BaseSelector):
         """
         Fetch campaign with proposal counts for advertiser detail view.
 
+        Counts come from the denormalized counter columns on Campaign
+        (total/submitted/selected/rejected_proposals), so no aggregate
+        over the proposals table is needed.
+
         Args:
             campaign_id: Campaign ID
             advertiser_id: Advertiser ID (for ownership verification)
 
         Returns:
-            Campaign object with proposal counts annotated, or None
-        """
-        return Campaign.objects.annotate(
-            total_proposals=Count('proposals'),
-            submitted_proposals=Count(
-                'proposals',
-                filter=Q(proposals__status='submitted')
-            ),
-            selected_proposals=Count(
-                'proposals',
-                filter=Q(proposals__status='selected')
-            ),
-            rejected_proposals=Count(
-                'proposals',
-                filter=Q(proposals__status='rejected')
-            )
-        ).select_related('advertiser').filter(
+            Campaign object with proposal counts, or None
+        """
+        return Campaign.objects.select_related('advertiser').filter(
             id=campaign_id,
             advertiser_id=advertiser_id
         ).first()
@@ -109,24 +128,126 @@ class CampaignSelector(BaseSelector):
         Returns:
             List of ProposalDetailDTO
         """
-        proposals = Proposal.objects.filter(
+        return list(CampaignSelector.iter_proposals_by_campaign(campaign_id))
+
+    @staticmethod
+    def iter_proposals_by_campaign(
+        campaign_id: int,
+        chunk_size: int = 2000
+    ) -> Iterator[ProposalDetailDTO]:
+        """
+        Lazily yield a campaign's proposals as DTOs, newest first.
+
+        DTOs are built straight from values_list() tuples (no model
+        instances) and rows are fetched chunk_size at a time, so memory
+        is bounded by the chunk rather than the number of proposals.
+
+        Args:
+            campaign_id: Campaign ID
+            chunk_size: Rows fetched from the cursor at a time
+
+        Returns:
+            Iterator of ProposalDetailDTO
+        """
+        rows = Proposal.objects.filter(
             campaign_id=campaign_id
-        ).select_related(
-            'influencer',
-            'influencer__influencer_profile'
-        ).order_by('-created_at')
+        ).order_by('-created_at', '-id').values_list(
+            *PROPOSAL_DETAIL_FIELDS
+        ).iterator(chunk_size=chunk_size)
+        return starmap(ProposalDetailDTO, rows)
 
-        return [
-            ProposalDetailDTO(
-                proposal_id=p.id,
-                influencer_name=p.influencer.name,
-                influencer_email=p.influencer.email,
-                influencer_contact=p.influencer.contact,
-                sns_link=p.influencer.influencer_profile.sns_link,
-                cover_letter=p.cover_letter,
-                desired_visit_date=p.desired_visit_date,
-                status=p.status,
-                created_at=p.created_at.strftime('%Y-%m-%d %H:%M')
-            )
-            for p in proposals
-        ]
+    @staticmethod
+    def get_applicants_page(
+        campaign_id: int,
+        status: Optional[str] = None,
+        search: str = '',
+        sort: str = 'newest',
+        page: int = 1,
+        page_size: int = APPLICANTS_PAGE_SIZE
+    ) -> ApplicantPageDTO:
+        """
+        Fetch one page of a campaign's applicants for the advertiser table.
+
+        Filtering and ordering run on the (campaign[, status], created_at /
+        desired_visit_date) indexes, so only the requested page is read
+        and converted to DTOs. Name search is a substring match applied
+        while walking that index.
+
+        Args:
+            campaign_id: Campaign ID
+            status: Proposal status filter (None for all)
+            search: Influencer name substring
+            sort: Key of APPLICANT_SORTS
+            page: 1-based page number (clamped to 1..MAX_APPLICANTS_PAGE)
+            page_size: Applicants per page
+
+        Returns:
+            ApplicantPageDTO
+
+        Raises:
+            ValueError: If status or sort is not supported
+        """
+        if status is not None and status not in APPLICANT_STATUSES:
+            raise ValueError(f"Unsupported applicant status: {status}")
+        if sort not in APPLICANT_SORTS:
+            raise ValueError(f"Unsupported applicant sort: {sort}")
+        page = min(max(page, 1), MAX_APPLICANTS_PAGE)
+        search = search.strip()
+
+        proposals = Proposal.objects.filter(campaign_id=campaign_id)
+        if status:
+            proposals = proposals.filter(status=status)
+        if search:
+            proposals = proposals.filter(influencer__name__icontains=search)
+
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        offset = (page - 1) * page_size
+        rows = list(proposals.order_by(*APPLICANT_SORTS[sort]).values_list(
+            *PROPOSAL_DETAIL_FIELDS
+        )[offset:offset + page_size + 1])
+
+        return ApplicantPageDTO(
+            proposals=list(starmap(ProposalDetailDTO, rows[:page_size])),
+            page=page,
+            has_next=len(rows) > page_size and page < MAX_APPLICANTS_PAGE,
+            status=status,
+            search=search,
+            sort=sort
+        )
+
+    # 내보내기 열 순서 (apps.campaigns.exports.APPLICANT_EXPORT_HEADER와 일치)
+    APPLICANT_EXPORT_FIELDS = (
+        'influencer__name',
+        'influencer__email',
+        'influencer__contact',
+        'influencer__influencer_profile__sns_link',
+        'cover_letter',
+        'desired_visit_date',
+        'status',
+        'created_at',
+    )
+
+    @staticmethod
+    def iter_applicant_export_rows(
+        campaign_id: int,
+        chunk_size: int = 2000
+    ) -> Iterator[Tuple]:
+        """
+        Stream a campaign's applicants as plain tuples for export.
+
+        Rows come from values_list() through a server-side iterator, so
+        neither model instances nor the full result list are built:
+        memory stays bounded by chunk_size regardless of applicant count.
+
+        Args:
+            campaign_id: Campaign ID
+            chunk_size: Rows fetched from the cursor at a time
+
+        Returns:
+            Iterator of tuples in APPLICANT_EXPORT_FIELDS order, newest first
+        """
+        return Proposal.objects.filter(
+            campaign_id=campaign_id
+        ).order_by('-created_at').values_list(
+            *CampaignSelector.APPLICANT_EXPORT_FIELDS
+        ).iterator(chunk_size=chunk_size)
@@ -2,13 +2,62 @@
 Campaign selectors for complex query logic.
 """
 
-from datetime import date
-from typing import Dict, Any, Optional
-from django.db.models import QuerySet
-from apps.campaigns.models import Campaign
+import base64
+from array import array
+from datetime import date, datetime, timezone
+from typing import Dict, Any, Iterable, Optional, Tuple
+from django.db.models import F, QuerySet, Q
+from apps.campaigns.models import Campaign, CampaignListingCard
+from apps.campaigns.dto import CampaignPageDTO, CampaignSearchPageDTO
+from apps.campaigns.selectors.campaign_search import (
+    normalize_search_query,
+    search_recruiting_campaign_ids,
+)
+from apps.common.exceptions import ValidationException
+from apps.common.selectors.base import BaseSelector
 
+# 홈 화면 체험단 목록 한 페이지당 카드 수
+RECRUITING_CAMPAIGNS_PAGE_SIZE = 12
 
-class CampaignSelector:
+# 검색 결과 페이지 번호 상한 (OFFSET이 DB 정수 범위를 넘지 않게)
+MAX_SEARCH_PAGE = 1000
+
+# 커서의 id 상한 (BigAutoField, 64비트 정수)
+MAX_CAMPAIGN_ID = 2**63 - 1
+
+
+def encode_campaign_cursor(campaign) -> str:
+    """
+    (created_at, id) 키를 URL에 안전한 불투명 커서 문자열로 인코딩한다.
+
+    Args:
+        campaign: Campaign 또는 CampaignListingCard
+    """
+    raw = f"{campaign.created_at.isoformat()}|{campaign.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_campaign_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 문자열을 (created_at, id) 튜플로 디코딩한다.
+
+    Raises:
+        ValidationException: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created_at, campaign_id = raw.rsplit('|', 1)
+        created_at, campaign_id = datetime.fromisoformat(created_at), int(campaign_id)
+        # 조작된 커서의 범위 밖 값은 쿼리에서 OverflowError가 되므로 여기서 거른다
+        if created_at.tzinfo is None or not 0 < campaign_id <= MAX_CAMPAIGN_ID:
+            raise ValueError(raw)
+        return created_at.astimezone(timezone.utc), campaign_id
+    except (ValueError, UnicodeDecodeError, OverflowError) as e:
+        raise ValidationException("잘못된 페이지 커서입니다.") from e
+
+
+class CampaignSelector(BaseSelector):
     """Selector for campaign queries and business rule validation"""
 
     @staticmethod
@@ -35,6 +84,93 @@ class CampaignSelector:
             status='recruiting'
         ).select_related('advertiser').order_by('-created_at')
 
+    @staticmethod
+    def get_recruiting_campaigns_page(
+        cursor: Optional[str] = None,
+        page_size: int = RECRUITING_CAMPAIGNS_PAGE_SIZE
+    ) -> CampaignPageDTO:
+        """
+        모집 중인 체험단 카드를 (created_at, id) 키셋 기준으로 한 페이지만 조회한다.
+
+        OFFSET 대신 직전 페이지 마지막 행의 키 이후만 조회하므로
+        전체 체험단 수와 무관하게 페이지 비용이 일정하다.
+        홈 목록 읽기 모델(CampaignListingCard)만 읽으므로 campaigns의
+        benefits/mission 본문이나 users 조인이 없다.
+
+        Args:
+            cursor: 이전 페이지의 next_cursor (None이면 첫 페이지)
+            page_size: 한 페이지에 포함할 체험단 수
+
+        Returns:
+            CampaignPageDTO: 현재 페이지 체험단 카드 목록과 다음 페이지 커서
+
+        Raises:
+            ValidationException: 커서 형식이 올바르지 않은 경우
+        """
+        queryset = CampaignListingCard.objects.order_by('-created_at', '-campaign_id')
+
+        if cursor:
+            created_at, campaign_id = decode_campaign_cursor(cursor)
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) |
+                Q(created_at=created_at, campaign_id__lt=campaign_id)
+            )
+
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        campaigns = list(queryset[:page_size + 1])
+        next_cursor = None
+        if len(campaigns) > page_size:
+            campaigns = campaigns[:page_size]
+            next_cursor = encode_campaign_cursor(campaigns[-1])
+
+        return CampaignPageDTO(campaigns=campaigns, next_cursor=next_cursor)
+
+    @staticmethod
+    def search_recruiting_campaigns(
+        query: str,
+        page: int = 1,
+        page_size: int = RECRUITING_CAMPAIGNS_PAGE_SIZE
+    ) -> CampaignSearchPageDTO:
+        """
+        모집 중인 체험단을 체험단명/혜택/미션/광고주명/업체명으로 검색한다.
+
+        SQLite에서는 FTS5, PostgreSQL에서는 pg_trgm 인덱스를 사용하며
+        결과는 관련도 순으로 정렬된다. 결과 행은 홈 목록 카드(CampaignListingCard)다.
+        3글자 미만 검색어는 인덱스를 쓸 수 없으므로 홈 목록 카드의 체험단명/광고주명/
+        혜택 요약만 최신순으로 검색한다 (apps.campaigns.selectors.campaign_search).
+
+        Args:
+            query: 검색어 (부분 문자열 일치)
+            page: 1부터 시작하는 페이지 번호 (1..MAX_SEARCH_PAGE로 제한)
+            page_size: 한 페이지에 포함할 체험단 수
+
+        Returns:
+            CampaignSearchPageDTO: 현재 페이지 검색 결과
+        """
+        page = min(max(page, 1), MAX_SEARCH_PAGE)
+        query = normalize_search_query(query)
+        if not query:
+            return CampaignSearchPageDTO(query=query, campaigns=[], page=page, has_next=False)
+
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        ids = search_recruiting_campaign_ids(
+            query,
+            limit=page_size + 1,
+            offset=(page - 1) * page_size
+        )
+        has_next = len(ids) > page_size and page < MAX_SEARCH_PAGE
+        ids = ids[:page_size]
+
+        cards_by_id = CampaignListingCard.objects.in_bulk(ids)
+        campaigns = [cards_by_id[pk] for pk in ids if pk in cards_by_id]
+
+        return CampaignSearchPageDTO(
+            query=query,
+            campaigns=campaigns,
+            page=page,
+            has_next=has_next
+        )
+
     @staticmethod
     def get_campaign_detail(campaign_id: int) -> Campaign:
         """
@@ -54,6 +190,34 @@ class CampaignSelector:
             'advertiser__advertiser_profile'
         ).get(id=campaign_id)
 
+    @staticmethod
+    def get_campaign_summary(campaign_id: int) -> Campaign:
+        """
+        Retrieve only the campaign columns needed for eligibility checks and
+        the detail page cache key.
+
+        Args:
+            campaign_id: Campaign ID to retrieve
+
+        Returns:
+            Campaign object with id, name, status, recruitment dates and
+            updated_at loaded (other fields deferred), annotated with
+            `advertiser_profile_updated_at` (None without a profile)
+
+        Raises:
+            Campaign.DoesNotExist: If campaign with given ID doesn't exist
+        """
+        return Campaign.objects.only(
+            'id',
+            'name',
+            'status',
+            'recruitment_start_date',
+            'recruitment_end_date',
+            'updated_at'
+        ).annotate(
+            advertiser_profile_updated_at=F('advertiser__advertiser_profile__updated_at')
+        ).get(id=campaign_id)
+
     @staticmethod
     def check_user_can_apply(campaign: Campaign, user) -> Dict[str, Any]:
         """
@@ -76,56 +240,83 @@ class CampaignSelector:
                 - reason (str|None): Reason if cannot apply
                 - already_applied (bool): Whether user has already applied
         """
+        return CampaignSelector.check_user_can_apply_bulk([campaign], user)[campaign.id]
+
+    @staticmethod
+    def check_user_can_apply_bulk(
+        campaigns: Iterable[Campaign],
+        user
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Check application eligibility for many campaigns at once.
+
+        Applies the same rules as check_user_can_apply, but looks up the
+        user's applied campaign IDs once, from the per-influencer cache
+        (apps.proposals.cache; one query on a miss, none for anonymous
+        users and advertisers).
+
+        Args:
+            campaigns: Campaigns to check (list or evaluated queryset)
+            user: User object (can be AnonymousUser)
+
+        Returns:
+            Dictionary keyed by campaign ID; each value has the same shape
+            as check_user_can_apply's result
+        """
+        campaigns = list(campaigns)
+
         # Check 1: User must be authenticated
         if not user.is_authenticated:
             return {
-                'can_apply': False,
-                'reason': 'login_required',
-                'already_applied': False
+                campaign.id: _eligibility(False, 'login_required')
+                for campaign in campaigns
             }
 
         # Check 2: User must be an influencer
         if user.role == 'advertiser':
             return {
-                'can_apply': False,
-                'reason': 'advertiser_not_allowed',
-                'already_applied': False
+                campaign.id: _eligibility(False, 'advertiser_not_allowed')
+                for campaign in campaigns
             }
 
-        # Check 3: Campaign must be in recruiting status
-        if campaign.status != 'recruiting':
-            return {
-                'can_apply': False,
-                'reason': 'recruitment_ended',
-                'already_applied': False
-            }
-
-        # Check 4: Current date must be within recruitment period
+        result = {}
+        candidate_ids = []
         today = date.today()
-        if today > campaign.recruitment_end_date:
-            return {
-                'can_apply': False,
-                'reason': 'deadline_passed',
-                'already_applied': False
-            }
+        for campaign in campaigns:
+            # Check 3: Campaign must be in recruiting status
+            if campaign.status != 'recruiting':
+                result[campaign.id] = _eligibility(False, 'recruitment_ended')
+            # Check 4: Current date must be within recruitment period
+            elif today > campaign.recruitment_end_date:
+                result[campaign.id] = _eligibility(False, 'deadline_passed')
+            else:
+                candidate_ids.append(campaign.id)
 
         # Check 5: User must not have already applied
-        from apps.proposals.models import Proposal
-        already_applied = Proposal.objects.filter(
-            campaign_id=campaign.id,
-            influencer_id=user.id
-        ).exists()
+        # (cached applied set; one query for all candidates on a cache miss)
+        applied_ids = array('q')
+        if candidate_ids:
+            from apps.proposals.cache import contains, get_applied_campaign_ids
+            applied_ids = get_applied_campaign_ids(user.id)
+
+        for campaign_id in candidate_ids:
+            if contains(applied_ids, campaign_id):
+                result[campaign_id] = _eligibility(False, 'already_applied', already_applied=True)
+            else:
+                # All checks passed
+                result[campaign_id] = _eligibility(True, None)
+
+        return result
 
-        if already_applied:
-            return {
-                'can_apply': False,
-                'reason': 'already_applied',
-                'already_applied': True
-            }
 
-        # All checks passed
-        return {
-            'can_apply': True,
-            'reason': None,
-            'already_applied': False
-        }
+def _eligibility(
+    can_apply: bool,
+    reason: Optional[str],
+    already_applied: bool = False
+) -> Dict[str, Any]:
+    """check_user_can_apply 결과 딕셔너리를 만든다"""
+    return {
+        'can_apply': can_apply,
+        'reason': reason,
+        'already_applied': already_applied
+    }
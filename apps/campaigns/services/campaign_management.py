@@ -2,9 +2,13 @@
 Campaign management services for closing recruitment and selecting influencers.
 """
 
+from datetime import date
+from typing import Optional
 from django.db import transaction
 from django.utils import timezone
 from ..models import Campaign
+from ..cache import invalidate_campaign_detail_cache
+from ..listing import remove_listing_cards
 from ..dto import CampaignCloseDTO
 from apps.common.exceptions import (
     PermissionDeniedException,
@@ -54,5 +58,54 @@ class CampaignCloseService:
         campaign.status = 'recruitment_ended'
         campaign.updated_at = timezone.now()
         campaign.save(update_fields=['status', 'updated_at'])
+        invalidate_campaign_detail_cache(campaign.id)
 
         return campaign
+
+
+class ExpiredCampaignCloseService:
+    """Service for closing every campaign whose recruitment period has ended"""
+
+    def execute(self, today: Optional[date] = None, batch_size: int = 500) -> int:
+        """
+        Transition expired recruiting campaigns to 'recruitment_ended'.
+
+        Runs one set-based UPDATE per batch of campaign IDs, all stamped
+        with the same updated_at. Intended to run from a scheduler
+        (see the close_expired_campaigns management command).
+
+        Args:
+            today: Reference date (defaults to today in TIME_ZONE)
+            batch_size: Maximum number of campaigns updated per statement
+
+        Returns:
+            Number of campaigns closed
+        """
+        today = today or timezone.localdate()
+        now = timezone.now()
+        closed = 0
+
+        while True:
+            with transaction.atomic():
+                campaign_ids = list(
+                    Campaign.objects.filter(
+                        status='recruiting',
+                        recruitment_end_date__lt=today
+                    ).order_by('recruitment_end_date', 'id').values_list(
+                        'id', flat=True
+                    )[:batch_size]
+                )
+                if not campaign_ids:
+                    break
+
+                closed += Campaign.objects.filter(
+                    id__in=campaign_ids,
+                    status='recruiting'
+                ).update(
+                    status='recruitment_ended',
+                    updated_at=now
+                )
+                remove_listing_cards(*campaign_ids)
+                invalidate_campaign_detail_cache(*campaign_ids)
+
+        return closed
@@ -3,8 +3,10 @@ Influencer selection service for campaigns.
 """
 
 from django.db import transaction
+from django.db.models import Case, F, Value, When
 from django.utils import timezone
 from ..models import Campaign
+from ..cache import invalidate_campaign_detail_cache
 from apps.proposals.models import Proposal
 from ..dto import InfluencerSelectionDTO, InfluencerSelectionResultDTO
 from apps.common.exceptions import (
@@ -85,32 +87,39 @@ class InfluencerSelectionService:
                 "선택한 지원자 중 유효하지 않은 항목이 있습니다."
             )
 
-        # 6. Select proposals
-        selected = Proposal.objects.filter(
-            id__in=dto.selected_proposal_ids,
-            campaign=campaign
-        ).update(
-            status='selected',
-            updated_at=timezone.now()
-        )
-
-        # 7. Reject unselected proposals
-        rejected = Proposal.objects.filter(
+        # 6. Select and reject in one statement with a single timestamp:
+        # every submitted proposal becomes selected (listed) or rejected.
+        # The campaign row lock keeps the submitted set stable, so the
+        # selected count equals the validated count above.
+        now = timezone.now()
+        processed = Proposal.objects.filter(
             campaign=campaign,
             status='submitted'
-        ).exclude(
-            id__in=dto.selected_proposal_ids
         ).update(
-            status='rejected',
-            updated_at=timezone.now()
+            status=Case(
+                When(id__in=dto.selected_proposal_ids, then=Value('selected')),
+                default=Value('rejected'),
+            ),
+            updated_at=now
         )
+        selected = valid_proposals
+        rejected = processed - selected
 
-        # 8. Update campaign status
+        # 7. Update campaign status and proposal counters
+        # (queryset update keeps updated_at equal to the proposals' timestamp;
+        # save() would re-stamp the auto_now field)
         campaign.status = 'selection_complete'
-        campaign.updated_at = timezone.now()
-        campaign.save(update_fields=['status', 'updated_at'])
+        Campaign.objects.filter(id=campaign.id).update(
+            status=campaign.status,
+            submitted_proposals=0,
+            selected_proposals=F('selected_proposals') + selected,
+            rejected_proposals=F('rejected_proposals') + rejected,
+            updated_at=now
+        )
+        # 홈 목록 카드는 모집 마감(recruitment_ended) 시 이미 제거되어 갱신할 것이 없다
+        invalidate_campaign_detail_cache(campaign.id)
 
-        # 9. Return result DTO
+        # 8. Return result DTO
         return InfluencerSelectionResultDTO(
             campaign_id=campaign.id,
             selected_count=selected,
@@ -0,0 +1,87 @@
+"""
+Reconciliation service for denormalized proposal counters on Campaign.
+"""
+
+from collections import defaultdict
+from django.db import transaction
+from django.db.models import Count
+from ..models import Campaign
+from ..dto import ProposalCounterReconcileResultDTO
+from apps.proposals.models import Proposal
+
+COUNTER_FIELDS = (
+    'total_proposals',
+    'submitted_proposals',
+    'selected_proposals',
+    'rejected_proposals',
+)
+
+
+class ProposalCounterReconcileService:
+    """Service for repairing drift between stored counters and proposals"""
+
+    def execute(self, batch_size: int = 1000) -> ProposalCounterReconcileResultDTO:
+        """
+        Recount proposals per campaign and fix drifted counters.
+
+        Campaigns are walked in id order, one batch at a time: a single
+        GROUP BY query per batch and one bulk UPDATE for drifted rows.
+
+        Args:
+            batch_size: Number of campaigns per batch
+
+        Returns:
+            ProposalCounterReconcileResultDTO: Checked/repaired campaign counts
+        """
+        checked = 0
+        repaired = 0
+        last_id = 0
+
+        while True:
+            with transaction.atomic():
+                campaigns = list(
+                    Campaign.objects.select_for_update().filter(
+                        id__gt=last_id
+                    ).order_by('id').only('id', *COUNTER_FIELDS)[:batch_size]
+                )
+                if not campaigns:
+                    break
+
+                actual = self._count_proposals([c.id for c in campaigns])
+                drifted = []
+                for campaign in campaigns:
+                    counts = actual[campaign.id]
+                    expected = {
+                        'total_proposals': sum(counts.values()),
+                        'submitted_proposals': counts['submitted'],
+                        'selected_proposals': counts['selected'],
+                        'rejected_proposals': counts['rejected'],
+                    }
+                    if any(getattr(campaign, f) != v for f, v in expected.items()):
+                        for field, value in expected.items():
+                            setattr(campaign, field, value)
+                        drifted.append(campaign)
+
+                if drifted:
+                    Campaign.objects.bulk_update(drifted, COUNTER_FIELDS)
+
+            checked += len(campaigns)
+            repaired += len(drifted)
+            last_id = campaigns[-1].id
+
+        return ProposalCounterReconcileResultDTO(
+            checked_count=checked,
+            repaired_count=repaired
+        )
+
+    @staticmethod
+    def _count_proposals(campaign_ids):
+        """Return {campaign_id: {status: count}} for the given campaigns"""
+        counts = defaultdict(lambda: defaultdict(int))
+        rows = Proposal.objects.filter(
+            campaign_id__in=campaign_ids
+        ).order_by().values('campaign_id', 'status').annotate(count=Count('id'))
+
+        for row in rows:
+            counts[row['campaign_id']][row['status']] = row['count']
+        return counts
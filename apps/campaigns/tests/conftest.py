@@ -127,4 +127,11 @@ def ended_campaign_with_proposals(advertiser_user, influencer_users):
             status='submitted'
         )
 
+    # Proposals were created directly, so sync the stored counters
+    Campaign.objects.filter(id=campaign.id).update(
+        total_proposals=10,
+        submitted_proposals=10
+    )
+    campaign.refresh_from_db()
+
     return campaign
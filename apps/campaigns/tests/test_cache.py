@@ -0,0 +1,150 @@
+"""
+Tests for the campaign detail fragment cache
+"""
+
+import pytest
+from datetime import date, timedelta
+from django.urls import reverse
+from apps.campaigns.cache import campaign_detail_cache_key
+from apps.campaigns.dto import CampaignCloseDTO, InfluencerSelectionDTO
+from apps.campaigns.models import Campaign
+from apps.campaigns.services.campaign_management import (
+    CampaignCloseService,
+    ExpiredCampaignCloseService
+)
+from apps.campaigns.services.influencer_selection import InfluencerSelectionService
+from apps.users.models import AdvertiserProfile
+from django.core.cache import cache
+
+
+@pytest.mark.django_db
+class TestCampaignDetailFragmentCache:
+    """Tests for the cached campaign detail fragment"""
+
+    def test_fragment_is_served_from_cache(
+        self, client, campaign_factory, django_assert_num_queries
+    ):
+        """두 번째 비로그인 조회는 체험단 요약 쿼리 1개만 실행한다"""
+        campaign = campaign_factory(name='캐시 체험단')
+        url = reverse('campaigns:detail', kwargs={'pk': campaign.id})
+        client.get(url)
+
+        with django_assert_num_queries(1):
+            response = client.get(url)
+
+        assert '캐시 체험단' in response.content.decode('utf-8')
+        assert 'Test Company' in response.content.decode('utf-8')
+
+    def test_updated_campaign_is_rerendered(self, client, campaign_factory):
+        """updated_at이 바뀌면 이전 fragment를 사용하지 않는다"""
+        campaign = campaign_factory(benefits='이전 혜택')
+        url = reverse('campaigns:detail', kwargs={'pk': campaign.id})
+        client.get(url)
+
+        campaign.benefits = '새 혜택'
+        campaign.save()
+        html = client.get(url).content.decode('utf-8')
+
+        assert '새 혜택' in html
+        assert '이전 혜택' not in html
+
+    def test_company_name_change_is_rerendered(self, client, campaign_factory):
+        """광고주 업체명이 바뀌면 캐시 삭제 없이도(다른 프로세스의 수정) 다시 렌더링한다"""
+        campaign = campaign_factory()
+        url = reverse('campaigns:detail', kwargs={'pk': campaign.id})
+        client.get(url)
+
+        profile = AdvertiserProfile.objects.get(user_id=campaign.advertiser_id)
+        profile.company_name = '바뀐 업체명'
+        profile.save()
+        html = client.get(url).content.decode('utf-8')
+
+        assert '바뀐 업체명' in html
+        assert 'Test Company' not in html
+
+    def test_close_service_invalidates_fragment(
+        self, client, campaign_factory, advertiser_user
+    ):
+        """모집 마감 시 캐시 항목을 삭제한다"""
+        campaign = campaign_factory(status='recruiting')
+        client.get(reverse('campaigns:detail', kwargs={'pk': campaign.id}))
+        assert cache.get(campaign_detail_cache_key(campaign.id)) is not None
+
+        CampaignCloseService().execute(
+            user=advertiser_user,
+            dto=CampaignCloseDTO(campaign_id=campaign.id)
+        )
+
+        assert cache.get(campaign_detail_cache_key(campaign.id)) is None
+        html = client.get(
+            reverse('campaigns:detail', kwargs={'pk': campaign.id})
+        ).content.decode('utf-8')
+        assert '모집 마감' in html
+
+    def test_expired_close_service_invalidates_fragment(self, client, campaign_factory):
+        """기간 만료 일괄 마감 시 캐시 항목을 삭제한다"""
+        campaign = campaign_factory(
+            recruitment_start_date=date.today() - timedelta(days=10),
+            recruitment_end_date=date.today() - timedelta(days=1)
+        )
+        client.get(reverse('campaigns:detail', kwargs={'pk': campaign.id}))
+
+        ExpiredCampaignCloseService().execute()
+
+        assert cache.get(campaign_detail_cache_key(campaign.id)) is None
+
+    def test_selection_service_invalidates_fragment(
+        self, client, ended_campaign_with_proposals, advertiser_user
+    ):
+        """체험단 선정 완료 시 캐시 항목을 삭제한다"""
+        campaign = ended_campaign_with_proposals
+        client.get(reverse('campaigns:detail', kwargs={'pk': campaign.id}))
+        proposal_id = campaign.proposals.values_list('id', flat=True)[0]
+
+        InfluencerSelectionService().execute(
+            user=advertiser_user,
+            dto=InfluencerSelectionDTO(
+                campaign_id=campaign.id,
+                selected_proposal_ids=[proposal_id]
+            )
+        )
+
+        assert cache.get(campaign_detail_cache_key(campaign.id)) is None
+        html = client.get(
+            reverse('campaigns:detail', kwargs={'pk': campaign.id})
+        ).content.decode('utf-8')
+        assert '선정 완료' in html
+
+    def test_admin_edit_invalidates_fragment(
+        self, client, campaign_factory, django_user_model
+    ):
+        """관리자 화면에서 수정하면 캐시 항목을 삭제한다"""
+        campaign = campaign_factory()
+        client.get(reverse('campaigns:detail', kwargs={'pk': campaign.id}))
+        admin_user = django_user_model.objects.create_superuser(
+            email='admin@test.com', password='adminpass123',
+            name='Admin', contact='010-0000-0000'
+        )
+        AdvertiserProfile.objects.get_or_create(
+            user=admin_user,
+            defaults={'company_name': 'Admin', 'business_registration_number': '000-00-00000'}
+        )
+        client.force_login(admin_user)
+
+        response = client.post(
+            reverse('admin:campaigns_campaign_change', args=[campaign.id]),
+            {
+                'advertiser': campaign.advertiser_id,
+                'name': '관리자 수정',
+                'recruitment_start_date': campaign.recruitment_start_date.isoformat(),
+                'recruitment_end_date': campaign.recruitment_end_date.isoformat(),
+                'recruitment_count': campaign.recruitment_count,
+                'benefits': campaign.benefits,
+                'mission': campaign.mission,
+                'status': campaign.status,
+            }
+        )
+
+        assert response.status_code == 302
+        assert Campaign.objects.get(id=campaign.id).name == '관리자 수정'
+        assert cache.get(campaign_detail_cache_key(campaign.id)) is None
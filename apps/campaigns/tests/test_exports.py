@@ -0,0 +1,122 @@
+"""
+Tests for the streaming applicant CSV export
+"""
+
+import csv
+import io
+import types
+import pytest
+from django.urls import reverse
+from apps.campaigns.exports import APPLICANT_EXPORT_HEADER, UTF8_BOM
+from apps.campaigns.selectors.campaign_selector import CampaignSelector
+from apps.users.models import User
+
+
+def read_csv(response):
+    body = b''.join(response.streaming_content).decode('utf-8')
+    assert body.startswith(UTF8_BOM)
+    return list(csv.reader(io.StringIO(body[len(UTF8_BOM):])))
+
+
+@pytest.mark.django_db
+class TestApplicantExportView:
+    """Tests for AdvertiserApplicantExportView"""
+
+    def test_streams_applicants_as_csv(
+        self, client, advertiser_user, campaign_factory,
+        influencer_bulk_factory, proposal_bulk_factory
+    ):
+        """지원자 목록을 CSV로 스트리밍한다"""
+        campaign = campaign_factory()
+        influencers = influencer_bulk_factory(3)
+        proposal_bulk_factory([(campaign, influencer) for influencer in influencers])
+        client.force_login(advertiser_user)
+
+        response = client.get(reverse('campaigns:export_applicants', kwargs={'pk': campaign.id}))
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert response['Content-Type'] == 'text/csv; charset=utf-8'
+        assert f'campaign-{campaign.id}-applicants.csv' in response['Content-Disposition']
+        rows = read_csv(response)
+        assert tuple(rows[0]) == APPLICANT_EXPORT_HEADER
+        assert len(rows) == 4
+        assert {row[1] for row in rows[1:]} == {user.email for user in influencers}
+        assert {row[6] for row in rows[1:]} == {'신청완료'}
+
+    def test_formula_cells_are_escaped(
+        self, client, advertiser_user, campaign_factory,
+        influencer_bulk_factory, proposal_bulk_factory
+    ):
+        """수식으로 해석될 수 있는 셀은 작은따옴표로 시작한다"""
+        campaign = campaign_factory()
+        influencer = influencer_bulk_factory(1)[0]
+        proposal_bulk_factory([(campaign, influencer)], cover_letter='=HYPERLINK("x")')
+        client.force_login(advertiser_user)
+
+        rows = read_csv(client.get(
+            reverse('campaigns:export_applicants', kwargs={'pk': campaign.id})
+        ))
+
+        assert rows[1][4] == '\'=HYPERLINK("x")'
+
+    def test_other_advertiser_gets_404(self, client, campaign_factory):
+        """다른 광고주의 체험단은 내보낼 수 없다"""
+        campaign = campaign_factory()
+        other = User.objects.create_user(
+            email='other@test.com', password='testpass123', name='Other',
+            contact='010-0000-0000', role='advertiser'
+        )
+        client.force_login(other)
+
+        response = client.get(reverse('campaigns:export_applicants', kwargs={'pk': campaign.id}))
+
+        assert response.status_code == 404
+
+    def test_influencer_is_forbidden(self, client, influencer_user, campaign_factory):
+        """인플루언서는 접근할 수 없다"""
+        campaign = campaign_factory()
+        client.force_login(influencer_user)
+
+        response = client.get(reverse('campaigns:export_applicants', kwargs={'pk': campaign.id}))
+
+        assert response.status_code == 403
+
+    def test_export_runs_two_queries(
+        self, client, advertiser_user, campaign_factory,
+        influencer_bulk_factory, proposal_bulk_factory, django_assert_num_queries
+    ):
+        """세션/사용자 외에 소유권 확인 1개 + 지원자 조회 1개 (지원자 수와 무관)"""
+        campaign = campaign_factory()
+        influencers = influencer_bulk_factory(30)
+        proposal_bulk_factory([(campaign, influencer) for influencer in influencers])
+        client.force_login(advertiser_user)
+        url = reverse('campaigns:export_applicants', kwargs={'pk': campaign.id})
+
+        with django_assert_num_queries(4):  # 세션 + 사용자 + 체험단 + 지원자
+            response = client.get(url)
+            rows = read_csv(response)
+
+        assert len(rows) == 31
+
+
+@pytest.mark.django_db
+class TestIterApplicantExportRows:
+    """Tests for CampaignSelector.iter_applicant_export_rows"""
+
+    def test_returns_lazy_tuple_iterator(
+        self, campaign_factory, influencer_bulk_factory, proposal_bulk_factory
+    ):
+        """리스트가 아닌 tuple 제너레이터를 돌려준다"""
+        campaign = campaign_factory()
+        influencer = influencer_bulk_factory(1)[0]
+        proposal_bulk_factory([(campaign, influencer)])
+
+        rows = CampaignSelector.iter_applicant_export_rows(campaign.id, chunk_size=10)
+
+        assert isinstance(rows, types.GeneratorType)
+        row = next(rows)
+        assert row[:4] == (
+            influencer.name, influencer.email, influencer.contact,
+            f'https://blog.naver.com/bulk{influencer.id}'
+        )
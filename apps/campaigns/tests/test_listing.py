@@ -0,0 +1,105 @@
+"""
+Tests for the home listing read model (CampaignListingCard)
+"""
+
+import pytest
+from datetime import date, timedelta
+from django.contrib.admin.sites import AdminSite
+from django.test import RequestFactory
+from apps.campaigns.dto import CampaignCloseDTO
+from apps.campaigns.listing import BENEFITS_EXCERPT_WORDS
+from apps.campaigns.models import Campaign, CampaignListingCard
+from apps.campaigns.services.campaign_management import (
+    CampaignCloseService,
+    ExpiredCampaignCloseService
+)
+from apps.users.admin import UserAdmin
+from apps.users.models import User
+
+
+@pytest.mark.django_db
+class TestCampaignListingCard:
+    """Cards follow the campaign's recruiting state"""
+
+    def test_recruiting_campaign_gets_card(self, campaign_factory, advertiser_user):
+        """모집 중 체험단을 저장하면 카드 필드만 복사된 카드가 생긴다"""
+        benefits = ' '.join(f'혜택{i}' for i in range(30))
+        campaign = campaign_factory(name='카드 체험단', benefits=benefits, recruitment_count=7)
+
+        card = CampaignListingCard.objects.get(pk=campaign.pk)
+
+        assert card.name == '카드 체험단'
+        assert card.advertiser_name == advertiser_user.name
+        assert card.recruitment_count == 7
+        assert card.recruitment_end_date == campaign.recruitment_end_date
+        assert card.created_at == campaign.created_at
+        assert card.benefits_excerpt.startswith('혜택0 혜택1')
+        assert len(card.benefits_excerpt.split()) == BENEFITS_EXCERPT_WORDS
+
+    def test_edit_updates_card(self, campaign_factory):
+        """카드 필드를 수정하면 카드도 갱신된다"""
+        campaign = campaign_factory(name='이전 이름')
+
+        campaign.name = '새 이름'
+        campaign.save()
+
+        assert CampaignListingCard.objects.get(pk=campaign.pk).name == '새 이름'
+
+    def test_non_recruiting_campaign_has_no_card(self, campaign_factory):
+        """모집 중이 아닌 체험단은 카드가 없다"""
+        campaign = campaign_factory(status='recruitment_ended')
+
+        assert not CampaignListingCard.objects.filter(pk=campaign.pk).exists()
+
+    def test_counter_only_save_skips_card_write(self, campaign_factory, django_assert_num_queries):
+        """카드와 무관한 필드만 저장하면 카드 쿼리가 없다"""
+        campaign = campaign_factory()
+        campaign.total_proposals = 3
+
+        with django_assert_num_queries(1):
+            campaign.save(update_fields=['total_proposals'])
+
+    def test_close_service_removes_card(self, campaign_factory, advertiser_user):
+        """모집 마감 시 카드가 제거된다"""
+        campaign = campaign_factory()
+
+        CampaignCloseService().execute(
+            user=advertiser_user, dto=CampaignCloseDTO(campaign_id=campaign.id)
+        )
+
+        assert not CampaignListingCard.objects.filter(pk=campaign.pk).exists()
+
+    def test_expired_close_removes_cards(self, campaign_factory):
+        """기간 만료 자동 마감도 카드를 제거한다"""
+        today = date.today()
+        expired = campaign_factory(
+            recruitment_start_date=today - timedelta(days=10),
+            recruitment_end_date=today - timedelta(days=1)
+        )
+        active = campaign_factory()
+
+        ExpiredCampaignCloseService().execute(today=today)
+
+        assert list(CampaignListingCard.objects.values_list('pk', flat=True)) == [active.pk]
+        assert Campaign.objects.get(pk=expired.pk).status == 'recruitment_ended'
+
+    def test_deleting_campaign_deletes_card(self, campaign_factory):
+        """체험단을 삭제하면 카드도 삭제된다"""
+        campaign = campaign_factory()
+
+        campaign.delete()
+
+        assert not CampaignListingCard.objects.exists()
+
+    def test_admin_advertiser_rename_refreshes_cards(self, campaign_factory, advertiser_user):
+        """관리자에서 광고주 이름을 바꾸면 카드의 광고주명도 바뀐다"""
+        campaign = campaign_factory()
+        admin = UserAdmin(User, AdminSite())
+        request = RequestFactory().post('/')
+        request.user = advertiser_user
+        advertiser_user.name = '새 광고주명'
+        form = type('Form', (), {'changed_data': ['name']})()
+
+        admin.save_model(request, advertiser_user, form, change=True)
+
+        assert CampaignListingCard.objects.get(pk=campaign.pk).advertiser_name == '새 광고주명'
@@ -0,0 +1,181 @@
+"""
+Tests for the home page full-page cache (apps.campaigns.page_cache)
+"""
+
+import gzip
+import io
+import pytest
+from datetime import date, timedelta
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from apps.campaigns.dto import CampaignCloseDTO
+from apps.campaigns.listing import bump_listing_generation, get_listing_generation
+from apps.campaigns.models import Campaign, ListingGeneration
+from apps.campaigns.services.campaign_management import CampaignCloseService
+from apps.proposals.models import Proposal
+from apps.users.models import User
+
+
+def home(client, **extra):
+    return client.get(reverse('campaigns:home'), **extra)
+
+
+@pytest.mark.django_db
+class TestListingGeneration:
+    """Tests for the listing generation counter"""
+
+    def test_bump_increments_generation(self):
+        """세대를 올리면 값이 커진다"""
+        generation = get_listing_generation()
+
+        bump_listing_generation()
+
+        assert get_listing_generation() == generation + 1
+
+    def test_lost_row_restarts_above_previous_values(self):
+        """세대 행이 사라져도 이전 세대보다 큰 값으로 다시 시작한다"""
+        generation = get_listing_generation()
+        ListingGeneration.objects.all().delete()
+
+        bump_listing_generation()
+
+        assert get_listing_generation() > generation
+
+    def test_card_write_bumps_in_its_transaction(self, campaign_factory):
+        """카드가 바뀌면 같은 트랜잭션에서 세대가 올라간다"""
+        generation = get_listing_generation()
+
+        campaign_factory()
+
+        assert get_listing_generation() > generation
+
+
+@pytest.mark.django_db
+class TestHomePageCache:
+    """Tests for the cached home page"""
+
+    def test_anonymous_hit_reads_only_generation(self, client, campaign_factory, django_assert_num_queries):
+        """익명 사용자의 두 번째 요청은 세대 조회 1개 쿼리만으로 캐시에서 응답한다"""
+        campaign_factory(name='캐시 체험단')
+        first = home(client)
+
+        with django_assert_num_queries(1):
+            second = home(client)
+
+        assert second.content == first.content
+        assert '캐시 체험단' in second.content.decode()
+        assert 'Accept-Encoding' in second['Vary']
+
+    def test_anonymous_gzip_client_gets_stored_bytes(self, client, campaign_factory):
+        """gzip을 받는 익명 요청에는 압축된 본문을 그대로 보낸다"""
+        campaign_factory(name='압축 체험단')
+
+        response = home(client, HTTP_ACCEPT_ENCODING='gzip, deflate')
+
+        assert response['Content-Encoding'] == 'gzip'
+        assert '압축 체험단' in gzip.decompress(response.content).decode()
+
+    def test_new_campaign_invalidates_page(self, client, campaign_factory, django_capture_on_commit_callbacks):
+        """체험단 등록 시 세대가 올라가 새 목록이 보인다"""
+        campaign_factory(name='첫 체험단')
+        home(client)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            campaign_factory(name='새 체험단')
+
+        assert '새 체험단' in home(client).content.decode()
+
+    def test_closed_campaign_leaves_page(
+        self, client, campaign_factory, advertiser_user, django_capture_on_commit_callbacks
+    ):
+        """모집 마감 시 캐시된 목록에서도 빠진다"""
+        campaign = campaign_factory(name='마감될 체험단')
+        assert '마감될 체험단' in home(client).content.decode()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            CampaignCloseService().execute(
+                user=advertiser_user, dto=CampaignCloseDTO(campaign_id=campaign.id)
+            )
+
+        assert '마감될 체험단' not in home(client).content.decode()
+
+    def test_cron_close_in_another_process_leaves_page(self, client, campaign_factory):
+        """다른 프로세스(크론)의 자동 마감도 이 프로세스의 캐시된 목록에 반영된다"""
+        campaign = campaign_factory(name='만료된 체험단')
+        assert '만료된 체험단' in home(client).content.decode()
+        Campaign.objects.filter(id=campaign.id).update(
+            recruitment_end_date=date.today() - timedelta(days=1)
+        )
+
+        # 크론 프로세스는 자신의 캐시만 본다 (별도 LocMem 저장소)
+        with override_settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'close-expired-campaigns',
+        }}):
+            call_command('close_expired_campaigns', stdout=io.StringIO())
+
+        assert '만료된 체험단' not in home(client).content.decode()
+
+    def test_influencers_share_page_with_own_badges_and_navbar(self, client, campaign_factory, influencer_user):
+        """인플루언서끼리 캐시된 페이지를 공유하되 배지와 내비게이션은 각자 것이다"""
+        campaign = campaign_factory()
+        other = User.objects.create_user(
+            email='other@test.com', password='testpass123', name='다른 인플루언서',
+            contact='010-0000-0000', role='influencer'
+        )
+        Proposal.objects.create(
+            campaign=campaign, influencer=influencer_user,
+            cover_letter='지원합니다', desired_visit_date=campaign.recruitment_end_date
+        )
+
+        client.force_login(influencer_user)
+        applied_html = home(client).content.decode()
+        client.force_login(other)
+        other_html = home(client).content.decode()
+
+        assert '지원 완료' in applied_html and 'Test Influencer님' in applied_html
+        assert '지원 가능' in other_html and '다른 인플루언서님' in other_html
+        assert 'Test Influencer' not in other_html
+        assert 'page-hole' not in other_html
+        assert other_html.count('name="csrfmiddlewaretoken"') == 1
+
+    def test_advertiser_page_has_role_cta(self, client, campaign_factory, advertiser_user):
+        """광고주 페이지는 광고주용 CTA로 캐시된다"""
+        campaign_factory()
+        home(client)
+        client.force_login(advertiser_user)
+
+        html = home(client).content.decode()
+
+        assert '체험단 관리하기' in html
+        assert '무료 회원가입' not in html
+        assert 'Test Advertiser님' in html
+
+    def test_pending_message_is_shown_on_cached_page(self, client, influencer_user):
+        """대기 중인 메시지는 캐시된 페이지에도 한 번 표시된다"""
+        home(client)
+        client.force_login(influencer_user)
+
+        response = client.post(reverse('users:logout'), follow=True, HTTP_ACCEPT_ENCODING='gzip')
+
+        assert not response.has_header('Content-Encoding')
+        assert '로그아웃되었습니다.' in response.content.decode()
+        assert '로그아웃되었습니다.' not in home(client).content.decode()
+
+    def test_search_bypasses_cache(self, client, campaign_factory):
+        """검색 요청은 캐시를 거치지 않는다"""
+        campaign_factory(name='검색 체험단')
+        home(client)
+
+        response = client.get(reverse('campaigns:home'), {'q': '검색'})
+
+        assert response.context['query'] == '검색'
+
+    def test_disabled_cache_renders_every_time(self, client, campaign_factory, settings):
+        """설정으로 끄면 매 요청을 렌더링한다"""
+        settings.HOME_PAGE_CACHE_ENABLED = False
+        campaign_factory()
+        home(client)
+
+        assert home(client).context is not None
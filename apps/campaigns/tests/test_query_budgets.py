@@ -0,0 +1,105 @@
+"""
+Query budget tests for campaign views.
+
+Each budget holds for every data size; a query count that grows with the
+number of campaigns/proposals (N+1) fails.
+"""
+
+import pytest
+from django.urls import reverse
+
+DATA_SIZES = [1, 10, 100]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('size', DATA_SIZES)
+class TestCampaignViewQueryBudgets:
+    """Query budgets for campaign views"""
+
+    def test_home_view_anonymous(self, size, client, campaign_factory, assert_max_queries):
+        """홈: 목록 세대 + 모집 중 체험단 페이지 1개 (광고주 JOIN 포함)"""
+        for i in range(size):
+            campaign_factory(name=f'Campaign {i}')
+
+        with assert_max_queries(2):
+            response = client.get(reverse('campaigns:home'))
+
+        assert response.status_code == 200
+
+    def test_home_view_authenticated(
+        self, size, client, campaign_factory, influencer_user, proposal_bulk_factory,
+        assert_max_queries
+    ):
+        """홈 (로그인): 세션 + 사용자 + 목록 세대 + 체험단 페이지 + 카드별 지원 여부 일괄 조회"""
+        campaigns = [campaign_factory(name=f'Campaign {i}') for i in range(size)]
+        proposal_bulk_factory((campaign, influencer_user) for campaign in campaigns[::2])
+        client.force_login(influencer_user)
+
+        with assert_max_queries(5):
+            response = client.get(reverse('campaigns:home'))
+
+        assert response.status_code == 200
+
+    def test_campaign_detail_view_anonymous(
+        self, size, client, campaign_factory, influencer_bulk_factory,
+        proposal_bulk_factory, assert_max_queries
+    ):
+        """상세 (비로그인): 캐시 미스 시 요약 + 상세(광고주/프로필 JOIN), 캐시 적중 시 요약만"""
+        campaign = campaign_factory()
+        proposal_bulk_factory((campaign, i) for i in influencer_bulk_factory(size))
+        url = reverse('campaigns:detail', kwargs={'pk': campaign.id})
+
+        with assert_max_queries(2):
+            response = client.get(url)
+        assert response.status_code == 200
+
+        with assert_max_queries(1):
+            response = client.get(url)
+        assert response.status_code == 200
+
+    def test_campaign_detail_view_influencer(
+        self, size, client, campaign_factory, influencer_user, influencer_bulk_factory,
+        proposal_bulk_factory, assert_max_queries
+    ):
+        """상세 (인플루언서, 캐시 적중): 세션 + 사용자 + 체험단 요약 + 지원 여부 확인"""
+        campaign = campaign_factory()
+        proposal_bulk_factory((campaign, i) for i in influencer_bulk_factory(size))
+        url = reverse('campaigns:detail', kwargs={'pk': campaign.id})
+        client.get(url)
+        client.force_login(influencer_user)
+
+        with assert_max_queries(4):
+            response = client.get(url)
+
+        assert response.status_code == 200
+
+    def test_advertiser_campaign_detail_view(
+        self, size, client, campaign_factory, advertiser_user, influencer_bulk_factory,
+        proposal_bulk_factory, assert_max_queries
+    ):
+        """광고주 상세: 세션 + 사용자 + 체험단 + 지원자 목록"""
+        campaign = campaign_factory()
+        proposal_bulk_factory((campaign, i) for i in influencer_bulk_factory(size))
+        client.force_login(advertiser_user)
+
+        with assert_max_queries(4):
+            response = client.get(
+                reverse('campaigns:advertiser_detail', kwargs={'pk': campaign.id})
+            )
+
+        assert response.status_code == 200
+
+    def test_campaign_management_view(
+        self, size, client, campaign_factory, advertiser_user, influencer_bulk_factory,
+        proposal_bulk_factory, assert_max_queries
+    ):
+        """체험단 관리: 세션 + 사용자 + 체험단 목록"""
+        campaigns = [campaign_factory(name=f'Campaign {i}') for i in range(size)]
+        influencer = influencer_bulk_factory(1)[0]
+        proposal_bulk_factory((campaign, influencer) for campaign in campaigns)
+        client.force_login(advertiser_user)
+
+        with assert_max_queries(3):
+            response = client.get(reverse('campaigns:manage'))
+
+        assert response.status_code == 200
@@ -0,0 +1,121 @@
+"""
+Query plan tests: every campaign selector access path must be index-backed.
+"""
+
+import pytest
+from datetime import date, timedelta
+from apps.campaigns.selectors.campaign_selector import CampaignSelector
+from apps.campaigns.selectors.campaign_selectors import CampaignSelector as PublicCampaignSelector
+from apps.proposals.models import Proposal
+
+
+@pytest.fixture
+def campaign_with_proposal(recruiting_campaign, influencer_users):
+    """Recruiting campaign with one submitted proposal"""
+    Proposal.objects.create(
+        campaign=recruiting_campaign,
+        influencer=influencer_users[0],
+        cover_letter='Cover letter',
+        desired_visit_date=date.today() + timedelta(days=1)
+    )
+    return recruiting_campaign
+
+
+@pytest.mark.django_db
+class TestCampaignSelectorQueryPlans:
+    """Advertiser-side selectors (campaign_selector.py)"""
+
+    def test_get_recruiting_campaigns(self, campaign_with_proposal, assert_no_full_table_scan):
+        assert_no_full_table_scan(CampaignSelector.get_recruiting_campaigns)
+
+    def test_get_campaigns_by_advertiser(self, campaign_with_proposal, assert_no_full_table_scan):
+        assert_no_full_table_scan(
+            CampaignSelector.get_campaigns_by_advertiser,
+            campaign_with_proposal.advertiser_id
+        )
+
+    def test_get_campaign_detail(self, campaign_with_proposal, assert_no_full_table_scan):
+        assert_no_full_table_scan(CampaignSelector.get_campaign_detail, campaign_with_proposal.id)
+
+    def test_get_campaign_with_proposals_count(self, campaign_with_proposal, assert_no_full_table_scan):
+        assert_no_full_table_scan(
+            CampaignSelector.get_campaign_with_proposals_count,
+            campaign_with_proposal.id,
+            campaign_with_proposal.advertiser_id
+        )
+
+    def test_get_proposals_by_campaign(self, campaign_with_proposal, assert_no_full_table_scan):
+        assert_no_full_table_scan(CampaignSelector.get_proposals_by_campaign, campaign_with_proposal.id)
+
+    def test_iter_proposals_by_campaign(self, campaign_with_proposal, assert_no_full_table_scan):
+        assert_no_full_table_scan(
+            lambda campaign_id: list(CampaignSelector.iter_proposals_by_campaign(campaign_id)),
+            campaign_with_proposal.id
+        )
+
+
+@pytest.mark.django_db
+class TestPublicCampaignSelectorQueryPlans:
+    """Public selectors (campaign_selectors.py)"""
+
+    def test_get_latest_recruiting_campaign(self, campaign_with_proposal, assert_no_full_table_scan):
+        assert_no_full_table_scan(PublicCampaignSelector.get_latest_recruiting_campaign)
+
+    def test_get_recruiting_campaigns(self, campaign_with_proposal, assert_no_full_table_scan):
+        assert_no_full_table_scan(PublicCampaignSelector.get_recruiting_campaigns)
+
+    def test_get_recruiting_campaigns_page_with_cursor(
+        self, campaign_with_proposal, assert_no_full_table_scan
+    ):
+        from apps.campaigns.selectors.campaign_selectors import encode_campaign_cursor
+
+        assert_no_full_table_scan(
+            PublicCampaignSelector.get_recruiting_campaigns_page,
+            cursor=encode_campaign_cursor(campaign_with_proposal)
+        )
+
+    def test_search_recruiting_campaigns(self, campaign_with_proposal, assert_no_full_table_scan):
+        assert_no_full_table_scan(PublicCampaignSelector.search_recruiting_campaigns, 'Test Campaign')
+
+    def test_get_campaign_detail(self, campaign_with_proposal, assert_no_full_table_scan):
+        assert_no_full_table_scan(PublicCampaignSelector.get_campaign_detail, campaign_with_proposal.id)
+
+    def test_check_user_can_apply(
+        self, campaign_with_proposal, influencer_users, assert_no_full_table_scan
+    ):
+        assert_no_full_table_scan(
+            PublicCampaignSelector.check_user_can_apply,
+            campaign_with_proposal,
+            influencer_users[1]
+        )
+
+
+@pytest.mark.django_db
+class TestExpiredCampaignCloseQueryPlans:
+    """Scheduled close of expired campaigns"""
+
+    def test_expired_campaign_close(self, campaign_with_proposal, assert_no_full_table_scan):
+        from apps.campaigns.services.campaign_management import ExpiredCampaignCloseService
+
+        assert_no_full_table_scan(
+            ExpiredCampaignCloseService().execute,
+            today=campaign_with_proposal.recruitment_end_date + timedelta(days=1)
+        )
+
+
+@pytest.mark.django_db
+class TestApplicantPageQueryPlans:
+    """Advertiser applicant table: every filter/sort combination is index-backed"""
+
+    @pytest.mark.parametrize('sort', ['newest', 'oldest', 'visit_date', 'visit_date_desc'])
+    @pytest.mark.parametrize('status', [None, 'submitted'])
+    def test_get_applicants_page(
+        self, sort, status, campaign_with_proposal, assert_no_full_table_scan
+    ):
+        assert_no_full_table_scan(
+            CampaignSelector.get_applicants_page,
+            campaign_with_proposal.id,
+            status=status,
+            sort=sort,
+            search='Influencer'
+        )
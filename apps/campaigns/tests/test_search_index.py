@@ -0,0 +1,63 @@
+"""
+Tests for keeping the SQLite search index triggers across migrations
+"""
+
+import pytest
+from django.core.checks import run_checks
+from django.db import connection, models
+from apps.campaigns.models import Campaign
+from apps.campaigns.search_index import (
+    drop_search_triggers_before_migrate, missing_search_triggers,
+    restore_search_triggers_after_migrate
+)
+from apps.campaigns.selectors.campaign_search import search_recruiting_campaign_ids
+
+
+def search_trigger_errors():
+    return [
+        error for error in run_checks(tags=['database'], databases=['default'])
+        if error.id == 'campaigns.E001'
+    ]
+
+
+class TestSearchTriggers:
+    """Tests for the pre/post migrate trigger handlers and campaigns.E001"""
+
+    def test_migrated_database_has_every_trigger(self, db):
+        """migrate가 끝난 데이터베이스에는 모든 검색 트리거가 있다"""
+        assert missing_search_triggers(connection) == []
+        assert search_trigger_errors() == []
+
+    def test_missing_trigger_is_reported_and_restored(self, db, campaign_factory):
+        """빠진 트리거는 시스템 체크가 보고하고, post_migrate가 다시 만들며 색인을 채운다"""
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TRIGGER campaign_search_ai')
+        campaign = campaign_factory(name='트리거 없이 만든 체험단')
+
+        assert [error.id for error in search_trigger_errors()] == ['campaigns.E001']
+        assert search_recruiting_campaign_ids('트리거 없이', limit=10, offset=0) == []
+
+        restore_search_triggers_after_migrate(sender=None, using='default')
+
+        assert missing_search_triggers(connection) == []
+        assert search_recruiting_campaign_ids('트리거 없이', limit=10, offset=0) == [campaign.id]
+
+    def test_table_rebuild_between_migrate_signals(self, transactional_db, campaign_factory):
+        """campaigns 테이블을 다시 만드는 마이그레이션도 감싸지 않고 실행되며, 끝나면 트리거가 복구된다"""
+        campaign = campaign_factory(name='재구성 전 체험단')
+        field = models.IntegerField(default=0)
+        field.set_attributes_from_name('rebuild_probe')
+
+        drop_search_triggers_before_migrate(sender=None, using='default', plan=[('probe', False)])
+        try:
+            with connection.schema_editor() as editor:
+                editor.add_field(Campaign, field)
+        finally:
+            with connection.schema_editor() as editor:
+                editor.remove_field(Campaign, field)
+            restore_search_triggers_after_migrate(sender=None, using='default')
+
+        assert missing_search_triggers(connection) == []
+        assert search_recruiting_campaign_ids('재구성 전', limit=10, offset=0) == [campaign.id]
+        added = campaign_factory(name='재구성 후 체험단')
+        assert search_recruiting_campaign_ids('재구성 후', limit=10, offset=0) == [added.id]
@@ -0,0 +1,89 @@
+"""
+Tests for the seed_load_data management command
+"""
+
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Count
+from apps.campaigns.models import Campaign, CampaignListingCard
+from apps.campaigns.services.proposal_counters import ProposalCounterReconcileService
+from apps.proposals.models import Proposal
+from apps.users.models import User
+
+
+def seed(**options):
+    out = StringIO()
+    call_command('seed_load_data', stdout=out, seed=7, **options)
+    return out.getvalue()
+
+
+@pytest.mark.django_db
+class TestSeedLoadDataCommand:
+    """Tests for seed_load_data"""
+
+    def test_seeds_requested_volumes(self):
+        """요청한 수만큼 사용자/프로필/체험단/지원을 생성한다"""
+        output = seed(advertisers=3, influencers=20, campaigns=10, proposals=150, batch_size=7)
+
+        assert 'Seeded 3 advertisers, 20 influencers, 10 campaigns, 150 proposals.' in output
+        assert User.objects.filter(role='advertiser', advertiser_profile__isnull=False).count() == 3
+        assert User.objects.filter(role='influencer', influencer_profile__isnull=False).count() == 20
+        assert Campaign.objects.count() == 10
+        assert Proposal.objects.count() == 150
+
+    def test_one_proposal_per_campaign_and_influencer(self):
+        """(campaign, influencer) 조합은 중복되지 않는다"""
+        seed(advertisers=1, influencers=5, campaigns=4, proposals=20)
+
+        duplicated = Proposal.objects.values('campaign', 'influencer').annotate(
+            count=Count('id')
+        ).filter(count__gt=1)
+        assert not duplicated.exists()
+        assert Proposal.objects.count() == 20
+
+    def test_counters_and_statuses_are_consistent(self):
+        """저장된 카운터와 지원 상태가 체험단 상태와 일치한다"""
+        seed(advertisers=2, influencers=50, campaigns=30, proposals=600)
+
+        result = ProposalCounterReconcileService().execute()
+        assert result.repaired_count == 0
+
+        for campaign in Campaign.objects.all():
+            if campaign.status == 'selection_complete':
+                assert campaign.submitted_proposals == 0
+                assert campaign.selected_proposals == min(
+                    campaign.recruitment_count, campaign.total_proposals
+                )
+            else:
+                assert campaign.submitted_proposals == campaign.total_proposals
+
+    def test_listing_cards_match_recruiting_campaigns(self):
+        """모집 중 체험단마다 홈 목록 카드가 함께 생성된다"""
+        seed(advertisers=2, influencers=5, campaigns=20, proposals=10)
+
+        recruiting_ids = set(
+            Campaign.objects.filter(status='recruiting').values_list('id', flat=True)
+        )
+        assert recruiting_ids
+        assert set(CampaignListingCard.objects.values_list('pk', flat=True)) == recruiting_ids
+
+    def test_users_share_precomputed_password(self):
+        """모든 사용자가 지정한 비밀번호로 로그인할 수 있다"""
+        seed(advertisers=1, influencers=2, campaigns=1, proposals=2, password='seedpass99')
+
+        for user in User.objects.all():
+            assert user.check_password('seedpass99')
+
+    def test_rejects_more_proposals_than_pairs(self):
+        """체험단 x 인플루언서 조합보다 많은 지원은 거부한다"""
+        with pytest.raises(CommandError):
+            seed(advertisers=1, influencers=2, campaigns=2, proposals=5)
+
+    def test_rejects_existing_prefix(self):
+        """같은 prefix로 다시 실행하면 거부한다"""
+        seed(advertisers=1, influencers=1, campaigns=1, proposals=1)
+
+        with pytest.raises(CommandError):
+            seed(advertisers=1, influencers=1, campaigns=1, proposals=1)
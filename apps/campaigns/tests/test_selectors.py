@@ -10,6 +10,8 @@ from django.contrib.auth.models import AnonymousUser
 from apps.campaigns.models import Campaign
 from apps.campaigns.selectors.campaign_selector import CampaignSelector
 from apps.proposals.models import Proposal
+from apps.proposals.dto import ProposalCreateDTO
+from apps.proposals.services.proposal_service import ProposalCreationService
 from apps.users.models import User, AdvertiserProfile, InfluencerProfile
 
 
@@ -119,12 +121,14 @@ class TestCampaignSelector:
                 birth_date=date(1990, 1, 1),
                 sns_link='https://instagram.com/test'
             )
-            Proposal.objects.create(
-                campaign=campaign,
-                influencer=influencer,
-                cover_letter='Test cover letter',
-                desired_visit_date=date.today() + timedelta(days=3),
-                status='submitted'
+            ProposalCreationService().execute(
+                ProposalCreateDTO(
+                    campaign_id=campaign.id,
+                    influencer_id=influencer.id,
+                    cover_letter='Test cover letter',
+                    desired_visit_date=date.today() + timedelta(days=3)
+                ),
+                user=influencer
             )
 
         # When: 캠페인 조회
@@ -263,3 +267,82 @@ class TestCampaignSelector:
         """Test campaign detail retrieval with invalid ID raises DoesNotExist"""
         with pytest.raises(Campaign.DoesNotExist):
             CampaignSelector.get_campaign_detail(99999)
+
+
+@pytest.mark.django_db
+class TestGetApplicantsPage:
+    """Tests for CampaignSelector.get_applicants_page"""
+
+    @pytest.fixture
+    def applicants(self, campaign_factory, influencer_bulk_factory, proposal_bulk_factory):
+        campaign = campaign_factory()
+        influencers = influencer_bulk_factory(5)
+        proposals = proposal_bulk_factory([(campaign, i) for i in influencers])
+        for offset, proposal in enumerate(proposals):
+            proposal.desired_visit_date = date.today() + timedelta(days=5 - offset)
+            proposal.status = 'selected' if offset < 2 else 'submitted'
+        Proposal.objects.bulk_update(proposals, ['desired_visit_date', 'status'])
+        return campaign, proposals
+
+    def test_pages_newest_first(self, applicants):
+        """최신순으로 페이지를 나누고 다음 페이지 여부를 알려준다"""
+        campaign, proposals = applicants
+
+        first = CampaignSelector.get_applicants_page(campaign.id, page_size=3)
+        second = CampaignSelector.get_applicants_page(campaign.id, page=2, page_size=3)
+
+        ids = [p.proposal_id for p in first.proposals + second.proposals]
+        assert ids == [p.id for p in reversed(proposals)]
+        assert first.has_next and not first.has_previous
+        assert not second.has_next and second.has_previous
+
+    def test_filters_status_and_sorts_by_visit_date(self, applicants):
+        """상태로 거르고 방문 희망일순으로 정렬한다"""
+        campaign, proposals = applicants
+
+        page = CampaignSelector.get_applicants_page(
+            campaign.id, status='submitted', sort='visit_date'
+        )
+
+        assert [p.proposal_id for p in page.proposals] == [p.id for p in reversed(proposals[2:])]
+
+    def test_searches_influencer_name(self, applicants):
+        """인플루언서 이름 일부로 검색한다"""
+        campaign, proposals = applicants
+        name = proposals[3].influencer.name
+
+        page = CampaignSelector.get_applicants_page(campaign.id, search=f'  {name[-3:]} ')
+
+        assert [p.influencer_name for p in page.proposals] == [name]
+        assert page.search == name[-3:]
+
+    def test_rejects_unknown_sort(self, applicants):
+        """지원하지 않는 정렬은 ValueError"""
+        campaign, _ = applicants
+
+        with pytest.raises(ValueError):
+            CampaignSelector.get_applicants_page(campaign.id, sort='cover_letter')
+
+
+@pytest.mark.django_db
+class TestIterProposalsByCampaign:
+    """Tests for CampaignSelector.iter_proposals_by_campaign"""
+
+    def test_streams_dtos_lazily(
+        self, campaign_factory, influencer_bulk_factory, proposal_bulk_factory,
+        django_assert_num_queries
+    ):
+        """쿼리는 첫 항목을 꺼낼 때 실행되고, 행 tuple이 그대로 DTO가 된다"""
+        campaign = campaign_factory()
+        influencers = influencer_bulk_factory(3)
+        proposals = proposal_bulk_factory([(campaign, i) for i in influencers])
+
+        with django_assert_num_queries(0):
+            stream = CampaignSelector.iter_proposals_by_campaign(campaign.id, chunk_size=2)
+
+        with django_assert_num_queries(1):
+            dtos = list(stream)
+
+        assert [dto.proposal_id for dto in dtos] == [p.id for p in reversed(proposals)]
+        assert dtos[0].influencer_email == influencers[-1].email
+        assert dtos[0].created_at == Proposal.objects.get(id=dtos[0].proposal_id).created_at
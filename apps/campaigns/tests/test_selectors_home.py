@@ -2,7 +2,10 @@
 Unit tests for CampaignSelector - Home Page specific tests.
 """
 
+import base64
 import pytest
+from datetime import date, timedelta
+from django.contrib.auth.models import AnonymousUser
 from apps.campaigns.selectors.campaign_selectors import CampaignSelector
 from apps.campaigns.factories import CampaignFactory
 from apps.users.factories import AdvertiserFactory
@@ -92,3 +95,239 @@ class TestCampaignSelectorHome:
         result = list(CampaignSelector.get_recruiting_campaigns())
 
         assert len(result) == 0
+
+
+@pytest.mark.django_db
+class TestRecruitingCampaignsPage:
+    """Test suite for keyset-paginated recruiting campaign list"""
+
+    def test_first_page_returns_page_size_and_next_cursor(self):
+        """첫 페이지는 page_size만큼 반환하고 다음 커서를 제공한다"""
+        advertiser = AdvertiserFactory()
+        CampaignFactory.create_batch(5, advertiser=advertiser, status='recruiting')
+
+        page = CampaignSelector.get_recruiting_campaigns_page(page_size=2)
+
+        assert len(page.campaigns) == 2
+        assert page.has_next is True
+
+    def test_pages_cover_all_campaigns_without_duplicates(self):
+        """커서를 따라가면 모든 모집 중 캠페인을 중복 없이 최신순으로 순회한다"""
+        advertiser = AdvertiserFactory()
+        campaigns = CampaignFactory.create_batch(5, advertiser=advertiser, status='recruiting')
+        CampaignFactory(advertiser=advertiser, status='recruitment_ended')
+
+        seen = []
+        cursor = None
+        while True:
+            page = CampaignSelector.get_recruiting_campaigns_page(cursor=cursor, page_size=2)
+            seen.extend(page.campaigns)
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+
+        assert [c.id for c in seen] == sorted((c.id for c in campaigns), reverse=True)
+
+    def test_pages_break_created_at_ties_by_id(self):
+        """created_at이 같은 캠페인도 id 기준으로 누락 없이 페이지가 나뉜다"""
+        from apps.campaigns.models import CampaignListingCard
+
+        advertiser = AdvertiserFactory()
+        campaigns = CampaignFactory.create_batch(3, advertiser=advertiser, status='recruiting')
+        CampaignListingCard.objects.update(created_at=campaigns[0].created_at)
+
+        first = CampaignSelector.get_recruiting_campaigns_page(page_size=2)
+        second = CampaignSelector.get_recruiting_campaigns_page(
+            cursor=first.next_cursor, page_size=2
+        )
+
+        ids = [c.id for c in first.campaigns + second.campaigns]
+        assert ids == sorted((c.id for c in campaigns), reverse=True)
+        assert second.has_next is False
+
+    def test_page_query_count_is_constant(self, django_assert_num_queries):
+        """페이지 조회는 광고주 이름을 포함해 카드 테이블 단일 쿼리로 처리된다"""
+        advertiser = AdvertiserFactory()
+        CampaignFactory.create_batch(3, advertiser=advertiser, status='recruiting')
+        cursor = CampaignSelector.get_recruiting_campaigns_page(page_size=1).next_cursor
+
+        with django_assert_num_queries(1):
+            page = CampaignSelector.get_recruiting_campaigns_page(cursor=cursor, page_size=1)
+            _ = [c.advertiser_name for c in page.campaigns]
+
+    def test_invalid_cursor_raises_validation_exception(self):
+        """잘못된 커서는 ValidationException을 발생시킨다"""
+        from apps.common.exceptions import ValidationException
+
+        with pytest.raises(ValidationException):
+            CampaignSelector.get_recruiting_campaigns_page(cursor='not-a-cursor')
+
+    @pytest.mark.parametrize('raw', [
+        '2020-01-01T00:00:00+00:00|999999999999999999999999',
+        '2020-01-01T00:00:00+00:00|0',
+        '2020-01-01T00:00:00|1',
+        '0001-01-01T00:00:00+09:00|1',
+    ])
+    def test_out_of_range_cursor_raises_validation_exception(self, raw):
+        """범위를 벗어난 id/시각의 커서는 ValidationException을 발생시킨다"""
+        from apps.common.exceptions import ValidationException
+
+        cursor = base64.urlsafe_b64encode(raw.encode()).decode()
+        with pytest.raises(ValidationException):
+            CampaignSelector.get_recruiting_campaigns_page(cursor=cursor)
+
+
+@pytest.mark.django_db
+class TestSearchRecruitingCampaigns:
+    """Test suite for server-side recruiting campaign search"""
+
+    def test_search_matches_name_benefits_and_mission(self):
+        """체험단명, 혜택, 미션 중 하나라도 포함하면 검색된다"""
+        advertiser = AdvertiserFactory()
+        by_name = CampaignFactory(advertiser=advertiser, name='수제 버거 체험단')
+        by_benefits = CampaignFactory(advertiser=advertiser, benefits='수제 버거 세트 무료 제공')
+        by_mission = CampaignFactory(advertiser=advertiser, mission='수제 버거 시식 후 리뷰')
+        # 관련도(IDF) 계산이 의미 있도록 검색어와 무관한 체험단을 충분히 생성
+        CampaignFactory.create_batch(5, advertiser=advertiser, name='호텔 숙박 체험단')
+
+        page = CampaignSelector.search_recruiting_campaigns('수제 버거')
+
+        assert {c.pk for c in page.campaigns} == {by_name.pk, by_benefits.pk, by_mission.pk}
+        # 체험단명 일치가 가장 높은 순위
+        assert page.campaigns[0].pk == by_name.pk
+
+    def test_search_matches_advertiser_name_and_company(self):
+        """광고주명 또는 업체명으로 검색된다"""
+        advertiser = AdvertiserFactory(name='김광고주')
+        advertiser.advertiser_profile.company_name = '맛있는식당'
+        advertiser.advertiser_profile.save()
+        campaign = CampaignFactory(advertiser=advertiser)
+
+        for query in ('김광고주', '맛있는식당'):
+            page = CampaignSelector.search_recruiting_campaigns(query)
+            assert [c.pk for c in page.campaigns] == [campaign.pk]
+
+    def test_search_excludes_non_recruiting_campaigns(self):
+        """모집 중이 아닌 체험단은 검색되지 않는다"""
+        advertiser = AdvertiserFactory()
+        campaign = CampaignFactory(advertiser=advertiser, name='수제 버거 체험단')
+        campaign.status = 'recruitment_ended'
+        campaign.save()
+
+        assert CampaignSelector.search_recruiting_campaigns('수제 버거').campaigns == []
+
+    def test_search_short_term_falls_back_to_substring_match(self):
+        """3글자 미만 검색어도 부분 일치로 검색된다"""
+        advertiser = AdvertiserFactory()
+        campaign = CampaignFactory(advertiser=advertiser, name='홍대 카페 체험단')
+
+        assert [c.pk for c in CampaignSelector.search_recruiting_campaigns('카페').campaigns] == [campaign.pk]
+
+    def test_search_short_term_scans_listing_cards_only(self):
+        """3글자 미만 검색어는 홈 목록 카드(광고주명 포함)만 검색하고 미션은 보지 않는다"""
+        advertiser = AdvertiserFactory(name='홍대 카페')
+        by_advertiser = CampaignFactory(advertiser=advertiser, name='디저트 체험단')
+        CampaignFactory(advertiser=AdvertiserFactory(), name='맛집 체험단', mission='카페 방문 후기')
+
+        result = CampaignSelector.search_recruiting_campaigns('카페')
+
+        assert [c.pk for c in result.campaigns] == [by_advertiser.pk]
+
+    def test_matching_ids_union_covers_every_table(self):
+        """테이블별 조회의 UNION은 체험단, 광고주명, 업체명 일치를 모두 찾는다"""
+        from apps.campaigns.selectors.campaign_search import matching_campaign_ids
+
+        by_name = CampaignFactory(advertiser=AdvertiserFactory(), name='수제 버거 체험단')
+        by_advertiser = CampaignFactory(advertiser=AdvertiserFactory(name='수제 버거 하우스'))
+        company = AdvertiserFactory()
+        company.advertiser_profile.company_name = '수제 버거 컴퍼니'
+        company.advertiser_profile.save()
+        by_company = CampaignFactory(advertiser=company)
+        CampaignFactory(advertiser=AdvertiserFactory(), name='제주 호텔 체험단')
+
+        ids = {row['id'] for row in matching_campaign_ids('수제 버거')}
+
+        assert ids == {by_name.pk, by_advertiser.pk, by_company.pk}
+
+    def test_search_clamps_huge_page(self):
+        """DB 정수 범위를 넘는 페이지 번호는 상한으로 제한되어 빈 마지막 페이지가 된다"""
+        from apps.campaigns.selectors.campaign_selectors import MAX_SEARCH_PAGE
+
+        CampaignFactory(advertiser=AdvertiserFactory(), name='수제 버거 체험단')
+
+        result = CampaignSelector.search_recruiting_campaigns('수제 버거', page=10**20)
+
+        assert result.page == MAX_SEARCH_PAGE
+        assert result.campaigns == [] and result.has_next is False
+
+    def test_search_paginates_results(self):
+        """검색 결과를 페이지 단위로 나누어 반환한다"""
+        advertiser = AdvertiserFactory()
+        CampaignFactory.create_batch(3, advertiser=advertiser, name='수제 버거 체험단')
+
+        first = CampaignSelector.search_recruiting_campaigns('수제 버거', page=1, page_size=2)
+        second = CampaignSelector.search_recruiting_campaigns('수제 버거', page=2, page_size=2)
+
+        assert len(first.campaigns) == 2 and first.has_next is True
+        assert len(second.campaigns) == 1 and second.has_next is False
+        assert not set(first.campaigns) & set(second.campaigns)
+
+    def test_search_with_blank_query_returns_empty_page(self):
+        """빈 검색어는 빈 결과를 반환한다"""
+        assert CampaignSelector.search_recruiting_campaigns('   ').campaigns == []
+
+
+@pytest.mark.django_db
+class TestCheckUserCanApplyBulk:
+    """Test suite for batch application eligibility"""
+
+    def test_bulk_matches_single_checks(self, influencer_user, proposal_bulk_factory):
+        """일괄 조회 결과가 체험단별 단건 조회 결과와 같다"""
+        advertiser = AdvertiserFactory()
+        recruiting = CampaignFactory(advertiser=advertiser)
+        applied = CampaignFactory(advertiser=advertiser)
+        ended = CampaignFactory(advertiser=advertiser, status='recruitment_ended')
+        overdue = CampaignFactory(
+            advertiser=advertiser,
+            recruitment_start_date=date.today() - timedelta(days=10),
+            recruitment_end_date=date.today() - timedelta(days=1)
+        )
+        proposal_bulk_factory([(applied, influencer_user)])
+        campaigns = [recruiting, applied, ended, overdue]
+
+        result = CampaignSelector.check_user_can_apply_bulk(campaigns, influencer_user)
+
+        assert result[recruiting.id]['can_apply'] is True
+        assert result[applied.id]['reason'] == 'already_applied'
+        assert result[applied.id]['already_applied'] is True
+        assert result[ended.id]['reason'] == 'recruitment_ended'
+        assert result[overdue.id]['reason'] == 'deadline_passed'
+        for campaign in campaigns:
+            assert result[campaign.id] == CampaignSelector.check_user_can_apply(
+                campaign, influencer_user
+            )
+
+    def test_bulk_runs_one_query(
+        self, influencer_user, proposal_bulk_factory, django_assert_num_queries
+    ):
+        """체험단 수와 관계없이 지원 이력 조회는 1회다"""
+        campaigns = CampaignFactory.create_batch(20, advertiser=AdvertiserFactory())
+        proposal_bulk_factory((campaign, influencer_user) for campaign in campaigns[::2])
+
+        with django_assert_num_queries(1):
+            result = CampaignSelector.check_user_can_apply_bulk(campaigns, influencer_user)
+
+        assert sum(r['already_applied'] for r in result.values()) == 10
+
+    def test_bulk_without_query_for_anonymous_and_advertiser(
+        self, advertiser_user, django_assert_num_queries
+    ):
+        """비로그인 사용자와 광고주는 쿼리 없이 판정한다"""
+        campaigns = CampaignFactory.create_batch(3, advertiser=advertiser_user)
+
+        with django_assert_num_queries(0):
+            anonymous = CampaignSelector.check_user_can_apply_bulk(campaigns, AnonymousUser())
+            advertiser = CampaignSelector.check_user_can_apply_bulk(campaigns, advertiser_user)
+
+        assert {r['reason'] for r in anonymous.values()} == {'login_required'}
+        assert {r['reason'] for r in advertiser.values()} == {'advertiser_not_allowed'}
@@ -3,11 +3,17 @@ Tests for campaign services - Phase 2 and Phase 7 Requirements
 """
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.core.exceptions import PermissionDenied, ValidationError
 from datetime import date, timedelta
 from apps.campaigns.services.campaign_creation import CampaignCreationService
-from apps.campaigns.services.campaign_management import CampaignCloseService
+from apps.campaigns.services.campaign_management import (
+    CampaignCloseService,
+    ExpiredCampaignCloseService
+)
 from apps.campaigns.services.influencer_selection import InfluencerSelectionService
+from apps.campaigns.services.proposal_counters import ProposalCounterReconcileService
 from apps.campaigns.dto import (
     CampaignCreateDTO,
     CampaignCloseDTO,
@@ -253,6 +259,70 @@ class TestCampaignCloseService:
             service.execute(user=advertiser_user, dto=dto)
 
 
+@pytest.mark.django_db
+class TestExpiredCampaignCloseService:
+    """Tests for ExpiredCampaignCloseService"""
+
+    def test_closes_only_expired_recruiting_campaigns(
+        self,
+        recruiting_campaign,
+        ended_campaign,
+        advertiser_user
+    ):
+        """모집 종료일이 지난 모집 중 체험단만 일괄 마감한다"""
+        # Given: 만료된 모집 중 체험단 3개
+        expired = [
+            Campaign.objects.create(
+                advertiser=advertiser_user,
+                name=f'Expired {i}',
+                recruitment_start_date=date.today() - timedelta(days=10),
+                recruitment_end_date=date.today() - timedelta(days=1),
+                recruitment_count=5,
+                benefits='Test benefits',
+                mission='Test mission',
+                status='recruiting'
+            )
+            for i in range(3)
+        ]
+
+        # When
+        closed = ExpiredCampaignCloseService().execute(
+            today=date.today(),
+            batch_size=2
+        )
+
+        # Then
+        assert closed == 3
+        for campaign in expired:
+            campaign.refresh_from_db()
+            assert campaign.status == 'recruitment_ended'
+
+        recruiting_campaign.refresh_from_db()
+        assert recruiting_campaign.status == 'recruiting'
+
+    def test_campaign_ending_today_stays_recruiting(self, recruiting_campaign):
+        """모집 종료일 당일까지는 모집 중 상태를 유지한다"""
+        closed = ExpiredCampaignCloseService().execute(
+            today=recruiting_campaign.recruitment_end_date
+        )
+
+        assert closed == 0
+
+    def test_close_expired_campaigns_command(self, recruiting_campaign):
+        """close_expired_campaigns 명령이 마감 건수를 출력한다"""
+        from io import StringIO
+        from django.core.management import call_command
+
+        Campaign.objects.filter(id=recruiting_campaign.id).update(
+            recruitment_end_date=date.today() - timedelta(days=1)
+        )
+        out = StringIO()
+
+        call_command('close_expired_campaigns', stdout=out)
+
+        assert 'Closed 1 expired campaigns.' in out.getvalue()
+
+
 @pytest.mark.django_db
 class TestInfluencerSelectionService:
     """Tests for InfluencerSelectionService - Phase 7"""
@@ -291,6 +361,34 @@ class TestInfluencerSelectionService:
         ).count()
         assert selected == 3
 
+    def test_select_influencers_updates_proposal_counters(
+        self,
+        ended_campaign_with_proposals,
+        advertiser_user
+    ):
+        """선정 완료 시 캠페인 지원 현황 카운터가 갱신된다"""
+        # Given
+        campaign = ended_campaign_with_proposals
+        proposal_ids = list(Proposal.objects.filter(
+            campaign=campaign
+        ).values_list('id', flat=True)[:3])
+
+        # When
+        InfluencerSelectionService().execute(
+            user=advertiser_user,
+            dto=InfluencerSelectionDTO(
+                campaign_id=campaign.id,
+                selected_proposal_ids=proposal_ids
+            )
+        )
+
+        # Then
+        campaign.refresh_from_db()
+        assert campaign.total_proposals == 10
+        assert campaign.submitted_proposals == 0
+        assert campaign.selected_proposals == 3
+        assert campaign.rejected_proposals == 7
+
     def test_select_exceeds_recruitment_count(
         self,
         ended_campaign_with_proposals,
@@ -339,3 +437,150 @@ class TestInfluencerSelectionService:
             service.execute(user=advertiser_user, dto=dto)
 
         assert "최소 1명" in str(exc_info.value)
+
+    def test_select_updates_proposals_in_one_statement(
+        self,
+        ended_campaign_with_proposals,
+        advertiser_user
+    ):
+        """선정/반려를 하나의 UPDATE와 하나의 타임스탬프로 처리한다"""
+        # Given
+        campaign = ended_campaign_with_proposals
+        proposal_ids = list(Proposal.objects.filter(
+            campaign=campaign
+        ).values_list('id', flat=True)[:3])
+
+        # When
+        with CaptureQueriesContext(connection) as context:
+            InfluencerSelectionService().execute(
+                user=advertiser_user,
+                dto=InfluencerSelectionDTO(
+                    campaign_id=campaign.id,
+                    selected_proposal_ids=proposal_ids
+                )
+            )
+
+        # Then
+        proposal_updates = [
+            q['sql'] for q in context.captured_queries
+            if q['sql'].startswith('UPDATE "proposals"')
+        ]
+        assert len(proposal_updates) == 1
+
+        campaign.refresh_from_db()
+        timestamps = set(Proposal.objects.filter(
+            campaign=campaign
+        ).values_list('updated_at', flat=True))
+        assert timestamps == {campaign.updated_at}
+
+    def test_select_with_large_selection_list(
+        self,
+        campaign_factory,
+        advertiser_user,
+        influencer_bulk_factory,
+        proposal_bulk_factory
+    ):
+        """수천 건의 선택 목록도 정확히 선정/반려한다"""
+        # Given: 지원자 5,000명 중 3,000명 선정
+        campaign = campaign_factory(status='recruitment_ended', recruitment_count=3000)
+        influencers = influencer_bulk_factory(5000)
+        proposals = proposal_bulk_factory((campaign, i) for i in influencers)
+        Campaign.objects.filter(id=campaign.id).update(
+            total_proposals=5000, submitted_proposals=5000
+        )
+        selected_ids = [p.id for p in proposals[::5]] + [p.id for p in proposals[1::5]]
+        selected_ids += [p.id for p in proposals[2::5]][:1000]
+
+        # When
+        result = InfluencerSelectionService().execute(
+            user=advertiser_user,
+            dto=InfluencerSelectionDTO(
+                campaign_id=campaign.id,
+                selected_proposal_ids=selected_ids
+            )
+        )
+
+        # Then
+        assert result.selected_count == 3000
+        assert result.rejected_count == 2000
+        assert set(Proposal.objects.filter(
+            campaign=campaign, status='selected'
+        ).values_list('id', flat=True)) == set(selected_ids)
+        campaign.refresh_from_db()
+        assert campaign.submitted_proposals == 0
+        assert campaign.selected_proposals == 3000
+        assert campaign.rejected_proposals == 2000
+
+    def test_select_rejects_proposal_of_other_campaign(
+        self,
+        ended_campaign_with_proposals,
+        advertiser_user,
+        campaign_factory,
+        influencer_bulk_factory,
+        proposal_bulk_factory
+    ):
+        """다른 체험단의 지원을 포함하면 아무것도 변경하지 않는다"""
+        # Given
+        campaign = ended_campaign_with_proposals
+        other = campaign_factory(status='recruitment_ended')
+        foreign = proposal_bulk_factory([(other, influencer_bulk_factory(1)[0])])[0]
+        own_id = Proposal.objects.filter(campaign=campaign).values_list('id', flat=True)[0]
+
+        # When & Then
+        with pytest.raises(ServiceException):
+            InfluencerSelectionService().execute(
+                user=advertiser_user,
+                dto=InfluencerSelectionDTO(
+                    campaign_id=campaign.id,
+                    selected_proposal_ids=[own_id, foreign.id]
+                )
+            )
+
+        assert not Proposal.objects.filter(campaign=campaign).exclude(
+            status='submitted'
+        ).exists()
+
+
+@pytest.mark.django_db
+class TestProposalCounterReconcileService:
+    """Tests for ProposalCounterReconcileService"""
+
+    def test_reconcile_repairs_drifted_counters(
+        self,
+        ended_campaign_with_proposals,
+        recruiting_campaign
+    ):
+        """저장된 카운터가 실제 지원 현황과 다르면 일괄 복구한다"""
+        # Given: 카운터 드리프트 발생
+        campaign = ended_campaign_with_proposals
+        rejected_ids = list(Proposal.objects.filter(
+            campaign=campaign
+        ).values_list('id', flat=True)[:2])
+        Proposal.objects.filter(id__in=rejected_ids).update(status='rejected')
+        Campaign.objects.filter(id=campaign.id).update(total_proposals=99)
+
+        # When
+        result = ProposalCounterReconcileService().execute(batch_size=1)
+
+        # Then
+        assert result.checked_count == 2
+        assert result.repaired_count == 1
+        campaign.refresh_from_db()
+        assert campaign.total_proposals == 10
+        assert campaign.submitted_proposals == 8
+        assert campaign.selected_proposals == 0
+        assert campaign.rejected_proposals == 2
+
+    def test_reconcile_command_reports_result(self, ended_campaign_with_proposals):
+        """reconcile_proposal_counters 명령이 결과를 출력한다"""
+        from io import StringIO
+        from django.core.management import call_command
+
+        Campaign.objects.update(submitted_proposals=0)
+        out = StringIO()
+
+        call_command('reconcile_proposal_counters', stdout=out)
+
+        assert 'repaired 1' in out.getvalue()
+        ended_campaign_with_proposals.refresh_from_db()
+        assert ended_campaign_with_proposals.submitted_proposals == 10
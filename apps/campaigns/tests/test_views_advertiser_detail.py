@@ -0,0 +1,110 @@
+"""
+Tests for the advertiser campaign detail applicant table
+"""
+
+import pytest
+from urllib.parse import urlencode
+from django.urls import reverse
+from apps.campaigns.selectors.campaign_selector import APPLICANTS_PAGE_SIZE
+
+
+@pytest.fixture
+def campaign_with_applicants(campaign_factory, influencer_bulk_factory, proposal_bulk_factory):
+    """Campaign with one and a half pages of submitted applicants"""
+    campaign = campaign_factory(status='recruitment_ended')
+    count = APPLICANTS_PAGE_SIZE + APPLICANTS_PAGE_SIZE // 2
+    proposals = proposal_bulk_factory(
+        [(campaign, influencer) for influencer in influencer_bulk_factory(count)]
+    )
+    campaign.total_proposals = campaign.submitted_proposals = count
+    campaign.save()
+    return campaign, proposals
+
+
+@pytest.mark.django_db
+class TestAdvertiserCampaignDetailApplicants:
+    """Paginated, filterable applicant table"""
+
+    def url(self, campaign, **params):
+        base = reverse('campaigns:advertiser_detail', kwargs={'pk': campaign.id})
+        return f'{base}?{urlencode(params)}' if params else base
+
+    def test_renders_first_page_only(self, client, advertiser_user, campaign_with_applicants):
+        """첫 페이지만 렌더링하고 다음 페이지 링크를 제공한다"""
+        campaign, _ = campaign_with_applicants
+        client.force_login(advertiser_user)
+
+        response = client.get(self.url(campaign))
+
+        assert response.status_code == 200
+        assert len(response.context['proposals']) == APPLICANTS_PAGE_SIZE
+        assert response.context['applicants'].has_next
+        assert 'page=2' in response.content.decode('utf-8')
+
+    def test_second_page_keeps_filters(self, client, advertiser_user, campaign_with_applicants):
+        """페이지 링크는 상태/정렬/검색 조건을 유지한다"""
+        campaign, _ = campaign_with_applicants
+        client.force_login(advertiser_user)
+
+        response = client.get(self.url(campaign, status='submitted', sort='oldest', page=2))
+
+        applicants = response.context['applicants']
+        assert len(applicants.proposals) == APPLICANTS_PAGE_SIZE // 2
+        assert not applicants.has_next
+        assert '?status=submitted&amp;sort=oldest&page=1' in response.content.decode('utf-8')
+
+    def test_invalid_filters_fall_back_to_defaults(
+        self, client, advertiser_user, campaign_with_applicants
+    ):
+        """잘못된 필터 값은 기본값으로 처리한다"""
+        campaign, _ = campaign_with_applicants
+        client.force_login(advertiser_user)
+
+        response = client.get(self.url(campaign, status='hacked', sort='x', page='abc'))
+
+        applicants = response.context['applicants']
+        assert response.status_code == 200
+        assert (applicants.status, applicants.sort, applicants.page) == (None, 'newest', 1)
+
+    def test_out_of_range_page_falls_back_to_first(
+        self, client, advertiser_user, campaign_with_applicants
+    ):
+        """DB 정수 범위를 넘는 페이지 번호는 첫 페이지로 처리한다"""
+        campaign, _ = campaign_with_applicants
+        client.force_login(advertiser_user)
+
+        response = client.get(self.url(campaign, page='99999999999999999999999'))
+
+        assert response.status_code == 200
+        assert response.context['applicants'].page == 1
+        assert len(response.context['proposals']) == APPLICANTS_PAGE_SIZE
+
+    def test_submitted_rows_have_selection_checkboxes(
+        self, client, advertiser_user, campaign_with_applicants
+    ):
+        """선정 단계에서는 신청완료 행마다 체크박스를 렌더링한다"""
+        campaign, proposals = campaign_with_applicants
+        client.force_login(advertiser_user)
+
+        html = client.get(self.url(campaign)).content.decode('utf-8')
+
+        assert html.count('class="form-check-input proposal-checkbox"') == APPLICANTS_PAGE_SIZE
+        assert f'campaign-{campaign.id}-selection' in html
+
+    def test_selection_from_another_page_is_accepted(
+        self, client, advertiser_user, campaign_with_applicants
+    ):
+        """다른 페이지에서 고른 지원자도 함께 선정된다"""
+        campaign, proposals = campaign_with_applicants
+        client.force_login(advertiser_user)
+        # 최신순 첫 페이지와 두 번째 페이지에서 한 명씩
+        chosen = [proposals[-1].id, proposals[0].id]
+
+        client.post(
+            reverse('campaigns:select_influencers', kwargs={'pk': campaign.id}),
+            {'selected_proposals[]': chosen}
+        )
+
+        campaign.refresh_from_db()
+        assert campaign.status == 'selection_complete'
+        assert campaign.selected_proposals == 2
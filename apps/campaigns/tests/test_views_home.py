@@ -2,6 +2,7 @@
 Integration tests for HomeView.
 """
 
+import base64
 import pytest
 from django.urls import reverse
 from apps.campaigns.factories import CampaignFactory
@@ -65,7 +66,117 @@ class TestHomeView:
 
         response = client.get(reverse('campaigns:home'))
 
-        campaigns = list(response.context['campaigns'])
-        assert active_campaign in campaigns
-        assert ended_campaign not in campaigns
+        campaign_ids = [c.pk for c in response.context['campaigns']]
+        assert active_campaign.pk in campaign_ids
+        assert ended_campaign.pk not in campaign_ids
         assert response.context['featured_campaign'] == active_campaign
+
+
+@pytest.mark.django_db
+class TestHomeCampaignListView:
+    """Test suite for the home '더 보기' endpoint"""
+
+    def test_home_view_includes_next_url_when_more_pages(self, client):
+        """첫 페이지를 넘는 캠페인이 있으면 next_url이 컨텍스트에 포함된다"""
+        from apps.campaigns.selectors.campaign_selectors import RECRUITING_CAMPAIGNS_PAGE_SIZE
+
+        advertiser = AdvertiserFactory()
+        CampaignFactory.create_batch(
+            RECRUITING_CAMPAIGNS_PAGE_SIZE + 1, advertiser=advertiser, status='recruiting'
+        )
+
+        response = client.get(reverse('campaigns:home'))
+
+        assert len(response.context['campaigns']) == RECRUITING_CAMPAIGNS_PAGE_SIZE
+        assert response.context['next_url'].startswith(reverse('campaigns:home_campaigns'))
+
+    def test_load_more_returns_next_page_fragment(self, client):
+        """커서로 다음 페이지 카드 조각을 반환한다"""
+        from apps.campaigns.selectors.campaign_selectors import CampaignSelector
+
+        advertiser = AdvertiserFactory()
+        oldest = CampaignFactory(advertiser=advertiser, status='recruiting', name='가장 오래된 캠페인')
+        CampaignFactory(advertiser=advertiser, status='recruiting', name='최신 캠페인')
+        cursor = CampaignSelector.get_recruiting_campaigns_page(page_size=1).next_cursor
+
+        response = client.get(reverse('campaigns:home_campaigns'), {'cursor': cursor})
+
+        assert response.status_code == 200
+        assert 'campaigns/_campaign_cards.html' in [t.name for t in response.templates]
+        assert [c.pk for c in response.context['campaigns']] == [oldest.pk]
+        content = response.content.decode('utf-8')
+        assert '가장 오래된 캠페인' in content
+        assert '최신 캠페인' not in content
+
+    def test_load_more_with_invalid_cursor_returns_400(self, client):
+        """잘못된 커서는 400을 반환한다"""
+        response = client.get(reverse('campaigns:home_campaigns'), {'cursor': '!!!'})
+
+        assert response.status_code == 400
+
+    def test_out_of_range_cursor_returns_400_and_home_first_page(self, client):
+        """id가 범위를 벗어난 커서는 더 보기에서 400, 홈에서는 빈 목록으로 응답한다"""
+        cursor = base64.urlsafe_b64encode(
+            b'2020-01-01T00:00:00+00:00|999999999999999999999999'
+        ).decode()
+
+        assert client.get(reverse('campaigns:home_campaigns'), {'cursor': cursor}).status_code == 400
+        assert client.get(reverse('campaigns:home'), {'cursor': cursor}).status_code == 200
+
+    def test_search_with_huge_page_does_not_fail(self, client):
+        """DB 정수 범위를 넘는 page 값도 500 없이 응답한다"""
+        params = {'q': '파스타', 'page': '99999999999999999999'}
+
+        assert client.get(reverse('campaigns:home_campaigns'), params).status_code == 200
+        assert client.get(reverse('campaigns:home'), params).status_code == 200
+
+    def test_search_returns_matching_campaign_fragment(self, client):
+        """q 파라미터로 서버 측 검색 결과 카드 조각을 반환한다"""
+        advertiser = AdvertiserFactory()
+        CampaignFactory(advertiser=advertiser, status='recruiting', name='강남 파스타 맛집 체험')
+        CampaignFactory(advertiser=advertiser, status='recruiting', name='제주 호텔 숙박 체험')
+
+        response = client.get(reverse('campaigns:home_campaigns'), {'q': '파스타 맛집'})
+
+        content = response.content.decode('utf-8')
+        assert response.status_code == 200
+        assert '강남 파스타 맛집 체험' in content
+        assert '제주 호텔 숙박 체험' not in content
+
+    def test_home_view_renders_search_results_with_query(self, client):
+        """홈 페이지에 q 파라미터가 있으면 검색 결과로 렌더링한다"""
+        advertiser = AdvertiserFactory()
+        match = CampaignFactory(advertiser=advertiser, status='recruiting', name='강남 파스타 맛집 체험')
+        CampaignFactory(advertiser=advertiser, status='recruiting', name='제주 호텔 숙박 체험')
+
+        response = client.get(reverse('campaigns:home'), {'q': '파스타'})
+
+        assert response.context['query'] == '파스타'
+        assert [c.pk for c in response.context['campaigns']] == [match.pk]
+
+    def test_cards_show_eligibility_badges_for_influencer(
+        self, client, influencer_user, proposal_bulk_factory
+    ):
+        """인플루언서에게는 카드별 지원 상태 배지를 표시한다"""
+        advertiser = AdvertiserFactory()
+        applied = CampaignFactory(advertiser=advertiser, name='지원한 파스타 체험')
+        CampaignFactory(advertiser=advertiser, name='새 파스타 체험')
+        proposal_bulk_factory([(applied, influencer_user)])
+        client.force_login(influencer_user)
+
+        for response in (
+            client.get(reverse('campaigns:home')),
+            client.get(reverse('campaigns:home_campaigns'), {'q': '파스타 체험'}),
+        ):
+            content = response.content.decode('utf-8')
+            assert content.count('eligibility-badge') == 2
+            assert '지원 완료' in content
+            assert '지원 가능' in content
+
+    def test_cards_have_no_badges_for_anonymous(self, client):
+        """비로그인 사용자에게는 배지를 표시하지 않는다"""
+        CampaignFactory(advertiser=AdvertiserFactory())
+
+        response = client.get(reverse('campaigns:home'))
+
+        assert 'eligibility-badge' not in response.content.decode('utf-8')
@@ -9,6 +9,7 @@ app_name = 'campaigns'
 
 urlpatterns = [
     path('', views.HomeView.as_view(), name='home'),
+    path('campaigns/more/', views.HomeCampaignListView.as_view(), name='home_campaigns'),
     path('<int:pk>/', views.CampaignDetailView.as_view(), name='detail'),
 
     # Phase 3 & 4: Campaign Management
@@ -21,6 +22,11 @@ urlpatterns = [
         views.AdvertiserCampaignDetailView.as_view(),
         name='advertiser_detail'
     ),
+    path(
+        'manage/<int:pk>/applicants.csv',
+        views.AdvertiserApplicantExportView.as_view(),
+        name='export_applicants'
+    ),
     path(
         'manage/<int:pk>/close/',
         views.close_recruitment,
@@ -3,7 +3,10 @@ Views for campaigns app.
 """
 
 import logging
+from urllib.parse import urlencode
+from django.http import Http404, HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import render, redirect
+from django.urls import reverse
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib import messages
 from django.views import View
@@ -13,7 +16,15 @@ from django.contrib.auth.decorators import login_required
 
 from apps.users.permissions import AdvertiserRequiredMixin
 from .models import Campaign
-from .selectors.campaign_selector import CampaignSelector
+from .cache import get_campaign_detail_fragment
+from .exports import applicant_export_rows, stream_applicants_csv
+from .page_cache import cached_home_response, is_cacheable_home_request
+from .selectors.campaign_selector import (
+    APPLICANT_SORTS,
+    APPLICANT_STATUSES,
+    MAX_APPLICANTS_PAGE,
+    CampaignSelector
+)
 from .selectors.campaign_selectors import CampaignSelector as PublicCampaignSelector
 from .services.campaign_creation import CampaignCreationService
 from .services.campaign_management import CampaignCloseService
@@ -27,11 +38,19 @@ from .dto import (
 from apps.common.exceptions import (
     PermissionDeniedException,
     InvalidStateException,
-    ServiceException
+    ServiceException,
+    ValidationException
 )
 
 logger = logging.getLogger(__name__)
 
+APPLICANT_SORT_CHOICES = [
+    ('newest', '최신 지원순'),
+    ('oldest', '오래된 지원순'),
+    ('visit_date', '방문 희망일 빠른순'),
+    ('visit_date_desc', '방문 희망일 늦은순'),
+]
+
 
 class CampaignManagementView(AdvertiserRequiredMixin, ListView):
     """광고주용 체험단 관리 페이지 - Phase 3"""
@@ -82,25 +101,110 @@ class CampaignCreateView(AdvertiserRequiredMixin, View):
             return redirect('campaigns:manage')
 
 
+def _get_home_campaign_list_context(request):
+    """
+    홈 체험단 목록 컨텍스트를 구성한다.
+
+    - q가 있으면 서버 측 검색 결과 (page 번호 기반)
+    - 없으면 모집 중 목록 (cursor 기반 키셋 페이지네이션)
+
+    Raises:
+        ValidationException: cursor 또는 page 값이 올바르지 않은 경우
+    """
+    query = request.GET.get('q', '').strip()
+    more_url = reverse('campaigns:home_campaigns')
+
+    if query:
+        try:
+            page_number = int(request.GET.get('page', 1))
+        except ValueError:
+            raise ValidationException("잘못된 페이지 번호입니다.")
+
+        page = PublicCampaignSelector.search_recruiting_campaigns(query, page=page_number)
+        next_url = None
+        if page.has_next:
+            next_url = f"{more_url}?{urlencode({'q': query, 'page': page.page + 1})}"
+    else:
+        page = PublicCampaignSelector.get_recruiting_campaigns_page(
+            cursor=request.GET.get('cursor')
+        )
+        next_url = None
+        if page.has_next:
+            next_url = f"{more_url}?{urlencode({'cursor': page.next_cursor})}"
+
+    # 카드별 지원 상태 배지 (지원 이력은 페이지 전체에 대해 한 번만 조회)
+    eligibility = PublicCampaignSelector.check_user_can_apply_bulk(
+        page.campaigns,
+        request.user
+    )
+
+    return {
+        'campaigns': page.campaigns,
+        'campaign_cards': [
+            (campaign, eligibility[campaign.id]) for campaign in page.campaigns
+        ],
+        'query': query,
+        'next_url': next_url,
+    }
+
+
 class HomeView(TemplateView):
     """
     랜딩 페이지 (홈 페이지)
 
     - Hero Section: 플랫폼 소개 및 CTA
-    - 모집 중인 체험단 목록: 최신순
+    - 모집 중인 체험단 목록: 최신순 (q 파라미터가 있으면 검색 결과)
     - 플랫폼 특징 및 이용 방법 안내
+
+    검색/커서 없는 첫 페이지는 페이지 캐시(apps.campaigns.page_cache)에서 응답한다.
     """
     template_name = 'campaigns/home.html'
 
+    def get(self, request, *args, **kwargs):
+        if not is_cacheable_home_request(request):
+            return super().get(request, *args, **kwargs)
+
+        return cached_home_response(
+            request,
+            self.template_name,
+            lambda: self.get_context_data(**kwargs)
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        # 모집 중인 체험단 목록
-        context['campaigns'] = PublicCampaignSelector.get_recruiting_campaigns()
+        # 모집 중인 체험단 목록 (첫 페이지, 이후는 '더 보기'로 추가 로드)
+        try:
+            context.update(_get_home_campaign_list_context(self.request))
+        except ValidationException:
+            context.update({
+                'campaigns': [],
+                'campaign_cards': [],
+                'query': '',
+                'next_url': None,
+            })
 
         return context
 
 
+class HomeCampaignListView(View):
+    """
+    홈 화면 검색 및 '더 보기' 요청에 대해 체험단 카드 조각을 반환한다.
+
+    - q: 검색어 (page와 함께 사용)
+    - cursor: 이전 응답의 다음 페이지 커서
+    """
+    template_name = 'campaigns/_campaign_cards.html'
+
+    def get(self, request):
+        try:
+            context = _get_home_campaign_list_context(request)
+        except ValidationException as e:
+            return HttpResponseBadRequest(str(e))
+
+        return render(request, self.template_name, context)
+
+
 class CampaignDetailView(DetailView):
     """
     Campaign detail page view for all users (public).
@@ -114,22 +218,23 @@ class CampaignDetailView(DetailView):
     context_object_name = 'campaign'
 
     def get_object(self, queryset=None):
-        """Retrieve campaign detail using Selector"""
+        """
+        Retrieve the campaign summary using Selector.
+
+        Only the columns needed for the eligibility check and the fragment
+        cache key are loaded; the full detail (advertiser, profile, texts)
+        is rendered once per campaign version and served from cache.
+        """
         from django.http import Http404
         campaign_id = self.kwargs.get('pk')
         try:
-            campaign = PublicCampaignSelector.get_campaign_detail(campaign_id)
-            logger.info(
-                f"Campaign detail viewed: campaign_id={campaign.id}, "
-                f"user_id={self.request.user.id if self.request.user.is_authenticated else 'anonymous'}"
-            )
-            return campaign
+            return PublicCampaignSelector.get_campaign_summary(campaign_id)
         except Campaign.DoesNotExist:
-            logger.warning(f"Campaign not found: campaign_id={campaign_id}")
+            logger.warning("Campaign not found: campaign_id=%s", campaign_id)
             raise Http404("Campaign not found")
 
     def get_context_data(self, **kwargs):
-        """Add application eligibility context"""
+        """Add cached campaign fragment and application eligibility context"""
         context = super().get_context_data(**kwargs)
         campaign = self.object
 
@@ -140,6 +245,7 @@ class CampaignDetailView(DetailView):
         )
 
         context.update({
+            'campaign_detail_fragment': get_campaign_detail_fragment(campaign),
             'can_apply': can_apply_info['can_apply'],
             'cannot_apply_reason': can_apply_info['reason'],
             'already_applied': can_apply_info['already_applied'],
@@ -171,15 +277,23 @@ class AdvertiserCampaignDetailView(AdvertiserRequiredMixin, View):
             messages.error(request, "존재하지 않거나 접근할 수 없는 체험단입니다.")
             return redirect('campaigns:advertiser_list')
 
-        # 2. Fetch proposals list
-        proposals = CampaignSelector.get_proposals_by_campaign(
-            campaign_id=pk
-        )
+        # 2. Fetch one page of applicants (filter/sort/search from the query string)
+        filters = self._get_applicant_filters(request)
+        applicants = CampaignSelector.get_applicants_page(campaign_id=pk, **filters)
 
         # 3. Determine action button visibility based on status
         context = {
             'campaign': campaign,
-            'proposals': proposals,
+            'applicants': applicants,
+            'proposals': applicants.proposals,
+            'applicant_query': urlencode({
+                key: value for key, value in (
+                    ('status', applicants.status or ''),
+                    ('q', applicants.search),
+                    ('sort', applicants.sort),
+                ) if value
+            }),
+            'sort_choices': APPLICANT_SORT_CHOICES,
             'can_close': campaign.status == 'recruiting',
             'can_select': (
                 campaign.status == 'recruitment_ended' and
@@ -190,6 +304,59 @@ class AdvertiserCampaignDetailView(AdvertiserRequiredMixin, View):
 
         return render(request, self.template_name, context)
 
+    @staticmethod
+    def _get_applicant_filters(request) -> dict:
+        """Read applicant table filters; unknown values fall back to the defaults"""
+        status = request.GET.get('status') or None
+        if status not in APPLICANT_STATUSES:
+            status = None
+
+        sort = request.GET.get('sort', 'newest')
+        if sort not in APPLICANT_SORTS:
+            sort = 'newest'
+
+        try:
+            page = int(request.GET.get('page', 1))
+        except ValueError:
+            page = 1
+        if not 1 <= page <= MAX_APPLICANTS_PAGE:
+            page = 1
+
+        return {
+            'status': status,
+            'search': request.GET.get('q', '')[:50],
+            'sort': sort,
+            'page': page,
+        }
+
+
+class AdvertiserApplicantExportView(AdvertiserRequiredMixin, View):
+    """Stream a campaign's applicants as CSV"""
+
+    def get(self, request, pk):
+        """
+        Download the applicant list of an owned campaign.
+
+        Args:
+            request: HTTP request
+            pk: Campaign ID
+        """
+        campaign = CampaignSelector.get_campaign_with_proposals_count(
+            campaign_id=pk,
+            advertiser_id=request.user.id
+        )
+        if not campaign:
+            raise Http404("Campaign not found")
+
+        response = StreamingHttpResponse(
+            stream_applicants_csv(applicant_export_rows(pk)),
+            content_type='text/csv; charset=utf-8'
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="campaign-{pk}-applicants.csv"'
+        )
+        return response
+
 
 @login_required
 @require_POST
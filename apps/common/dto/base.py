@@ -5,12 +5,15 @@ Base Data Transfer Object (DTO) class.
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseDTO:
     """
     Base class for all DTOs.
 
     - frozen=True ensures immutability
     - Use dataclass features for automatic __init__, __repr__, etc.
+    - slots=True gives the base an empty __slots__, so subclasses declared
+      with @dataclass(frozen=True, slots=True) carry no per-instance
+      __dict__ (about half the memory per row for list/stream DTOs)
     """
     pass
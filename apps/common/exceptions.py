@@ -56,3 +56,31 @@ class ValidationException(ServiceException):
         - Business rule violations
     """
     pass
+
+
+class ServiceUnavailableException(ServiceException):
+    """
+    Exception raised when a bounded resource is saturated.
+
+    The request is valid and can be retried shortly.
+
+    Example:
+        - Every password hashing worker is busy (apps.users.hashing)
+    """
+    pass
+
+
+class UniqueConflictException(DuplicateActionException):
+    """
+    Exception raised when values collide with unique fields of existing rows.
+
+    `errors` maps each colliding field to its message, so forms can show
+    the error next to the field.
+
+    Example:
+        - Signing up with an email or contact that is already registered
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(' '.join(errors.values()))
@@ -0,0 +1,213 @@
+"""
+Per-request performance instrumentation.
+
+RequestMetricsMiddleware records, for every request:
+- number of SQL queries and total SQL time (all database aliases)
+- template render time
+- wall time
+
+and emits them as one structured log line keyed by the resolved URL name
+(e.g. `campaigns:home`). Statements slower than REQUEST_METRICS_SLOW_SQL_MS
+are logged individually.
+
+The same numbers go out as a `Server-Timing` response header only when
+DEBUG is on, REQUEST_METRICS_SERVER_TIMING is set (benchmarks), or the
+user is staff: query counts and SQL timings would otherwise tell any
+client, e.g., whether a record exists.
+
+ReplicaPinningMiddleware keeps read-your-own-writes when selector reads
+go to a read replica (apps.common.routers).
+"""
+
+import logging
+import time
+from contextlib import ExitStack
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections
+from django.template.backends.django import Template as DjangoBackendTemplate
+
+from apps.common.routers import replica_configured, request_routing
+
+logger = logging.getLogger(__name__)
+
+_current_metrics: ContextVar[Optional['RequestMetrics']] = ContextVar(
+    'request_metrics', default=None
+)
+
+
+@dataclass
+class RequestMetrics:
+    """Mutable metrics accumulated while a single request is processed"""
+    slow_sql_ms: float
+    query_count: int = 0
+    sql_ms: float = 0.0
+    template_ms: float = 0.0
+    slow_queries: List[Tuple[float, str]] = field(default_factory=list)
+
+    def record_query(self, sql: str, duration_ms: float) -> None:
+        self.query_count += 1
+        self.sql_ms += duration_ms
+        if duration_ms >= self.slow_sql_ms:
+            self.slow_queries.append((duration_ms, sql))
+
+
+def _timed_execute(execute, sql, params, many, context):
+    """Database execute wrapper feeding the current RequestMetrics"""
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.record_query(sql, (time.perf_counter() - start) * 1000)
+
+
+def _install_template_timer():
+    """
+    Wrap the Django template backend's render() once per process.
+
+    Only the backend-level template is wrapped, so {% include %}d templates
+    are not counted twice.
+    """
+    original_render = DjangoBackendTemplate.render
+    if getattr(original_render, '_request_metrics_timed', False):
+        return
+
+    def render(self, context=None, request=None):
+        metrics = _current_metrics.get()
+        if metrics is None:
+            return original_render(self, context, request)
+
+        start = time.perf_counter()
+        try:
+            return original_render(self, context, request)
+        finally:
+            metrics.template_ms += (time.perf_counter() - start) * 1000
+
+    render._request_metrics_timed = True
+    DjangoBackendTemplate.render = render
+
+
+class RequestMetricsMiddleware:
+    """
+    Record query count, SQL time, template time and wall time per request.
+
+    Settings:
+        REQUEST_METRICS_ENABLED: Turn instrumentation on/off (default True)
+        REQUEST_METRICS_SLOW_SQL_MS: Log statements at or above this duration
+        REQUEST_METRICS_SERVER_TIMING: Send the Server-Timing header to every
+            client (default False; always sent when DEBUG or to staff)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'REQUEST_METRICS_ENABLED', True)
+        self.slow_sql_ms = getattr(settings, 'REQUEST_METRICS_SLOW_SQL_MS', 100.0)
+        self.server_timing = settings.DEBUG or getattr(settings, 'REQUEST_METRICS_SERVER_TIMING', False)
+        if self.enabled:
+            _install_template_timer()
+
+    def __call__(self, request):
+        if not self.enabled:
+            return self.get_response(request)
+
+        metrics = RequestMetrics(slow_sql_ms=self.slow_sql_ms)
+        token = _current_metrics.set(metrics)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(_timed_execute))
+                response = self.get_response(request)
+        finally:
+            _current_metrics.reset(token)
+
+        total_ms = (time.perf_counter() - start) * 1000
+        url_name = self._url_name(request)
+
+        if self.server_timing or self._is_staff(request):
+            response['Server-Timing'] = self._server_timing(metrics, total_ms)
+        self._log(request, response, url_name, metrics, total_ms)
+
+        return response
+
+    @staticmethod
+    def _url_name(request) -> str:
+        match = getattr(request, 'resolver_match', None)
+        return match.view_name if match else 'unresolved'
+
+    @staticmethod
+    def _is_staff(request) -> bool:
+        user = getattr(request, 'user', None)
+        return bool(user is not None and user.is_authenticated and user.is_staff)
+
+    @staticmethod
+    def _server_timing(metrics: RequestMetrics, total_ms: float) -> str:
+        return ', '.join([
+            f'sql;dur={metrics.sql_ms:.1f};desc="{metrics.query_count} queries"',
+            f'tpl;dur={metrics.template_ms:.1f}',
+            f'total;dur={total_ms:.1f}',
+        ])
+
+    @staticmethod
+    def _log(request, response, url_name, metrics: RequestMetrics, total_ms: float) -> None:
+        logger.info(
+            'request url_name=%s method=%s status=%s queries=%d sql_ms=%.1f '
+            'template_ms=%.1f total_ms=%.1f',
+            url_name, request.method, response.status_code, metrics.query_count,
+            metrics.sql_ms, metrics.template_ms, total_ms,
+            extra={
+                'url_name': url_name,
+                'method': request.method,
+                'status_code': response.status_code,
+                'query_count': metrics.query_count,
+                'sql_ms': round(metrics.sql_ms, 1),
+                'template_ms': round(metrics.template_ms, 1),
+                'total_ms': round(total_ms, 1),
+            }
+        )
+        for duration_ms, sql in metrics.slow_queries:
+            logger.warning(
+                'slow query url_name=%s duration_ms=%.1f sql=%s',
+                url_name, duration_ms, sql,
+                extra={'url_name': url_name, 'duration_ms': round(duration_ms, 1)}
+            )
+
+
+class ReplicaPinningMiddleware:
+    """
+    Pin requests to the primary database where a replica could be stale.
+
+    A request is pinned when it is not a safe method (POST etc.) or
+    carries the pin cookie. A request that writes is pinned from that
+    write on and sets the pin cookie, so the request after a redirect
+    reads from the primary too.
+
+    Settings:
+        REPLICA_PIN_SECONDS: Lifetime of the pin cookie (replication lag budget)
+    """
+
+    PIN_COOKIE = 'db_pin'
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.pin_seconds = getattr(settings, 'REPLICA_PIN_SECONDS', 5)
+
+    def __call__(self, request):
+        pinned = request.method not in self.SAFE_METHODS or self.PIN_COOKIE in request.COOKIES
+        with request_routing(pinned) as routing:
+            response = self.get_response(request)
+
+        if routing.wrote and replica_configured():
+            response.set_cookie(
+                self.PIN_COOKIE, '1',
+                max_age=self.pin_seconds, httponly=True, samesite='Lax'
+            )
+        return response
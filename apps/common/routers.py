@@ -0,0 +1,167 @@
+"""
+Read-replica routing for selector queries.
+
+When a `replica` database alias is configured, reads issued by selector
+methods (BaseSelector subclasses) go to it; everything else - services,
+model saves, sessions, auth, direct ORM reads in views - stays on the
+primary (`default`). Selector reads fall back to the primary when:
+- the call runs inside a BaseService.execute() (or `read_from_primary()`)
+- the primary is inside a transaction, so select_for_update() and reads
+  following a write in the same atomic block see that block's data
+- the request is pinned to the primary (ReplicaPinningMiddleware): any
+  non-GET request, a request that wrote, and requests carrying the
+  short-lived pin cookie set after a write, so the page after a
+  redirect (e.g. ProposalCreateView.post -> my proposals) reads the
+  user's own write despite replication lag
+
+Selector methods return lazy QuerySets and iterators, which run their
+queries after the method returned; the hook binds QuerySets to the
+chosen alias with using() and evaluates iterators inside the same read
+scope.
+
+Locally two SQLite files stand in for primary and replica
+(DATABASE_REPLICA_PATH); "replicate" by copying the primary, e.g.
+`sqlite3 db.sqlite3 ".backup replica.sqlite3"`.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from typing import Optional
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import QuerySet
+
+REPLICA_DB_ALIAS = 'replica'
+
+# 현재 읽기 범위에서 사용할 DB alias (selector 호출 중 또는 서비스 실행 중에만 설정)
+_read_alias: ContextVar[Optional[str]] = ContextVar('read_alias', default=None)
+
+
+@dataclass
+class RequestRouting:
+    """Primary pinning state of the request being processed"""
+    pinned: bool = False
+    wrote: bool = False
+
+
+_request_routing: ContextVar[Optional[RequestRouting]] = ContextVar(
+    'request_routing', default=None
+)
+
+
+def replica_configured() -> bool:
+    return REPLICA_DB_ALIAS in connections.settings
+
+
+def selector_read_alias() -> str:
+    """Alias a selector call starting now should read from"""
+    current = _read_alias.get()
+    if current is not None:
+        return current
+
+    routing = _request_routing.get()
+    if (
+        not replica_configured()
+        or (routing is not None and routing.pinned)
+        or connections[DEFAULT_DB_ALIAS].in_atomic_block
+    ):
+        return DEFAULT_DB_ALIAS
+    return REPLICA_DB_ALIAS
+
+
+@contextmanager
+def read_scope(alias: str):
+    token = _read_alias.set(alias)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+def read_from_primary():
+    """Route selector reads in this block to the primary"""
+    return read_scope(DEFAULT_DB_ALIAS)
+
+
+def _iterate_in_scope(alias: str, iterator: Iterator):
+    # 반복할 때마다(next) 읽기 범위를 설정하고, yield 사이에는 호출자에게 새지 않게 한다
+    try:
+        while True:
+            with read_scope(alias):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            close()
+
+
+def route_selector_reads(func):
+    """Run a selector function (and its lazy result) in the selector read scope"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        alias = selector_read_alias()
+        with read_scope(alias):
+            result = func(*args, **kwargs)
+
+        if alias == DEFAULT_DB_ALIAS:
+            return result
+        if isinstance(result, QuerySet):
+            return result.using(alias) if result._result_cache is None else result
+        if isinstance(result, Iterator):
+            return _iterate_in_scope(alias, result)
+        return result
+    return wrapper
+
+
+def route_to_primary(func):
+    """Run a service method with every selector read on the primary"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with read_from_primary():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+@contextmanager
+def request_routing(pinned: bool):
+    """Track primary pinning for one request"""
+    routing = RequestRouting(pinned=pinned)
+    token = _request_routing.set(routing)
+    try:
+        yield routing
+    finally:
+        _request_routing.reset(token)
+
+
+class ReplicaRouter:
+    """
+    Send reads inside a selector read scope to that scope's alias.
+
+    Reads outside a scope and every write go to the primary; a write also
+    pins the rest of the current request to the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        routing = _request_routing.get()
+        if routing is not None:
+            routing.wrote = True
+            routing.pinned = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 레플리카는 primary의 복제본이므로 두 alias의 객체를 연결해도 된다
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 스키마는 복제로 전달된다
+        return db != REPLICA_DB_ALIAS
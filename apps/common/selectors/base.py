@@ -5,6 +5,8 @@ Base Selector class for query optimization.
 from typing import List, Optional
 from django.db.models import QuerySet
 
+from apps.common.routers import route_selector_reads
+
 
 class BaseSelector:
     """
@@ -13,10 +15,21 @@ class BaseSelector:
     Selectors encapsulate complex query logic and optimization.
     They are read-only and focus on data retrieval with proper joins/prefetches.
 
+    Every static/class method of a subclass reads from the replica alias
+    when one is configured (see apps.common.routers), unless the caller is
+    a service, inside a transaction, or pinned to the primary.
+
     Usage:
         class CampaignSelector(BaseSelector):
             @staticmethod
             def get_recruiting_campaigns():
                 return Campaign.objects.filter(status='recruiting').select_related('advertiser')
     """
-    pass
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, attribute in list(vars(cls).items()):
+            if isinstance(attribute, staticmethod):
+                setattr(cls, name, staticmethod(route_selector_reads(attribute.__func__)))
+            elif isinstance(attribute, classmethod):
+                setattr(cls, name, classmethod(route_selector_reads(attribute.__func__)))
@@ -5,6 +5,8 @@ Base Service class for business logic.
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar, Optional
 
+from apps.common.routers import route_to_primary
+
 InputDTO = TypeVar('InputDTO')
 OutputType = TypeVar('OutputType')
 
@@ -15,8 +17,16 @@ class BaseService(ABC, Generic[InputDTO, OutputType]):
 
     Services encapsulate business logic and follow the command pattern.
     They receive a DTO as input and return a result (model instance or DTO).
+
+    execute() always runs against the primary database: selectors called
+    from a service never read from the replica (see apps.common.routers).
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'execute' in vars(cls):
+            cls.execute = route_to_primary(cls.execute)
+
     @abstractmethod
     def execute(self, dto: InputDTO, user: Optional[object] = None) -> OutputType:
         """
@@ -0,0 +1,40 @@
+"""
+Tests for the cache backend settings (CACHE_URL)
+"""
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from config.settings.cache import cache_backend, is_shared_cache
+
+
+class TestCacheBackend:
+    """Tests for cache_backend"""
+
+    def test_locmem_is_process_local(self):
+        """기본값(locmem://)은 프로세스별 메모리 캐시다"""
+        settings = cache_backend('locmem://')
+
+        assert settings == {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': ''}
+        assert not is_shared_cache(settings)
+
+    def test_redis_url_is_passed_through(self):
+        """Redis URL은 그대로 LOCATION이 된다"""
+        settings = cache_backend('redis://:secret@cache.internal:6379/1')
+
+        assert settings == {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': 'redis://:secret@cache.internal:6379/1',
+        }
+        assert is_shared_cache(settings)
+
+    def test_memcached_servers_are_split(self):
+        """Memcached 서버 목록은 쉼표로 나눈다"""
+        settings = cache_backend('memcached://10.0.0.1:11211,10.0.0.2:11211')
+
+        assert settings['BACKEND'] == 'django.core.cache.backends.memcached.PyMemcacheCache'
+        assert settings['LOCATION'] == ['10.0.0.1:11211', '10.0.0.2:11211']
+
+    def test_unknown_scheme_is_rejected(self):
+        """지원하지 않는 스킴은 설정 오류다"""
+        with pytest.raises(ImproperlyConfigured):
+            cache_backend('filesystem:///tmp/cache')
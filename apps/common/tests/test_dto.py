@@ -0,0 +1,41 @@
+"""
+Tests for the DTO base class
+"""
+
+import pytest
+from dataclasses import FrozenInstanceError
+from apps.campaigns import dto as campaign_dtos
+from apps.common.dto.base import BaseDTO
+from apps.proposals import dto as proposal_dtos
+from apps.users import dto as user_dtos
+
+
+def all_dto_classes():
+    classes = []
+    for module in (campaign_dtos, proposal_dtos, user_dtos):
+        classes.extend(
+            value for value in vars(module).values()
+            if isinstance(value, type) and issubclass(value, BaseDTO) and value is not BaseDTO
+        )
+    return classes
+
+
+class TestBaseDTO:
+    """Tests for BaseDTO slots support"""
+
+    def test_base_has_empty_slots(self):
+        """BaseDTO는 인스턴스 __dict__를 만들지 않는다"""
+        assert BaseDTO.__slots__ == ()
+
+    @pytest.mark.parametrize('dto_class', all_dto_classes(), ids=lambda cls: cls.__name__)
+    def test_dtos_are_slotted(self, dto_class):
+        """모든 DTO는 slots=True로 선언되어 __dict__가 없다"""
+        assert '__slots__' in vars(dto_class)
+        assert '__dict__' not in dir(dto_class)
+
+    def test_slotted_dto_stays_frozen(self):
+        """slots DTO도 불변이다"""
+        dto = campaign_dtos.CampaignCloseDTO(campaign_id=1)
+
+        with pytest.raises(FrozenInstanceError):
+            dto.campaign_id = 2
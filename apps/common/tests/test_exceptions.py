@@ -8,7 +8,8 @@ from apps.common.exceptions import (
     PermissionDeniedException,
     InvalidStateException,
     DuplicateActionException,
-    ValidationException
+    ValidationException,
+    UniqueConflictException
 )
 
 
@@ -48,6 +49,16 @@ class TestServiceExceptions:
         with pytest.raises(ServiceException):
             raise ValidationException("Validation failed")
 
+    def test_unique_conflict_exception_keeps_field_errors(self):
+        """UniqueConflictException should be a DuplicateActionException carrying per-field errors"""
+        errors = {'email': '이미 가입된 이메일입니다.', 'contact': '이미 가입된 연락처입니다.'}
+
+        with pytest.raises(DuplicateActionException) as exc_info:
+            raise UniqueConflictException(errors)
+
+        assert exc_info.value.errors == errors
+        assert '이메일' in str(exc_info.value)
+
     def test_exception_message_is_preserved(self):
         """Exception message should be preserved"""
         message = "Test error message"
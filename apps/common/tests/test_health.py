@@ -0,0 +1,154 @@
+"""
+Tests for the health check and database metrics views
+"""
+
+import pytest
+from django.db import OperationalError, connection, connections
+from django.urls import reverse
+from apps.common.routers import REPLICA_DB_ALIAS
+
+
+class FakePool:
+    """Stands in for psycopg_pool.ConnectionPool"""
+
+    def get_stats(self):
+        return {
+            'pool_min': 2,
+            'pool_max': 4,
+            'pool_size': 3,
+            'pool_available': 1,
+            'requests_num': 120,
+            'requests_wait_ms': 35,
+        }
+
+
+def broken_cursor(*args, **kwargs):
+    raise OperationalError('connection refused')
+
+
+@pytest.fixture
+def staff_client(client, advertiser_user):
+    advertiser_user.is_staff = True
+    advertiser_user.save()
+    client.force_login(advertiser_user)
+    return client
+
+
+@pytest.fixture
+def replica_down(monkeypatch):
+    """Attach a `replica` alias whose every query fails"""
+    connections.settings[REPLICA_DB_ALIAS] = connections.configure_settings({
+        'default': connections.settings['default'],
+        REPLICA_DB_ALIAS: {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'},
+    })[REPLICA_DB_ALIAS]
+    monkeypatch.setattr(connections[REPLICA_DB_ALIAS], 'cursor', broken_cursor)
+
+    yield
+
+    del connections[REPLICA_DB_ALIAS]
+    del connections.settings[REPLICA_DB_ALIAS]
+
+
+@pytest.mark.django_db
+class TestHealthView:
+    """Tests for HealthView (load balancer check)"""
+
+    def test_reports_ok_without_details(self, client):
+        """헬스 체크는 상태만 응답하고 내부 정보는 노출하지 않는다"""
+        response = client.get(reverse('health'))
+
+        assert response.status_code == 200
+        assert response.json() == {'status': 'ok'}
+        assert 'no-cache' in response['Cache-Control']
+
+    def test_primary_failure_returns_503(self, client, monkeypatch):
+        """primary 핑이 실패하면 503을 반환한다"""
+        monkeypatch.setattr(connection, 'cursor', broken_cursor)
+
+        response = client.get(reverse('health'))
+
+        assert response.status_code == 503
+        assert response.json() == {'status': 'unavailable'}
+
+    def test_replica_failure_keeps_ready(self, client, replica_down):
+        """레플리카 장애는 준비 상태를 바꾸지 않는다"""
+        response = client.get(reverse('health'))
+
+        assert response.status_code == 200
+
+
+@pytest.mark.django_db
+class TestHealthMetricsView:
+    """Tests for HealthMetricsView"""
+
+    def test_anonymous_and_non_staff_are_forbidden(self, client, influencer_user):
+        """staff가 아니고 토큰도 없으면 지표를 보여주지 않는다"""
+        assert client.get(reverse('health_metrics')).status_code == 403
+
+        client.force_login(influencer_user)
+        response = client.get(reverse('health_metrics'))
+
+        assert response.status_code == 403
+        assert 'databases' not in response.json()
+
+    def test_token_grants_access(self, client, settings):
+        """X-Health-Token 헤더가 설정된 토큰과 같으면 지표를 보여준다"""
+        settings.HEALTH_METRICS_TOKEN = 'monitoring-secret'
+        url = reverse('health_metrics')
+
+        assert client.get(url, HTTP_X_HEALTH_TOKEN='monitoring-secret').status_code == 200
+        assert client.get(url, HTTP_X_HEALTH_TOKEN='wrong').status_code == 403
+
+    def test_empty_token_setting_grants_nothing(self, client, settings):
+        """토큰 설정이 비어 있으면 빈 헤더로 접근할 수 없다"""
+        settings.HEALTH_METRICS_TOKEN = ''
+
+        response = client.get(reverse('health_metrics'), HTTP_X_HEALTH_TOKEN='')
+
+        assert response.status_code == 403
+
+    def test_reports_ok_without_pool(self, staff_client):
+        """풀이 없는 DB(SQLite)는 pool이 null로 보고된다"""
+        response = staff_client.get(reverse('health_metrics'))
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body['status'] == 'ok'
+        assert body['databases']['default'] == {
+            'vendor': 'sqlite',
+            'pool': None,
+            'server': None,
+            'ok': True,
+        }
+        assert 'no-cache' in response['Cache-Control']
+
+    def test_reports_pool_occupancy(self, staff_client, monkeypatch):
+        """풀이 있으면 사용 중 연결 수와 점유율을 보고한다"""
+        monkeypatch.setattr(connection, 'pool', FakePool(), raising=False)
+
+        pool = staff_client.get(reverse('health_metrics')).json()['databases']['default']['pool']
+
+        assert pool['in_use'] == 2
+        assert pool['occupancy'] == 0.5
+        assert pool['max_size'] == 4
+        assert pool['requests_num'] == 120
+        assert pool['requests_errors'] == 0
+
+    def test_replica_failure_is_reported_with_200(self, staff_client, replica_down):
+        """레플리카 장애는 보고하되 상태 코드는 primary가 결정한다"""
+        response = staff_client.get(reverse('health_metrics'))
+
+        assert response.status_code == 200
+        replica = response.json()['databases'][REPLICA_DB_ALIAS]
+        assert replica['ok'] is False
+        assert replica['error'] == 'OperationalError'
+
+    def test_primary_failure_returns_503(self, client, settings, monkeypatch):
+        """primary 핑이 실패하면 503을 반환한다 (DB 없이 인증되는 토큰으로 조회)"""
+        settings.HEALTH_METRICS_TOKEN = 'monitoring-secret'
+        monkeypatch.setattr(connection, 'cursor', broken_cursor)
+
+        response = client.get(reverse('health_metrics'), HTTP_X_HEALTH_TOKEN='monitoring-secret')
+
+        assert response.status_code == 503
+        assert response.json()['databases']['default']['error'] == 'OperationalError'
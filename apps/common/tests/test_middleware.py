@@ -0,0 +1,89 @@
+"""
+Test cases for RequestMetricsMiddleware.
+"""
+
+import logging
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+
+
+@pytest.mark.django_db
+class TestRequestMetricsMiddleware:
+    """Test cases for per-request query and latency instrumentation"""
+
+    @override_settings(REQUEST_METRICS_SERVER_TIMING=True)
+    def test_response_has_server_timing_header(self, client):
+        """Server-Timing header should report sql, template and total durations"""
+        response = client.get(reverse('campaigns:home'))
+
+        header = response['Server-Timing']
+        assert 'sql;dur=' in header
+        assert 'queries"' in header
+        assert 'tpl;dur=' in header
+        assert 'total;dur=' in header
+
+    @override_settings(REQUEST_METRICS_SERVER_TIMING=True)
+    def test_query_count_matches_executed_queries(
+        self, client, campaign_factory, django_assert_num_queries
+    ):
+        """Reported query count should match the queries the view ran"""
+        campaign = campaign_factory()
+        url = reverse('campaigns:detail', kwargs={'pk': campaign.id})
+
+        # 캐시 미스: 체험단 요약 + 상세 fragment 렌더링용 조회
+        with django_assert_num_queries(2):
+            response = client.get(url)
+
+        assert 'desc="2 queries"' in response['Server-Timing']
+
+    def test_server_timing_is_not_sent_by_default(self, client):
+        """Server-Timing header should not reveal SQL metrics to ordinary clients"""
+        response = client.get(reverse('campaigns:home'))
+
+        assert 'Server-Timing' not in response
+
+    def test_server_timing_is_sent_to_staff(self, client, advertiser_user):
+        """Staff users should get the Server-Timing header without the opt-in setting"""
+        advertiser_user.is_staff = True
+        advertiser_user.save()
+        client.force_login(advertiser_user)
+
+        response = client.get(reverse('campaigns:home'))
+
+        assert 'sql;dur=' in response['Server-Timing']
+
+    @override_settings(DEBUG=True)
+    def test_server_timing_is_sent_in_debug(self, client):
+        """Server-Timing header should be sent to every client when DEBUG is on"""
+        response = client.get(reverse('campaigns:home'))
+
+        assert 'total;dur=' in response['Server-Timing']
+
+    def test_log_line_is_keyed_by_url_name(self, client, caplog):
+        """A structured log line should carry the resolved URL name"""
+        with caplog.at_level(logging.INFO, logger='apps.common.middleware'):
+            client.get(reverse('campaigns:home'))
+
+        records = [r for r in caplog.records if r.name == 'apps.common.middleware']
+        assert records[-1].url_name == 'campaigns:home'
+        assert records[-1].query_count >= 1
+        assert 'url_name=campaigns:home' in records[-1].getMessage()
+
+    def test_unresolved_url_is_logged_as_unresolved(self, client, caplog):
+        """404 requests without a URL match should be logged as 'unresolved'"""
+        with caplog.at_level(logging.INFO, logger='apps.common.middleware'):
+            client.get('/no-such-page/')
+
+        records = [r for r in caplog.records if r.name == 'apps.common.middleware']
+        assert records[-1].url_name == 'unresolved'
+
+    @override_settings(REQUEST_METRICS_SLOW_SQL_MS=0)
+    def test_slow_queries_are_logged(self, client, caplog):
+        """Statements above the threshold should be logged with their SQL"""
+        with caplog.at_level(logging.INFO, logger='apps.common.middleware'):
+            client.get(reverse('campaigns:home'))
+
+        slow = [r for r in caplog.records if r.getMessage().startswith('slow query')]
+        assert slow
+        assert 'SELECT' in slow[0].getMessage()
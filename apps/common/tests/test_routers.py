@@ -0,0 +1,156 @@
+"""
+Tests for read-replica routing, with two SQLite files as primary and replica
+"""
+
+import sqlite3
+import pytest
+from datetime import date, timedelta
+from django.db import connections, transaction
+from django.urls import reverse
+from apps.campaigns.models import Campaign
+from apps.campaigns.selectors.campaign_selector import CampaignSelector
+from apps.campaigns.selectors.campaign_selectors import CampaignSelector as PublicCampaignSelector
+from apps.common.routers import REPLICA_DB_ALIAS, read_from_primary
+from apps.common.services.base import BaseService
+from apps.proposals.models import Proposal
+
+
+@pytest.fixture
+def replica(transactional_db, tmp_path):
+    """
+    Attach a read-only `replica` alias copied from the primary.
+
+    Returns a function that "replicates" again; rows written after the last
+    call exist only on the primary, like replication lag.
+    """
+    path = tmp_path / 'replica.sqlite3'
+
+    def replicate():
+        source = connections['default']
+        source.ensure_connection()
+        target = sqlite3.connect(path)
+        source.connection.backup(target)
+        target.close()
+
+    replicate()
+    connections.settings[REPLICA_DB_ALIAS] = connections.configure_settings({
+        'default': connections.settings['default'],
+        REPLICA_DB_ALIAS: {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': f'file:{path}?mode=ro',
+        },
+    })[REPLICA_DB_ALIAS]
+    # 테스트 DB 목록에 없는 alias의 지연 연결은 막히므로 미리 연결해 둔다
+    connections[REPLICA_DB_ALIAS].connect()
+
+    yield replicate
+
+    connections[REPLICA_DB_ALIAS].close()
+    del connections[REPLICA_DB_ALIAS]
+    del connections.settings[REPLICA_DB_ALIAS]
+
+
+@pytest.fixture
+def lagging_campaigns(replica, campaign_factory):
+    """One campaign on both databases, one written after replication"""
+    replicated = campaign_factory(name='복제된 체험단')
+    replica()
+    lagging = campaign_factory(name='복제 전 체험단')
+    return replicated, lagging
+
+
+def names(campaigns):
+    return {campaign.name for campaign in campaigns}
+
+
+class LatestCampaignNamesService(BaseService):
+    """Service calling a selector"""
+
+    def execute(self, dto=None, user=None):
+        return names(PublicCampaignSelector.get_recruiting_campaigns())
+
+
+class TestReplicaRouting:
+    """Tests for ReplicaRouter and the BaseSelector/BaseService hooks"""
+
+    def test_selector_queryset_reads_replica(self, lagging_campaigns):
+        """selector가 돌려준 QuerySet은 레플리카에서 조회된다"""
+        campaigns = PublicCampaignSelector.get_recruiting_campaigns()
+
+        assert campaigns.db == REPLICA_DB_ALIAS
+        assert names(campaigns) == {'복제된 체험단'}
+
+    def test_selector_iterator_reads_replica(self, replica, campaign_factory, influencer_user):
+        """selector가 돌려준 지연 이터레이터도 레플리카에서 조회된다"""
+        campaign = campaign_factory()
+        Proposal.objects.create(
+            campaign=campaign, influencer=influencer_user,
+            cover_letter='지원합니다', desired_visit_date=date.today()
+        )
+        replica()
+        Proposal.objects.all().delete()
+
+        rows = CampaignSelector.iter_applicant_export_rows(campaign.id)
+
+        assert len(list(rows)) == 1
+
+    def test_direct_orm_reads_stay_on_primary(self, lagging_campaigns):
+        """selector 밖의 조회는 primary를 사용한다"""
+        assert Campaign.objects.count() == 2
+
+    def test_service_selector_calls_read_primary(self, lagging_campaigns):
+        """서비스 안에서 호출한 selector는 primary에서 조회한다"""
+        assert LatestCampaignNamesService().execute() == {'복제된 체험단', '복제 전 체험단'}
+
+    def test_transaction_reads_primary(self, lagging_campaigns):
+        """트랜잭션 안(select_for_update 포함)의 selector 조회는 primary를 사용한다"""
+        with transaction.atomic():
+            campaigns = PublicCampaignSelector.get_recruiting_campaigns()
+
+            assert campaigns.db == 'default'
+            assert len(names(campaigns)) == 2
+
+    def test_read_from_primary_block(self, lagging_campaigns):
+        """read_from_primary() 블록 안에서는 primary를 사용한다"""
+        with read_from_primary():
+            assert len(names(PublicCampaignSelector.get_recruiting_campaigns())) == 2
+
+    def test_no_replica_configured_reads_primary(self, transactional_db, campaign_factory):
+        """레플리카가 없으면 모든 조회가 primary로 간다"""
+        campaign_factory()
+
+        assert PublicCampaignSelector.get_recruiting_campaigns().db == 'default'
+
+
+class TestReplicaPinningMiddleware:
+    """Tests for read-your-own-writes across a redirect"""
+
+    def test_write_pins_next_request_to_primary(self, client, replica, campaign_factory, influencer_user):
+        """지원 직후 리다이렉트된 요청은 primary에서 자신의 지원을 읽는다"""
+        campaign = campaign_factory()
+        replica()
+        client.force_login(influencer_user)
+
+        response = client.post(reverse('proposals:apply', kwargs={'pk': campaign.id}), {
+            'cover_letter': '지원합니다',
+            'desired_visit_date': (date.today() + timedelta(days=3)).isoformat(),
+        })
+
+        assert response.cookies['db_pin']['max-age'] == 5
+        pinned = client.get(reverse('proposals:my_proposals'))
+        assert len(pinned.context['proposals']) == 1
+
+        # 고정 쿠키가 만료되면 (아직 복제되지 않은) 레플리카를 읽는다
+        del client.cookies['db_pin']
+        unpinned = client.get(reverse('proposals:my_proposals'))
+        assert len(unpinned.context['proposals']) == 0
+
+    def test_read_only_request_sets_no_pin(self, client, replica, campaign_factory):
+        """쓰기가 없는 요청은 고정 쿠키를 남기지 않는다"""
+        campaign = campaign_factory()
+        replica()
+
+        response = client.get(reverse('campaigns:detail', kwargs={'pk': campaign.id}))
+
+        assert response.status_code == 200
+        assert 'db_pin' not in response.cookies
@@ -0,0 +1,83 @@
+"""
+Tests for the production SQLite connection settings
+"""
+
+import pytest
+from django.db.utils import ConnectionHandler
+from config.settings.sqlite import sqlite_database
+
+
+@pytest.fixture
+def sqlite_connection(tmp_path, django_db_blocker):
+    """Open a Django connection to a file database built by sqlite_database()"""
+    opened = []
+
+    def connect():
+        handler = ConnectionHandler({'default': sqlite_database(str(tmp_path / 'db.sqlite3'))})
+        connection = handler['default']
+        opened.append(connection)
+        return connection
+
+    with django_db_blocker.unblock():
+        yield connect
+
+        for connection in opened:
+            connection.close()
+
+
+def pragma(connection, name):
+    with connection.cursor() as cursor:
+        cursor.execute(f'PRAGMA {name}')
+        return cursor.fetchone()[0]
+
+
+class TestSqliteDatabase:
+    """Tests for sqlite_database"""
+
+    def test_connection_applies_pragmas(self, sqlite_connection):
+        """새 연결마다 WAL과 성능 PRAGMA가 적용된다"""
+        connection = sqlite_connection()
+
+        assert pragma(connection, 'journal_mode') == 'wal'
+        assert pragma(connection, 'synchronous') == 1  # NORMAL
+        assert pragma(connection, 'temp_store') == 2  # MEMORY
+        assert pragma(connection, 'cache_size') == -65536
+        assert pragma(connection, 'busy_timeout') == 5000
+
+    def test_write_transactions_begin_immediate(self, sqlite_connection):
+        """쓰기 트랜잭션은 BEGIN IMMEDIATE로 시작한다"""
+        connection = sqlite_connection()
+        connection.ensure_connection()
+
+        assert connection.transaction_mode == 'IMMEDIATE'
+
+    def test_values_are_configurable(self, monkeypatch, sqlite_connection):
+        """환경 변수로 값을 변경할 수 있다"""
+        monkeypatch.setenv('SQLITE_BUSY_TIMEOUT_MS', '250')
+        monkeypatch.setenv('SQLITE_CACHE_SIZE', '-2000')
+        monkeypatch.setenv('SQLITE_TRANSACTION_MODE', 'DEFERRED')
+
+        connection = sqlite_connection()
+
+        assert pragma(connection, 'busy_timeout') == 250
+        assert pragma(connection, 'cache_size') == -2000
+        assert connection.transaction_mode == 'DEFERRED'
+
+    def test_reader_not_blocked_by_open_write_transaction(self, sqlite_connection):
+        """WAL 모드에서는 쓰기 트랜잭션 중에도 다른 연결이 읽을 수 있다"""
+        writer = sqlite_connection()
+        reader = sqlite_connection()
+        with writer.cursor() as cursor:
+            cursor.execute('CREATE TABLE items (id INTEGER PRIMARY KEY)')
+            cursor.execute('INSERT INTO items DEFAULT VALUES')
+
+        writer._start_transaction_under_autocommit()
+        with writer.cursor() as cursor:
+            cursor.execute('INSERT INTO items DEFAULT VALUES')
+
+        with reader.cursor() as cursor:
+            cursor.execute('SELECT COUNT(*) FROM items')
+            assert cursor.fetchone()[0] == 1
+
+        with writer.cursor() as cursor:
+            cursor.execute('COMMIT')
@@ -0,0 +1,144 @@
+"""
+Health check and database connection metrics.
+
+GET /health/ is the load balancer's liveness/readiness check: it pings
+the primary (`default`) with `SELECT 1` and answers 200 or 503 without
+any details. Only the primary decides readiness; the app keeps serving
+reads from it when the replica is down.
+
+GET /health/metrics/ reports, per database alias:
+- ok: whether `SELECT 1` succeeded
+- pool: occupancy of this process's connection pool (pooled PostgreSQL,
+  see config/settings/postgres.py), otherwise null
+- server: connections open on the PostgreSQL server and its
+  max_connections
+
+Pools are per worker process, so `pid` identifies which worker answered;
+the server figures cover all workers. Metrics are served to staff users
+and to requests carrying HEALTH_METRICS_TOKEN in the X-Health-Token
+header (monitoring), 403 otherwise; their status is 503 only when the
+primary fails.
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.http import JsonResponse
+from django.utils.crypto import constant_time_compare
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.cache import never_cache
+
+
+def pool_metrics(connection) -> Optional[Dict[str, Any]]:
+    """
+    Occupancy of a connection's pool, or None without pooling.
+
+    `in_use` counts connections checked out by requests of this process;
+    `occupancy` is in_use / max_size. Cumulative counters (requests served,
+    time spent waiting, timeouts, lost connections) come from
+    psycopg_pool's get_stats().
+    """
+    pool = getattr(connection, 'pool', None)
+    if pool is None:
+        return None
+
+    stats = pool.get_stats()
+    size = stats.get('pool_size', 0)
+    max_size = stats.get('pool_max', 0)
+    in_use = size - stats.get('pool_available', 0)
+    return {
+        'min_size': stats.get('pool_min', 0),
+        'max_size': max_size,
+        'size': size,
+        'in_use': in_use,
+        'occupancy': round(in_use / max_size, 3) if max_size else 0.0,
+        'requests_waiting': stats.get('requests_waiting', 0),
+        'requests_num': stats.get('requests_num', 0),
+        'requests_wait_ms': stats.get('requests_wait_ms', 0),
+        'requests_errors': stats.get('requests_errors', 0),
+        'connections_lost': stats.get('connections_lost', 0),
+    }
+
+
+def server_connection_metrics(connection) -> Optional[Dict[str, int]]:
+    """Connections open on the PostgreSQL server against its limit"""
+    if connection.vendor != 'postgresql':
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT count(*) FROM pg_stat_activity WHERE datname = current_database()'
+        )
+        open_connections = cursor.fetchone()[0]
+        cursor.execute('SHOW max_connections')
+        max_connections = int(cursor.fetchone()[0])
+    return {'connections': open_connections, 'max_connections': max_connections}
+
+
+def ping(alias: str) -> bool:
+    """Whether `SELECT 1` succeeds on a database alias"""
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute('SELECT 1')
+    except DatabaseError:
+        return False
+    return True
+
+
+def database_health(alias: str) -> Dict[str, Any]:
+    """Ping one database alias and collect its connection metrics"""
+    connection = connections[alias]
+    # 풀 점유율은 이 요청이 연결을 빌리기 전에 읽는다
+    result = {'vendor': connection.vendor, 'pool': pool_metrics(connection)}
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        result['server'] = server_connection_metrics(connection)
+        result['ok'] = True
+    except DatabaseError as e:
+        result['ok'] = False
+        result['error'] = e.__class__.__name__
+    return result
+
+
+def can_view_metrics(request) -> bool:
+    """Monitoring presenting HEALTH_METRICS_TOKEN, or staff users"""
+    # 토큰을 먼저 본다: 모니터링 요청은 세션/사용자 조회 없이(DB 장애 중에도) 통과한다
+    token = request.headers.get('X-Health-Token', '')
+    if settings.HEALTH_METRICS_TOKEN and constant_time_compare(token, settings.HEALTH_METRICS_TOKEN):
+        return True
+    return request.user.is_authenticated and request.user.is_staff
+
+
+@method_decorator(never_cache, name='dispatch')
+class HealthView(View):
+    """Liveness/readiness check of the primary database (no details)"""
+
+    def get(self, request):
+        if ping(DEFAULT_DB_ALIAS):
+            return JsonResponse({'status': 'ok'})
+        return JsonResponse({'status': 'unavailable'}, status=503)
+
+
+@method_decorator(never_cache, name='dispatch')
+class HealthMetricsView(View):
+    """Per-database health and connection pool occupancy (staff or token)"""
+
+    def get(self, request):
+        if not can_view_metrics(request):
+            return JsonResponse({'status': 'forbidden'}, status=403)
+
+        databases = {alias: database_health(alias) for alias in connections}
+        healthy = databases[DEFAULT_DB_ALIAS]['ok']
+
+        return JsonResponse(
+            {
+                'status': 'ok' if healthy else 'error',
+                'pid': os.getpid(),
+                'databases': databases,
+            },
+            status=200 if healthy else 503
+        )
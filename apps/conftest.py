@@ -2,11 +2,26 @@
 Common pytest fixtures for all apps.
 """
 
+import re
 import pytest
+from contextlib import contextmanager
 from datetime import date, timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import QuerySet
 from django.test import Client
-from apps.users.models import User, AdvertiserProfile
+from django.test.utils import CaptureQueriesContext
+from apps.users.models import User, AdvertiserProfile, InfluencerProfile
 from apps.campaigns.models import Campaign
+from apps.proposals.models import Proposal
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache (cached fragments must not leak between tests)"""
+    cache.clear()
+    yield
+    cache.clear()
 
 
 @pytest.fixture
@@ -64,3 +79,119 @@ def campaign_factory(db, advertiser_user):
         defaults.update(kwargs)
         return Campaign.objects.create(**defaults)
     return create_campaign
+
+
+@pytest.fixture
+def influencer_bulk_factory(db):
+    """
+    Factory fixture for creating many influencers (with profiles) via bulk_create.
+
+    Passwords are left unusable so no hashing cost is paid per user.
+    """
+    counter = {'next': 0}
+
+    def create_influencers(count):
+        start = counter['next']
+        counter['next'] += count
+        users = User.objects.bulk_create([
+            User(
+                email=f'bulk-influencer{i}@test.com',
+                name=f'Bulk Influencer {i}',
+                contact=f'010-8{i:03d}-{i:04d}',
+                role='influencer',
+                password='!'
+            )
+            for i in range(start, start + count)
+        ])
+        InfluencerProfile.objects.bulk_create([
+            InfluencerProfile(
+                user=user,
+                birth_date=date(1990, 1, 1),
+                sns_link=f'https://blog.naver.com/bulk{user.id}'
+            )
+            for user in users
+        ])
+        return users
+    return create_influencers
+
+
+@pytest.fixture
+def proposal_bulk_factory(db):
+    """Factory fixture for creating proposals for every (campaign, influencer) pair given"""
+    def create_proposals(pairs, **kwargs):
+        defaults = {
+            'cover_letter': 'Cover letter',
+            'desired_visit_date': date.today() + timedelta(days=1),
+            'status': 'submitted',
+        }
+        defaults.update(kwargs)
+        return Proposal.objects.bulk_create([
+            Proposal(campaign=campaign, influencer=influencer, **defaults)
+            for campaign, influencer in pairs
+        ])
+    return create_proposals
+
+
+@pytest.fixture
+def assert_no_full_table_scan(db):
+    """
+    Run a selector call and assert no captured query plan is a full table scan.
+
+    Every query executed by the call is re-run under EXPLAIN QUERY PLAN;
+    a bare `SCAN <table>` step (no index) fails the test. SQLite only.
+
+    Usage:
+        assert_no_full_table_scan(CampaignSelector.get_recruiting_campaigns)
+    """
+    if connection.vendor != 'sqlite':
+        pytest.skip('EXPLAIN QUERY PLAN assertions are SQLite-specific')
+
+    def check(func, *args, **kwargs):
+        with CaptureQueriesContext(connection) as context:
+            result = func(*args, **kwargs)
+            if isinstance(result, QuerySet):
+                result = list(result)
+
+        assert context.captured_queries, 'selector did not run any query'
+        for query in context.captured_queries:
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {query['sql']}")
+                plan = [row[-1] for row in cursor.fetchall()]
+            full_scans = [step for step in plan if re.fullmatch(r'SCAN \S+', step)]
+            assert not full_scans, (
+                f"Full table scan {full_scans} in query:\n{query['sql']}\nPlan: {plan}"
+            )
+        return result
+
+    return check
+
+
+@pytest.fixture
+def assert_max_queries(db):
+    """
+    Context manager asserting that a block runs at most `max_queries` queries.
+
+    Unlike django_assert_num_queries it is an upper bound, so budgets can be
+    shared across parametrized data sizes: a count that grows with N fails.
+
+    Usage:
+        with assert_max_queries(3):
+            client.get(url)
+    """
+    @contextmanager
+    def check(max_queries):
+        with CaptureQueriesContext(connection) as context:
+            yield context
+
+        executed = len(context.captured_queries)
+        if executed > max_queries:
+            statements = '\n'.join(
+                f"{i}. {query['sql']}"
+                for i, query in enumerate(context.captured_queries, 1)
+            )
+            pytest.fail(
+                f"{executed} queries executed, budget is {max_queries}:\n{statements}",
+                pytrace=False
+            )
+
+    return check
@@ -3,6 +3,7 @@ Admin configuration for proposals app.
 """
 
 from django.contrib import admin
+from .cache import invalidate_applied_campaigns
 from .models import Proposal
 
 
@@ -15,3 +16,24 @@ class ProposalAdmin(admin.ModelAdmin):
     search_fields = ['influencer__name', 'influencer__email', 'campaign__name']
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['-created_at']
+
+    # 관리자 화면의 변경은 서비스를 거치지 않으므로 지원 내역 캐시를 직접 무효화한다
+
+    def save_model(self, request, obj, form, change):
+        previous_influencer_id = None
+        if change:
+            previous_influencer_id = Proposal.objects.filter(
+                pk=obj.pk
+            ).values_list('influencer_id', flat=True).first()
+        super().save_model(request, obj, form, change)
+        influencer_ids = {obj.influencer_id, previous_influencer_id} - {None}
+        invalidate_applied_campaigns(*influencer_ids)
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        invalidate_applied_campaigns(obj.influencer_id)
+
+    def delete_queryset(self, request, queryset):
+        influencer_ids = set(queryset.values_list('influencer_id', flat=True))
+        super().delete_queryset(request, queryset)
+        invalidate_applied_campaigns(*influencer_ids)
@@ -0,0 +1,111 @@
+"""
+Per-influencer cache of applied campaign IDs.
+
+Each influencer's entry is a sorted `array('q')` of campaign IDs
+serialized with `tobytes()`: 8 bytes per application, membership via
+binary search. The entry key carries the influencer's version
+(`proposals:applied:<influencer_id>:<version>`, the version itself kept
+under `proposals:applied:<influencer_id>`).
+
+A miss reads the version first, loads the set from the primary (replica
+lag must not hide a fresh application) and stores it with `cache.add()`,
+so it never overwrites an entry. Every write to the influencer's proposals
+bumps the version after commit instead of patching the set: a load that
+raced the write stored its set under the old version, which no read uses
+any more. The (campaign, influencer) unique constraint stays the source of
+truth for duplicate inserts, so a stale entry can never create a second
+proposal.
+
+The bump must reach every worker, so the cache is only used with a shared
+backend (APPLIED_CAMPAIGNS_CACHE_ENABLED, on by default when CACHE_URL is
+shared; checked by apps.proposals.checks). Otherwise every lookup queries
+`proposals` on the primary.
+"""
+
+import time
+from array import array
+from bisect import bisect_left
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.common.routers import read_from_primary
+
+from .models import Proposal
+
+
+def applied_campaigns_version_key(influencer_id: int) -> str:
+    return f'proposals:applied:{influencer_id}'
+
+
+def applied_campaigns_cache_key(influencer_id: int, version: int) -> str:
+    return f'proposals:applied:{influencer_id}:{version}'
+
+
+def get_applied_campaigns_version(influencer_id: int) -> int:
+    """Current version of the influencer's applied set (initialized on first use)"""
+    return cache.get_or_set(applied_campaigns_version_key(influencer_id), time.time_ns, None)
+
+
+def get_applied_campaign_ids(influencer_id: int) -> array:
+    """
+    Return the influencer's applied campaign IDs, loading them on a cache miss.
+
+    Returns:
+        array('q'): Campaign IDs in ascending order
+    """
+    if not settings.APPLIED_CAMPAIGNS_CACHE_ENABLED:
+        return _load_applied_campaign_ids(influencer_id)
+
+    # 버전을 먼저 읽어야 로드 도중 커밋된 지원이 이전 버전 항목에만 빠진다
+    key = applied_campaigns_cache_key(influencer_id, get_applied_campaigns_version(influencer_id))
+    cached = cache.get(key)
+    if cached is not None:
+        campaign_ids = array('q')
+        campaign_ids.frombytes(cached)
+        return campaign_ids
+
+    campaign_ids = _load_applied_campaign_ids(influencer_id)
+    cache.add(key, campaign_ids.tobytes(), settings.APPLIED_CAMPAIGNS_CACHE_TIMEOUT)
+    return campaign_ids
+
+
+def _load_applied_campaign_ids(influencer_id: int) -> array:
+    with read_from_primary():
+        return array('q', Proposal.objects.filter(
+            influencer_id=influencer_id
+        ).order_by('campaign_id').values_list('campaign_id', flat=True))
+
+
+def contains(campaign_ids: array, campaign_id: int) -> bool:
+    """Binary-search membership test on a sorted campaign ID array"""
+    index = bisect_left(campaign_ids, campaign_id)
+    return index < len(campaign_ids) and campaign_ids[index] == campaign_id
+
+
+def has_applied(influencer_id: int, campaign_id: int) -> bool:
+    """Whether the influencer has applied to the campaign"""
+    if not settings.APPLIED_CAMPAIGNS_CACHE_ENABLED:
+        with read_from_primary():
+            return Proposal.objects.filter(
+                influencer_id=influencer_id, campaign_id=campaign_id
+            ).exists()
+    return contains(get_applied_campaign_ids(influencer_id), campaign_id)
+
+
+def record_application(influencer_id: int) -> None:
+    """Invalidate the influencer's cached set once the transaction commits"""
+    transaction.on_commit(lambda: invalidate_applied_campaigns(influencer_id))
+
+
+def invalidate_applied_campaigns(*influencer_ids: int) -> None:
+    """Make the cached applied sets of the given influencers unreachable"""
+    if not settings.APPLIED_CAMPAIGNS_CACHE_ENABLED:
+        return
+    for influencer_id in influencer_ids:
+        key = applied_campaigns_version_key(influencer_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), None)
@@ -0,0 +1,22 @@
+"""
+System checks for the proposals app.
+"""
+
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+from config.settings.cache import is_shared_cache
+
+
+@register(Tags.caches)
+def check_applied_cache_is_shared(app_configs, **kwargs):
+    """proposals.E001: the applied campaign cache lives in a per-process cache"""
+    if not settings.APPLIED_CAMPAIGNS_CACHE_ENABLED or is_shared_cache(settings.CACHES['default']):
+        return []
+    return [Error(
+        'APPLIED_CAMPAIGNS_CACHE_ENABLED needs a cache shared by every process: an application '
+        'in one worker would not reach the applied sets cached by the others.',
+        hint='Set CACHE_URL to a shared Redis or Memcached server, '
+             'or APPLIED_CAMPAIGNS_CACHE_ENABLED=False.',
+        id='proposals.E001',
+    )]
@@ -37,6 +37,12 @@ class ProposalCreateForm(forms.Form):
         }
     )
 
+    idempotency_key = forms.CharField(
+        max_length=64,
+        required=False,
+        widget=forms.HiddenInput()
+    )
+
     def clean_cover_letter(self):
         """Validate cover letter"""
         cover_letter = self.cleaned_data.get('cover_letter')
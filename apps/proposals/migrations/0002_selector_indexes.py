@@ -0,0 +1,28 @@
+# Generated by Django 5.1.3 on 2026-10-17 22:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0004_selector_indexes'),
+        ('proposals', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['influencer', '-created_at'], name='proposals_influencer_created'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['campaign', 'status'], name='proposals_campaign_status'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['campaign', '-created_at'], name='proposals_campaign_created'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-17 23:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0002_selector_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='proposal',
+            name='idempotency_key',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True),
+        ),
+    ]
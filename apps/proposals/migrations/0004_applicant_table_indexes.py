@@ -0,0 +1,40 @@
+# Generated by Django 5.1.3 on 2026-10-17 23:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0005_campaign_recruiting_end_date_index'),
+        ('proposals', '0003_proposal_idempotency_key'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='proposal',
+            name='proposals_campaign_status',
+        ),
+        migrations.RemoveIndex(
+            model_name='proposal',
+            name='proposals_campaign_created',
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['campaign', 'status', 'created_at'], name='proposals_campaign_status_cr'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['campaign', 'created_at'], name='proposals_campaign_created'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['campaign', 'desired_visit_date'], name='proposals_campaign_visit'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['campaign', 'status', 'desired_visit_date'], name='proposals_campaign_status_vi'),
+        ),
+    ]
@@ -34,6 +34,13 @@ class Proposal(models.Model):
         choices=STATUS_CHOICES,
         default='submitted'
     )
+    # 클라이언트 재시도 식별용 (같은 키로 다시 제출하면 기존 지원을 돌려준다)
+    idempotency_key = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        editable=False
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -44,6 +51,34 @@ class Proposal(models.Model):
         verbose_name_plural = 'proposals'
         ordering = ['-created_at']
         unique_together = [['campaign', 'influencer']]
+        indexes = [
+            # 내 지원 목록 (influencer_id = ? ORDER BY created_at DESC)
+            models.Index(
+                fields=['influencer', '-created_at'],
+                name='proposals_influencer_created'
+            ),
+            # 체험단별 상태 필터 (campaign_id = ? AND status = ?),
+            # 상태별 지원자 목록 (... ORDER BY created_at)
+            models.Index(
+                fields=['campaign', 'status', 'created_at'],
+                name='proposals_campaign_status_cr'
+            ),
+            # 체험단별 지원자 목록 (campaign_id = ? ORDER BY created_at DESC, id DESC)
+            # 오름차순 인덱스를 역방향으로 읽으며 id 동률 정렬까지 인덱스로 처리한다
+            models.Index(
+                fields=['campaign', 'created_at'],
+                name='proposals_campaign_created'
+            ),
+            # 방문 희망일순 지원자 목록 (campaign_id = ? [AND status = ?] ORDER BY desired_visit_date)
+            models.Index(
+                fields=['campaign', 'desired_visit_date'],
+                name='proposals_campaign_visit'
+            ),
+            models.Index(
+                fields=['campaign', 'status', 'desired_visit_date'],
+                name='proposals_campaign_status_vi'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.influencer.name} - {self.campaign.name}"
@@ -2,6 +2,9 @@
 Service layer for proposal business logic.
 """
 
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
 from apps.common.services.base import BaseService
 from apps.common.exceptions import (
     PermissionDeniedException,
@@ -10,22 +13,38 @@ from apps.common.exceptions import (
 )
 from apps.proposals.models import Proposal
 from apps.proposals.dto import ProposalCreateDTO
+from apps.proposals.cache import (
+    has_applied,
+    invalidate_applied_campaigns,
+    record_application
+)
 from apps.campaigns.models import Campaign
 
 
 class ProposalCreationService(BaseService[ProposalCreateDTO, Proposal]):
-    """Service for creating a new proposal"""
+    """
+    Service for creating a new proposal.
+
+    The insert is attempted directly: the (campaign, influencer) unique
+    constraint decides duplicates, so concurrent submissions of the same
+    pair cannot both succeed. A client retry carrying the idempotency key
+    of the stored proposal gets that proposal back instead of an error.
+    """
 
     def execute(self, dto: ProposalCreateDTO, user=None) -> Proposal:
         """
         Create a new proposal.
 
+        Also increments the campaign's total/submitted proposal counters
+        in the same transaction.
+
         Args:
             dto: Proposal creation data
             user: User creating the proposal (must be influencer)
 
         Returns:
-            Created Proposal instance
+            Created Proposal instance, or the original proposal when
+            dto.idempotency_key matches an earlier submission
 
         Raises:
             PermissionDeniedException: If user is not an influencer
@@ -49,17 +68,54 @@ class ProposalCreationService(BaseService[ProposalCreateDTO, Proposal]):
         if not campaign.can_apply():
             raise InvalidStateException("This campaign is not currently accepting applications")
 
-        # Check for duplicate application
-        if Proposal.objects.filter(campaign=campaign, influencer=user).exists():
-            raise DuplicateActionException("You have already applied to this campaign")
+        # Known duplicate (cached applied set, no query): skip the insert.
+        # Without the cache the unique constraint below answers instead of an extra query
+        if settings.APPLIED_CAMPAIGNS_CACHE_ENABLED and has_applied(user.id, campaign.id):
+            return self._get_retried_proposal(dto, user)
 
-        # Create proposal
-        proposal = Proposal.objects.create(
-            campaign=campaign,
-            influencer=user,
-            cover_letter=dto.cover_letter,
-            desired_visit_date=dto.desired_visit_date,
-            status='submitted'
-        )
+        # Insert proposal and counters in one transaction; the unique
+        # constraint rejects a concurrent or stale-cache duplicate
+        try:
+            with transaction.atomic():
+                proposal = Proposal.objects.create(
+                    campaign=campaign,
+                    influencer=user,
+                    cover_letter=dto.cover_letter,
+                    desired_visit_date=dto.desired_visit_date,
+                    status='submitted',
+                    idempotency_key=dto.idempotency_key
+                )
+
+                # Update denormalized counters
+                Campaign.objects.filter(id=campaign.id).update(
+                    total_proposals=F('total_proposals') + 1,
+                    submitted_proposals=F('submitted_proposals') + 1
+                )
+
+                record_application(user.id)
+        except IntegrityError:
+            invalidate_applied_campaigns(user.id)
+            return self._get_retried_proposal(dto, user)
 
         return proposal
+
+    @staticmethod
+    def _get_retried_proposal(dto: ProposalCreateDTO, user) -> Proposal:
+        """
+        Resolve a duplicate submission.
+
+        Returns:
+            The stored proposal if it was created with the same idempotency key
+
+        Raises:
+            DuplicateActionException: Otherwise
+        """
+        if dto.idempotency_key:
+            proposal = Proposal.objects.filter(
+                campaign_id=dto.campaign_id,
+                influencer=user,
+                idempotency_key=dto.idempotency_key
+            ).first()
+            if proposal is not None:
+                return proposal
+        raise DuplicateActionException("You have already applied to this campaign")
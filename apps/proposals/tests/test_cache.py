@@ -0,0 +1,227 @@
+"""
+Tests for the per-influencer applied campaign cache
+"""
+
+import pytest
+from datetime import date, timedelta
+from django.core.cache import cache
+from django.urls import reverse
+from apps.campaigns.selectors.campaign_selectors import CampaignSelector
+from apps.common.exceptions import DuplicateActionException
+from apps.common.routers import REPLICA_DB_ALIAS, read_scope
+from apps.proposals.checks import check_applied_cache_is_shared
+from apps.proposals.cache import (
+    applied_campaigns_cache_key,
+    get_applied_campaign_ids,
+    get_applied_campaigns_version,
+    has_applied,
+    invalidate_applied_campaigns
+)
+from apps.proposals.dto import ProposalCreateDTO
+from apps.proposals.models import Proposal
+from apps.proposals.services.proposal_service import ProposalCreationService
+
+
+@pytest.fixture(autouse=True)
+def applied_cache(settings):
+    """공유 캐시가 설정된 배포처럼 지원 내역 캐시를 켠다"""
+    settings.APPLIED_CAMPAIGNS_CACHE_ENABLED = True
+
+
+def apply(campaign, user):
+    return ProposalCreationService().execute(ProposalCreateDTO(
+        campaign_id=campaign.id,
+        influencer_id=user.id,
+        cover_letter='지원합니다',
+        desired_visit_date=date.today() + timedelta(days=3)
+    ), user=user)
+
+
+def cached_entry(user):
+    return cache.get(applied_campaigns_cache_key(user.id, get_applied_campaigns_version(user.id)))
+
+
+@pytest.mark.django_db
+class TestAppliedCampaignCache:
+    """Tests for the cached applied campaign set"""
+
+    def test_miss_loads_sorted_ids_then_hits(
+        self, campaign_factory, influencer_user, django_assert_num_queries
+    ):
+        """첫 조회는 1개 쿼리로 정렬된 ID를 적재하고, 이후 조회는 쿼리가 없다"""
+        campaigns = [campaign_factory() for _ in range(3)]
+        for campaign in reversed(campaigns):
+            Proposal.objects.create(
+                campaign=campaign, influencer=influencer_user,
+                cover_letter='지원', desired_visit_date=date.today()
+            )
+
+        with django_assert_num_queries(1):
+            ids = get_applied_campaign_ids(influencer_user.id)
+        assert list(ids) == sorted(c.id for c in campaigns)
+
+        with django_assert_num_queries(0):
+            assert has_applied(influencer_user.id, campaigns[1].id)
+            assert not has_applied(influencer_user.id, campaigns[-1].id + 1)
+
+    def test_application_invalidates_after_commit(
+        self, campaign_factory, influencer_user, django_capture_on_commit_callbacks
+    ):
+        """지원이 커밋되면 캐시된 집합을 버리고 다음 조회에서 새로 적재한다"""
+        campaign = campaign_factory()
+        assert not has_applied(influencer_user.id, campaign.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            apply(campaign, influencer_user)
+
+        assert cached_entry(influencer_user) is None
+        assert has_applied(influencer_user.id, campaign.id)
+
+    def test_load_racing_a_commit_is_not_served(
+        self, campaign_factory, influencer_user, django_capture_on_commit_callbacks
+    ):
+        """커밋 전에 읽은 집합이 커밋 후에 저장되어도 이후 조회에 쓰이지 않는다"""
+        campaign = campaign_factory()
+        # 다른 요청이 버전을 읽고 지원 전 상태(빈 집합)를 로드한 뒤
+        stale_key = applied_campaigns_cache_key(
+            influencer_user.id, get_applied_campaigns_version(influencer_user.id)
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            apply(campaign, influencer_user)
+        # 지원이 커밋된 다음에야 저장한다
+        cache.add(stale_key, b'')
+
+        assert has_applied(influencer_user.id, campaign.id)
+
+    def test_miss_loads_from_primary(self, campaign_factory, influencer_user):
+        """selector 안(레플리카 읽기 범위)의 캐시 미스도 primary에서 적재한다"""
+        campaign = campaign_factory()
+        Proposal.objects.create(
+            campaign=campaign, influencer=influencer_user,
+            cover_letter='지원', desired_visit_date=date.today()
+        )
+
+        # 테스트에는 replica alias가 없으므로 레플리카로 읽으면 실패한다
+        with read_scope(REPLICA_DB_ALIAS):
+            assert has_applied(influencer_user.id, campaign.id)
+
+    def test_stale_entry_is_caught_by_unique_constraint(
+        self, campaign_factory, influencer_user
+    ):
+        """캐시가 오래되어도 unique 제약이 중복 지원을 막고 캐시를 비운다"""
+        campaign = campaign_factory()
+        get_applied_campaign_ids(influencer_user.id)
+        Proposal.objects.create(
+            campaign=campaign, influencer=influencer_user,
+            cover_letter='지원', desired_visit_date=date.today()
+        )
+
+        with pytest.raises(DuplicateActionException):
+            apply(campaign, influencer_user)
+
+        assert cached_entry(influencer_user) is None
+        assert Proposal.objects.filter(campaign=campaign).count() == 1
+
+    def test_invalidate_drops_entry(self, influencer_user):
+        """무효화하면 캐시 항목이 삭제된다"""
+        get_applied_campaign_ids(influencer_user.id)
+
+        invalidate_applied_campaigns(influencer_user.id)
+
+        assert cached_entry(influencer_user) is None
+
+    def test_bulk_eligibility_uses_cached_set(
+        self, campaign_factory, influencer_user, django_assert_num_queries
+    ):
+        """카드별 지원 가능 여부는 캐시가 채워지면 쿼리 없이 계산된다"""
+        applied, open_campaign = campaign_factory(), campaign_factory()
+        Proposal.objects.create(
+            campaign=applied, influencer=influencer_user,
+            cover_letter='지원', desired_visit_date=date.today()
+        )
+        get_applied_campaign_ids(influencer_user.id)
+
+        with django_assert_num_queries(0):
+            result = CampaignSelector.check_user_can_apply_bulk(
+                [applied, open_campaign], influencer_user
+            )
+
+        assert result[applied.id]['already_applied'] is True
+        assert result[open_campaign.id]['can_apply'] is True
+
+    def test_apply_page_answers_from_cache(
+        self, client, campaign_factory, influencer_user
+    ):
+        """지원 페이지는 캐시된 집합으로 중복 지원을 판단한다"""
+        campaign = campaign_factory()
+        Proposal.objects.create(
+            campaign=campaign, influencer=influencer_user,
+            cover_letter='지원', desired_visit_date=date.today()
+        )
+        client.force_login(influencer_user)
+
+        response = client.get(reverse('proposals:apply', kwargs={'pk': campaign.id}))
+
+        assert response.status_code == 302
+        assert response.url == reverse('proposals:my_proposals')
+        assert cached_entry(influencer_user) is not None
+
+
+@pytest.mark.django_db
+class TestAppliedCampaignCacheDisabled:
+    """Without a shared cache every lookup reads the database"""
+
+    @pytest.fixture(autouse=True)
+    def applied_cache(self, settings):
+        settings.APPLIED_CAMPAIGNS_CACHE_ENABLED = False
+
+    def test_lookups_query_without_caching(
+        self, campaign_factory, influencer_user, django_assert_num_queries
+    ):
+        """캐시가 꺼져 있으면 매번 DB에서 조회하고 캐시에 저장하지 않는다"""
+        campaign = campaign_factory()
+        assert not has_applied(influencer_user.id, campaign.id)
+
+        # 다른 워커가 지원을 저장한 것처럼 서비스를 거치지 않고 만든다
+        Proposal.objects.create(
+            campaign=campaign, influencer=influencer_user,
+            cover_letter='지원', desired_visit_date=date.today()
+        )
+
+        with django_assert_num_queries(1):
+            assert has_applied(influencer_user.id, campaign.id)
+        with django_assert_num_queries(1):
+            assert list(get_applied_campaign_ids(influencer_user.id)) == [campaign.id]
+        assert cached_entry(influencer_user) is None
+
+    def test_duplicate_is_rejected_by_constraint(self, campaign_factory, influencer_user):
+        """캐시가 꺼져 있어도 중복 지원은 unique 제약으로 막힌다"""
+        campaign = campaign_factory()
+        apply(campaign, influencer_user)
+
+        with pytest.raises(DuplicateActionException):
+            apply(campaign, influencer_user)
+
+
+class TestAppliedCacheCheck:
+    """Tests for the proposals.E001 system check"""
+
+    def test_enabled_on_per_process_cache_is_refused(self, settings):
+        """프로세스별 캐시(LocMem)에서 지원 내역 캐시를 켜면 오류다"""
+        assert [error.id for error in check_applied_cache_is_shared(None)] == ['proposals.E001']
+
+    def test_enabled_on_shared_cache_passes(self, settings):
+        """공유 캐시(Redis)에서는 통과한다"""
+        settings.CACHES = {'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': 'redis://localhost:6379/0',
+        }}
+
+        assert check_applied_cache_is_shared(None) == []
+
+    def test_disabled_passes(self, settings):
+        """캐시를 끄면 통과한다"""
+        settings.APPLIED_CAMPAIGNS_CACHE_ENABLED = False
+
+        assert check_applied_cache_is_shared(None) == []
@@ -0,0 +1,32 @@
+"""
+Query budget tests for proposal views.
+
+Each budget holds for every data size; a query count that grows with the
+number of proposals (N+1) fails.
+"""
+
+import pytest
+from django.urls import reverse
+
+DATA_SIZES = [1, 10, 100]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('size', DATA_SIZES)
+class TestProposalViewQueryBudgets:
+    """Query budgets for proposal views"""
+
+    def test_my_proposals_list_view(
+        self, size, client, campaign_factory, influencer_user,
+        proposal_bulk_factory, assert_max_queries
+    ):
+        """내 지원 목록: 세션 + 사용자 + 지원 목록 + 빈 상태 확인"""
+        campaigns = [campaign_factory(name=f'Campaign {i}') for i in range(size)]
+        proposal_bulk_factory((campaign, influencer_user) for campaign in campaigns)
+        client.force_login(influencer_user)
+
+        with assert_max_queries(4):
+            response = client.get(reverse('proposals:my_proposals'))
+
+        assert response.status_code == 200
+        assert len(response.context['proposals']) == size
@@ -0,0 +1,39 @@
+"""
+Query plan tests: every proposal selector access path must be index-backed.
+"""
+
+import pytest
+from datetime import date, timedelta
+from apps.proposals.models import Proposal
+from apps.proposals.selectors.proposal_selector import ProposalSelector
+
+
+@pytest.fixture
+def proposal(campaign_factory, influencer_user):
+    """Submitted proposal fixture"""
+    return Proposal.objects.create(
+        campaign=campaign_factory(),
+        influencer=influencer_user,
+        cover_letter='Cover letter',
+        desired_visit_date=date.today() + timedelta(days=1)
+    )
+
+
+@pytest.mark.django_db
+class TestProposalSelectorQueryPlans:
+    """Proposal selectors (proposal_selector.py)"""
+
+    def test_get_influencer_proposals(self, proposal, assert_no_full_table_scan):
+        assert_no_full_table_scan(ProposalSelector.get_influencer_proposals, proposal.influencer_id)
+
+    def test_get_proposal_count_by_status(self, proposal, assert_no_full_table_scan):
+        assert_no_full_table_scan(ProposalSelector.get_proposal_count_by_status, proposal.influencer_id)
+
+    def test_get_proposals_by_influencer(self, proposal, assert_no_full_table_scan):
+        assert_no_full_table_scan(ProposalSelector.get_proposals_by_influencer, proposal.influencer_id)
+
+    def test_get_proposals_by_campaign(self, proposal, assert_no_full_table_scan):
+        assert_no_full_table_scan(ProposalSelector.get_proposals_by_campaign, proposal.campaign_id)
+
+    def test_get_selected_proposals(self, proposal, assert_no_full_table_scan):
+        assert_no_full_table_scan(ProposalSelector.get_selected_proposals, proposal.campaign_id)
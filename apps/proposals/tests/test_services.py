@@ -3,12 +3,22 @@ Unit tests for proposal services.
 """
 
 import pytest
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import OperationalError, connection
 
 from apps.proposals.services.proposal_service import ProposalCreationService
 from apps.proposals.dto import ProposalCreateDTO
 from apps.proposals.models import Proposal
+from apps.proposals.cache import (
+    applied_campaigns_cache_key,
+    get_applied_campaign_ids,
+    get_applied_campaigns_version
+)
 from apps.campaigns.models import Campaign
 from apps.common.exceptions import (
     PermissionDeniedException,
@@ -65,6 +75,11 @@ class TestProposalCreationService:
         assert proposal.cover_letter == 'I want to participate!'
         assert proposal.status == 'submitted'
 
+        # Campaign counters are incremented
+        campaign.refresh_from_db()
+        assert campaign.total_proposals == 1
+        assert campaign.submitted_proposals == 1
+
     def test_create_proposal_unauthenticated_user(self, db):
         """Test that unauthenticated user cannot create proposal"""
         dto = ProposalCreateDTO(
@@ -202,3 +217,117 @@ class TestProposalCreationService:
             service.execute(dto, user=influencer_user)
 
         assert "already applied" in str(exc_info.value)
+
+
+@pytest.mark.django_db
+class TestProposalCreationIdempotency:
+    """Constraint-driven insert and idempotency key handling"""
+
+    def _dto(self, campaign, user, key=None):
+        return ProposalCreateDTO(
+            campaign_id=campaign.id,
+            influencer_id=user.id,
+            cover_letter='지원합니다',
+            desired_visit_date=date.today() + timedelta(days=3),
+            idempotency_key=key
+        )
+
+    def test_retry_with_same_key_returns_original(self, campaign_factory, influencer_user):
+        """같은 키로 재시도하면 기존 지원을 돌려주고 카운터는 그대로다"""
+        campaign = campaign_factory()
+        service = ProposalCreationService()
+
+        first = service.execute(self._dto(campaign, influencer_user, 'key-1'), user=influencer_user)
+        retried = service.execute(self._dto(campaign, influencer_user, 'key-1'), user=influencer_user)
+
+        assert retried.id == first.id
+        campaign.refresh_from_db()
+        assert campaign.total_proposals == 1
+        assert campaign.submitted_proposals == 1
+
+    def test_retry_with_other_key_is_duplicate(self, campaign_factory, influencer_user):
+        """다른 키로 다시 제출하면 중복 지원이다"""
+        campaign = campaign_factory()
+        service = ProposalCreationService()
+        service.execute(self._dto(campaign, influencer_user, 'key-1'), user=influencer_user)
+
+        with pytest.raises(DuplicateActionException):
+            service.execute(self._dto(campaign, influencer_user, 'key-2'), user=influencer_user)
+
+    def test_stale_cache_retry_returns_original(self, campaign_factory, influencer_user, settings):
+        """캐시에 없는 상태에서 unique 제약에 걸려도 같은 키면 기존 지원을 돌려준다"""
+        settings.APPLIED_CAMPAIGNS_CACHE_ENABLED = True
+        campaign = campaign_factory()
+        original = Proposal.objects.create(
+            campaign=campaign, influencer=influencer_user, cover_letter='지원',
+            desired_visit_date=date.today(), idempotency_key='key-1'
+        )
+        # 지원 내역이 비어 있는 stale 캐시 항목
+        cache.set(applied_campaigns_cache_key(
+            influencer_user.id, get_applied_campaigns_version(influencer_user.id)
+        ), b'')
+
+        retried = ProposalCreationService().execute(
+            self._dto(campaign, influencer_user, 'key-1'), user=influencer_user
+        )
+
+        assert retried.id == original.id
+
+    def test_create_runs_no_existence_query(
+        self, campaign_factory, influencer_user, django_assert_num_queries
+    ):
+        """지원 생성은 체험단 조회, 지원 INSERT, 카운터 UPDATE 외에 조회하지 않는다"""
+        campaign = campaign_factory()
+        get_applied_campaign_ids(influencer_user.id)
+
+        # SAVEPOINT/RELEASE (테스트 트랜잭션 안) + SELECT + INSERT + UPDATE
+        with django_assert_num_queries(5):
+            ProposalCreationService().execute(self._dto(campaign, influencer_user), user=influencer_user)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestProposalCreationConcurrency:
+    """Parallel submissions of the same (campaign, influencer) pair"""
+
+    def test_parallel_submissions_create_one_proposal(self, campaign_factory, influencer_user):
+        """동시에 제출해도 지원은 하나만 생성되고 나머지는 중복으로 처리된다"""
+        campaign = campaign_factory()
+        workers = 4
+        barrier = threading.Barrier(workers)
+
+        def execute(key):
+            # 테스트용 in-memory SQLite는 shared cache라 잠금 충돌이 busy_timeout
+            # 대기 없이 바로 실패한다. 운영 DB의 busy handler처럼 다시 시도한다.
+            for _ in range(200):
+                try:
+                    return ProposalCreationService().execute(ProposalCreateDTO(
+                        campaign_id=campaign.id,
+                        influencer_id=influencer_user.id,
+                        cover_letter='동시 지원',
+                        desired_visit_date=date.today() + timedelta(days=3),
+                        idempotency_key=key
+                    ), user=influencer_user)
+                except OperationalError as e:
+                    if 'locked' not in str(e):
+                        raise
+                    time.sleep(0.005)
+            raise AssertionError('database stayed locked')
+
+        def submit(key):
+            try:
+                barrier.wait()
+                execute(key)
+                return 'created'
+            except DuplicateActionException:
+                return 'duplicate'
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(submit, [f'key-{i}' for i in range(workers)]))
+
+        assert sorted(results) == ['created'] + ['duplicate'] * (workers - 1)
+        assert Proposal.objects.filter(campaign=campaign).count() == 1
+        campaign.refresh_from_db()
+        assert campaign.total_proposals == 1
+        assert campaign.submitted_proposals == 1
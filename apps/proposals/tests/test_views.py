@@ -437,3 +437,35 @@ class TestProposalCreateView:
             influencer=influencer_user
         ).exists()
 
+
+    def test_get_proposal_form_includes_idempotency_key(
+        self, client, influencer_user, campaign_factory
+    ):
+        """지원 폼에 재시도 식별용 hidden 키가 포함된다"""
+        client.force_login(influencer_user)
+        campaign = campaign_factory()
+
+        response = client.get(reverse('proposals:apply', kwargs={'pk': campaign.id}))
+
+        key = response.context['form'].initial['idempotency_key']
+        assert len(key) == 32
+        assert f'name="idempotency_key" value="{key}"' in response.content.decode('utf-8')
+
+    def test_double_submit_with_same_key_succeeds_once(
+        self, client, influencer_user, campaign_factory
+    ):
+        """같은 키로 두 번 제출해도 지원은 하나이고 두 응답 모두 성공이다"""
+        client.force_login(influencer_user)
+        campaign = campaign_factory()
+        url = reverse('proposals:apply', kwargs={'pk': campaign.id})
+        data = {
+            'cover_letter': '지원합니다',
+            'desired_visit_date': (date.today() + timedelta(days=3)).isoformat(),
+            'idempotency_key': 'a' * 32,
+        }
+
+        client.post(url, data)
+        response = client.post(url, data, follow=True)
+
+        assert Proposal.objects.filter(campaign=campaign, influencer=influencer_user).count() == 1
+        assert '성공적으로 완료' in str(list(response.context['messages'])[-1])
@@ -2,6 +2,8 @@
 Views for proposals app.
 """
 
+import uuid
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.views.generic import ListView
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -12,7 +14,7 @@ from django.core.exceptions import PermissionDenied
 from apps.users.permissions import InfluencerRequiredMixin
 from apps.campaigns.models import Campaign
 from .selectors.proposal_selector import ProposalSelector
-from .models import Proposal
+from .cache import has_applied
 from .forms import ProposalCreateForm
 from .dto import ProposalCreateDTO
 from .services.proposal_service import ProposalCreationService
@@ -72,10 +74,7 @@ class ProposalCreateView(LoginRequiredMixin, View):
         campaign = get_object_or_404(Campaign, pk=pk)
 
         # Check if already applied
-        already_applied = Proposal.objects.filter(
-            campaign_id=pk,
-            influencer_id=request.user.id
-        ).exists()
+        already_applied = has_applied(request.user.id, pk)
 
         if already_applied:
             messages.warning(request, "이미 지원한 체험단입니다.")
@@ -86,8 +85,8 @@ class ProposalCreateView(LoginRequiredMixin, View):
             messages.error(request, "모집이 종료된 체험단입니다.")
             return redirect('campaigns:detail', pk=pk)
 
-        # Create form
-        form = ProposalCreateForm()
+        # Create form (재시도/중복 클릭을 같은 지원으로 묶는 키)
+        form = ProposalCreateForm(initial={'idempotency_key': uuid.uuid4().hex})
 
         context = {
             'campaign': campaign,
@@ -116,6 +115,7 @@ class ProposalCreateView(LoginRequiredMixin, View):
             influencer_id=request.user.id,
             cover_letter=form.cleaned_data['cover_letter'],
             desired_visit_date=form.cleaned_data['desired_visit_date'],
+            idempotency_key=form.cleaned_data['idempotency_key'] or None,
         )
 
         # Execute service
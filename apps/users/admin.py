@@ -4,6 +4,7 @@ Admin configuration for users app.
 
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from .cache import invalidate_auth_user
 from .models import User, AdvertiserProfile, InfluencerProfile
 
 
@@ -32,6 +33,23 @@ class UserAdmin(BaseUserAdmin):
 
     readonly_fields = ['created_at', 'updated_at']
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # 광고주 이름은 홈 목록 카드에 복사되어 있다
+        if change and 'name' in form.changed_data and obj.role == 'advertiser':
+            from apps.campaigns.listing import refresh_advertiser_listing_cards
+            refresh_advertiser_listing_cards(obj.id, obj.name)
+
+    def delete_model(self, request, obj):
+        user_id = obj.id
+        super().delete_model(request, obj)
+        invalidate_auth_user(user_id)
+
+    def delete_queryset(self, request, queryset):
+        user_ids = list(queryset.values_list('id', flat=True))
+        super().delete_queryset(request, queryset)
+        invalidate_auth_user(*user_ids)
+
 
 @admin.register(AdvertiserProfile)
 class AdvertiserProfileAdmin(admin.ModelAdmin):
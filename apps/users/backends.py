@@ -0,0 +1,20 @@
+"""
+Authentication backends.
+"""
+
+from django.contrib.auth.backends import ModelBackend
+
+from .cache import get_auth_user
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    ModelBackend whose per-request user lookup is served from the auth cache.
+
+    Login (authenticate) still checks the password against the database;
+    only get_user(), which runs on every authenticated request, is cached.
+    """
+
+    def get_user(self, user_id):
+        user = get_auth_user(user_id)
+        return user if user is not None and self.user_can_authenticate(user) else None
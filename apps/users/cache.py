@@ -0,0 +1,79 @@
+"""
+Cached authenticated-user lookup.
+
+AuthenticationMiddleware resolves `request.user` through the session's
+auth backend on every request. CachedModelBackend reads a snapshot
+(`users:auth:<id>`) instead of the `users` row: the fields every page
+needs (id, name, role, is_active, is_staff, is_superuser) plus the
+session auth hash, so the session's password-change check still runs
+without loading the password.
+
+Users built from a snapshot have every other field deferred: reading one
+(e.g. `contact`) loads it on demand, and save() writes only the loaded
+fields. The snapshot is dropped when the user is saved (profile edit,
+password change, deactivation), when a QuerySet.update() changes one of
+its fields or the password (bulk deactivation in the admin or shell), when
+the user is deleted in the admin, and on logout; otherwise it expires
+after AUTH_USER_CACHE_TIMEOUT seconds.
+
+Those drops must reach every worker, so CachedModelBackend is only used
+with a shared cache (CACHE_URL); the users.E002 system check refuses it
+on the per-process LocMem cache.
+"""
+
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from .models import User
+
+AUTH_USER_FIELDS = ('id', 'name', 'role', 'is_active', 'is_staff', 'is_superuser')
+
+
+def auth_user_cache_key(user_id: int) -> str:
+    return f'users:auth:{user_id}'
+
+
+def get_auth_user(user_id) -> Optional[User]:
+    """
+    Return the user for an authenticated session, loading it on a cache miss.
+
+    Args:
+        user_id: Primary key as stored in the session
+
+    Returns:
+        User with AUTH_USER_FIELDS loaded, or None if the user does not exist
+    """
+    user_id = User._meta.pk.to_python(user_id)
+    key = auth_user_cache_key(user_id)
+
+    cached = cache.get(key)
+    if cached is not None:
+        snapshot, session_auth_hash = cached
+        # from_db()는 값을 모델 필드 순서대로 받는다
+        field_names = [
+            field.attname for field in User._meta.concrete_fields if field.attname in snapshot
+        ]
+        user = User.from_db(
+            DEFAULT_DB_ALIAS, field_names, [snapshot[name] for name in field_names]
+        )
+        user.cached_session_auth_hash = session_auth_hash
+        return user
+
+    user = User._default_manager.filter(pk=user_id).only(*AUTH_USER_FIELDS, 'password').first()
+    if user is None:
+        return None
+
+    cache.set(
+        key,
+        ({field: getattr(user, field) for field in AUTH_USER_FIELDS}, user.get_session_auth_hash()),
+        settings.AUTH_USER_CACHE_TIMEOUT
+    )
+    return user
+
+
+def invalidate_auth_user(*user_ids: int) -> None:
+    """Drop cached auth snapshots of the given users"""
+    cache.delete_many([auth_user_cache_key(user_id) for user_id in user_ids])
@@ -0,0 +1,42 @@
+"""
+System checks for the users app.
+"""
+
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+from config.settings.cache import is_shared_cache
+
+CACHED_SESSION_ENGINES = (
+    'django.contrib.sessions.backends.cache',
+    'django.contrib.sessions.backends.cached_db',
+)
+CACHED_AUTH_BACKEND = 'apps.users.backends.CachedModelBackend'
+
+
+@register(Tags.caches)
+def check_auth_cache_is_shared(app_configs, **kwargs):
+    """
+    users.E001: sessions are cached in a per-process cache
+    users.E002: CachedModelBackend snapshots live in a per-process cache
+    """
+    if is_shared_cache(settings.CACHES['default']):
+        return []
+
+    errors = []
+    hint = 'Set CACHE_URL to a shared Redis or Memcached server, or use the database.'
+    if settings.SESSION_ENGINE in CACHED_SESSION_ENGINES:
+        errors.append(Error(
+            f"SESSION_ENGINE '{settings.SESSION_ENGINE}' needs a cache shared by every process: "
+            'a logout in one worker would not end the session in the others.',
+            hint=hint + " (SESSION_ENGINE='django.contrib.sessions.backends.db')",
+            id='users.E001',
+        ))
+    if CACHED_AUTH_BACKEND in settings.AUTHENTICATION_BACKENDS:
+        errors.append(Error(
+            f'{CACHED_AUTH_BACKEND} needs a cache shared by every process: deactivation and '
+            'password changes would not reach the other workers.',
+            hint=hint + " (AUTHENTICATION_BACKENDS=['django.contrib.auth.backends.ModelBackend'])",
+            id='users.E002',
+        ))
+    return errors
@@ -8,7 +8,7 @@ from typing import Optional
 from apps.common.dto.base import BaseDTO
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignupDTO(BaseDTO):
     """
     Data transfer object for user signup.
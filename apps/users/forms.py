@@ -6,7 +6,7 @@ from django import forms
 from django.core.exceptions import ValidationError
 from datetime import date
 import re
-from .models import User, AdvertiserProfile
+from .selectors.user_selector import DUPLICATE_MESSAGES, UserSelector
 
 
 class SignupForm(forms.Form):
@@ -98,20 +98,6 @@ class SignupForm(forms.Form):
         })
     )
 
-    def clean_email(self):
-        """이메일 중복 검증"""
-        email = self.cleaned_data.get('email')
-        if User.objects.filter(email=email).exists():
-            raise ValidationError('이미 가입된 이메일입니다.')
-        return email
-
-    def clean_contact(self):
-        """연락처 중복 검증"""
-        contact = self.cleaned_data.get('contact')
-        if User.objects.filter(contact=contact).exists():
-            raise ValidationError('이미 가입된 연락처입니다.')
-        return contact
-
     def clean_password(self):
         """비밀번호 강도 검증"""
         password = self.cleaned_data.get('password')
@@ -125,7 +111,7 @@ class SignupForm(forms.Form):
         return password
 
     def clean_business_registration_number(self):
-        """사업자등록번호 형식 및 중복 검증"""
+        """사업자등록번호 형식 검증 (중복은 clean()에서)"""
         number = self.cleaned_data.get('business_registration_number')
         role = self.data.get('role')
 
@@ -141,10 +127,6 @@ class SignupForm(forms.Form):
         if not re.match(pattern, number):
             raise ValidationError('사업자등록번호는 XXX-XX-XXXXX 형식이어야 합니다.')
 
-        # 중복 검증
-        if AdvertiserProfile.objects.filter(business_registration_number=number).exists():
-            raise ValidationError('이미 등록된 사업자등록번호입니다.')
-
         return number
 
     def clean_birth_date(self):
@@ -195,8 +177,20 @@ class SignupForm(forms.Form):
         return terms_agreed
 
     def clean(self):
-        """전체 폼 검증 (비밀번호 일치 확인)"""
+        """전체 폼 검증 (중복 확인, 비밀번호 일치 확인)"""
         cleaned_data = super().clean()
+
+        # 이메일/연락처/사업자등록번호 중복을 한 번의 쿼리로 확인한다
+        conflicts = UserSelector.find_signup_conflicts(
+            email=cleaned_data.get('email'),
+            contact=cleaned_data.get('contact'),
+            business_registration_number=(
+                cleaned_data.get('business_registration_number')
+                if cleaned_data.get('role') == 'advertiser' else None
+            )
+        )
+        for field in conflicts:
+            self.add_error(field, DUPLICATE_MESSAGES[field])
         password = cleaned_data.get('password')
         password_confirm = cleaned_data.get('password_confirm')
 
@@ -0,0 +1,74 @@
+"""
+Password hashers with per-deployment cost parameters.
+
+PASSWORD_HASHERS lists these (the PASSWORD_HASHER algorithm first, see
+config/settings/base.py). Each reads its cost from settings, and hashes
+through the bounded pool (apps.users.hashing).
+
+The algorithm names match Django's hashers, so existing hashes keep
+verifying. A hash made with another algorithm or other parameters than
+the current policy is re-hashed on the user's next successful login
+(check_password's setter via must_update()), so raising the cost or
+switching algorithm needs no migration.
+
+Argon2 needs the argon2-cffi package; scrypt and PBKDF2 use hashlib.
+"""
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+from .hashing import run_bounded
+
+
+class BoundedHashingMixin:
+    """Compute encode() and verify() on the bounded hashing pool"""
+
+    def encode(self, password, salt, *args, **kwargs):
+        return run_bounded(super().encode, password, salt, *args, **kwargs)
+
+    def verify(self, password, encoded):
+        return run_bounded(super().verify, password, encoded)
+
+
+class ScryptPasswordHasher(BoundedHashingMixin, hashers.ScryptPasswordHasher):
+    """scrypt (N, r, p) from PASSWORD_SCRYPT_*"""
+
+    # 한도일 뿐 실제로는 128 * N * r 바이트를 쓴다. OpenSSL 기본 한도(32MB)는 N=2**15부터 부족하고,
+    # 현재 설정보다 비용이 큰 기존 해시도 검증해야 하므로 넉넉히 둔다
+    maxmem = 2**30
+
+    @property
+    def work_factor(self):
+        return settings.PASSWORD_SCRYPT_WORK_FACTOR
+
+    @property
+    def block_size(self):
+        return settings.PASSWORD_SCRYPT_BLOCK_SIZE
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_SCRYPT_PARALLELISM
+
+
+class Argon2PasswordHasher(BoundedHashingMixin, hashers.Argon2PasswordHasher):
+    """Argon2id (time cost, memory cost in KiB, lanes) from PASSWORD_ARGON2_*"""
+
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_ARGON2_PARALLELISM
+
+
+class PBKDF2PasswordHasher(BoundedHashingMixin, hashers.PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with PASSWORD_PBKDF2_ITERATIONS"""
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_PBKDF2_ITERATIONS
@@ -0,0 +1,89 @@
+"""
+Bounded executor for password hashing.
+
+Every hash computed by the configured hashers (apps.users.hashers) - on
+signup, login, password change and the dummy hash ModelBackend runs for
+unknown emails - runs on a per-process pool of PASSWORD_HASHING_WORKERS
+threads. hashlib and argon2 release the GIL while hashing, so with a
+threaded server (gunicorn --threads) a burst of logins keeps at most that
+many cores busy and the remaining request threads keep rendering pages.
+
+A hash that cannot start within PASSWORD_HASHING_QUEUE_TIMEOUT seconds is
+cancelled and ServiceUnavailableException is raised, so requests fail
+fast instead of queueing behind the burst. PASSWORD_HASHING_WORKERS = 0
+hashes inline on the calling thread.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from apps.common.exceptions import ServiceUnavailableException
+
+T = TypeVar('T')
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# 풀 스레드 표시: 풀 안에서 다시 해싱하면(verify -> encode) 그 자리에서 실행한다
+_worker = threading.local()
+
+
+def _mark_worker() -> None:
+    _worker.active = True
+
+
+def get_hashing_executor() -> ThreadPoolExecutor:
+    """Return this process's hashing pool, starting it on first use (after fork)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.PASSWORD_HASHING_WORKERS,
+                    thread_name_prefix='password-hashing',
+                    initializer=_mark_worker
+                )
+    return _executor
+
+
+def shutdown_hashing_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def run_bounded(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a hashing function on the bounded pool and wait for its result.
+
+    Raises:
+        ServiceUnavailableException: If no worker picked the hash up within
+            PASSWORD_HASHING_QUEUE_TIMEOUT seconds
+    """
+    if settings.PASSWORD_HASHING_WORKERS <= 0 or getattr(_worker, 'active', False):
+        return func(*args, **kwargs)
+
+    started = threading.Event()
+
+    def task():
+        started.set()
+        return func(*args, **kwargs)
+
+    future = get_hashing_executor().submit(task)
+    # 대기열에서 기다리는 시간만 제한하고, 시작한 해싱은 끝까지 기다린다
+    if not started.wait(settings.PASSWORD_HASHING_QUEUE_TIMEOUT) and future.cancel():
+        raise ServiceUnavailableException('요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해주세요.')
+    return future.result()
+
+
+@receiver(setting_changed)
+def _reset_hashing_executor(*, setting, **kwargs):
+    if setting == 'PASSWORD_HASHING_WORKERS':
+        shutdown_hashing_executor()
@@ -2,11 +2,29 @@
 User models for authentication and profile management.
 """
 
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 
 
-class UserManager(BaseUserManager):
+class UserQuerySet(models.QuerySet):
+    """User QuerySet whose update() keeps the auth cache (apps.users.cache) in step"""
+
+    def update(self, **kwargs):
+        # 일괄 비활성화(관리자 액션, 셸)나 비밀번호/권한 변경은 save()를 거치지 않으므로
+        # 바뀌는 사용자의 인증 스냅샷을 여기서 지운다 (bulk_update도 update()를 거친다)
+        from .cache import AUTH_USER_FIELDS, invalidate_auth_user
+
+        if not {*AUTH_USER_FIELDS, 'password'} & kwargs.keys():
+            return super().update(**kwargs)
+
+        user_ids = list(self.values_list('pk', flat=True))
+        rows = super().update(**kwargs)
+        invalidate_auth_user(*user_ids)
+        transaction.on_commit(lambda: invalidate_auth_user(*user_ids), using=self.db)
+        return rows
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
     """Custom user manager"""
 
     def create_user(self, email, password=None, **extra_fields):
@@ -66,6 +84,28 @@ class User(AbstractBaseUser, PermissionsMixin):
     def __str__(self):
         return self.email
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        # 인증 캐시(apps.users.cache)의 스냅샷을 지운다. 커밋 전에 다른 요청이
+        # 이전 값으로 다시 채울 수 있으므로 커밋 후에도 한 번 더 지운다.
+        from .cache import invalidate_auth_user
+        invalidate_auth_user(self.pk)
+        transaction.on_commit(lambda: invalidate_auth_user(self.pk))
+
+    def get_session_auth_hash(self):
+        """
+        Return the session auth hash without loading the password when possible.
+
+        Users built from the auth cache carry the hash computed when the
+        snapshot was taken; once the password is set on the instance the
+        hash is computed from it again.
+        """
+        cached = getattr(self, 'cached_session_auth_hash', None)
+        if cached is not None and 'password' in self.get_deferred_fields():
+            return cached
+        return super().get_session_auth_hash()
+
 
 class AdvertiserProfile(models.Model):
     """Advertiser profile with company information"""
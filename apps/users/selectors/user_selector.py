@@ -0,0 +1,69 @@
+"""
+Selector layer for user queries.
+"""
+
+from typing import Optional, Set
+from django.db.models import Q
+from apps.common.selectors.base import BaseSelector
+from apps.users.models import User
+
+# 가입 시 중복될 수 없는 값의 필드별 오류 메시지
+DUPLICATE_MESSAGES = {
+    'email': '이미 가입된 이메일입니다.',
+    'contact': '이미 가입된 연락처입니다.',
+    'business_registration_number': '이미 등록된 사업자등록번호입니다.',
+}
+
+# 필드별 User 기준 조회 경로
+_SIGNUP_UNIQUE_LOOKUPS = {
+    'email': 'email',
+    'contact': 'contact',
+    'business_registration_number': 'advertiser_profile__business_registration_number',
+}
+
+
+class UserSelector(BaseSelector):
+    """Selector for user queries"""
+
+    @staticmethod
+    def find_signup_conflicts(
+        email: Optional[str] = None,
+        contact: Optional[str] = None,
+        business_registration_number: Optional[str] = None
+    ) -> Set[str]:
+        """
+        Find which signup values are already taken, in a single query.
+
+        Matches users by email OR contact OR their advertiser profile's
+        business registration number and reports the fields that collided.
+
+        Args:
+            email: Email to check (normalized like UserManager.create_user)
+            contact: Contact number to check
+            business_registration_number: Advertiser's number to check
+
+        Returns:
+            Set of colliding field names (keys of DUPLICATE_MESSAGES)
+        """
+        values = {
+            'email': User.objects.normalize_email(email) if email else None,
+            'contact': contact,
+            'business_registration_number': business_registration_number,
+        }
+        values = {field: value for field, value in values.items() if value}
+        if not values:
+            return set()
+
+        condition = Q()
+        for field, value in values.items():
+            condition |= Q(**{_SIGNUP_UNIQUE_LOOKUPS[field]: value})
+        rows = User.objects.filter(condition).values_list(
+            *(_SIGNUP_UNIQUE_LOOKUPS[field] for field in values)
+        )
+
+        return {
+            field
+            for row in rows
+            for field, found in zip(values, row)
+            if found == values[field]
+        }
@@ -2,14 +2,16 @@
 Service for user signup business logic.
 """
 
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from typing import Optional
 
 from apps.common.services.base import BaseService
-from apps.common.exceptions import DuplicateActionException
+from apps.common.exceptions import UniqueConflictException
 from ..dto import SignupDTO
 from ..models import AdvertiserProfile, InfluencerProfile
+from ..selectors.user_selector import DUPLICATE_MESSAGES, UserSelector
 
 User = get_user_model()
 
@@ -19,10 +21,15 @@ class SignupService(BaseService[SignupDTO, User]):
     Service for handling user signup.
 
     Creates a new user and associated profile based on role.
-    Uses transaction to ensure data consistency.
+    Uses transaction to ensure data consistency; the password is hashed
+    before the transaction opens (bounded pool, see apps.users.hashing).
+
+    Email and contact uniqueness is left to the unique indexes (SignupForm
+    checks them beforehand): the transaction runs only the user and
+    profile INSERTs, and a collision is looked up after the rollback to
+    report which field is taken.
     """
 
-    @transaction.atomic
     def execute(self, dto: SignupDTO, user: Optional[object] = None) -> User:
         """
         Execute user signup.
@@ -35,26 +42,38 @@ class SignupService(BaseService[SignupDTO, User]):
             Created User instance
 
         Raises:
-            DuplicateActionException: If email or contact already exists
+            UniqueConflictException: If email or contact already exists
             ValueError: If required role-specific fields are missing
+            ServiceUnavailableException: If every password hashing worker is busy
         """
-        # 1. Check for duplicates (additional safety layer)
-        if User.objects.filter(email=dto.email).exists():
-            raise DuplicateActionException("이미 가입된 이메일입니다.")
+        # 1. Hash the password outside the transaction
+        password_hash = make_password(dto.password)
+
+        # 2. Create user and profile; duplicates are rejected by the unique indexes
+        try:
+            return self._create_user(dto, password_hash)
+        except IntegrityError:
+            conflicts = UserSelector.find_signup_conflicts(email=dto.email, contact=dto.contact)
+            if not conflicts:
+                raise
+            raise UniqueConflictException({
+                field: DUPLICATE_MESSAGES[field]
+                for field in DUPLICATE_MESSAGES if field in conflicts
+            })
 
-        if User.objects.filter(contact=dto.contact).exists():
-            raise DuplicateActionException("이미 가입된 연락처입니다.")
-
-        # 2. Create User
-        new_user = User.objects.create_user(
-            email=dto.email,
-            password=dto.password,
+    @transaction.atomic
+    def _create_user(self, dto: SignupDTO, password_hash: str) -> User:
+        """Create the user with an already hashed password and its profile"""
+        # Create User
+        new_user = User.objects.create(
+            email=User.objects.normalize_email(dto.email),
+            password=password_hash,
             name=dto.name,
             contact=dto.contact,
             role=dto.role
         )
 
-        # 3. Create role-specific Profile
+        # Create role-specific Profile
         if dto.role == 'advertiser':
             if not dto.company_name or not dto.business_registration_number:
                 raise ValueError("광고주는 업체명과 사업자등록번호가 필요합니다.")
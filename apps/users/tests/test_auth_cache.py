@@ -0,0 +1,173 @@
+"""
+Tests for the cached session and authenticated user lookup (apps.users.cache)
+"""
+
+import pytest
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.test import RequestFactory
+from django.urls import reverse
+from apps.users.admin import UserAdmin
+from apps.users.cache import auth_user_cache_key, get_auth_user
+from apps.users.checks import check_auth_cache_is_shared
+from apps.users.models import User
+
+CACHED_AUTH_SETTINGS = {
+    'SESSION_ENGINE': 'django.contrib.sessions.backends.cached_db',
+    'AUTHENTICATION_BACKENDS': ['apps.users.backends.CachedModelBackend'],
+}
+
+
+@pytest.fixture(autouse=True)
+def cached_auth(settings):
+    """공유 캐시가 설정된 배포처럼 캐시된 세션과 인증 백엔드를 쓴다"""
+    for name, value in CACHED_AUTH_SETTINGS.items():
+        setattr(settings, name, value)
+
+
+def login(client, user):
+    client.post(reverse('users:login'), {'email': user.email, 'password': 'testpass123'})
+
+
+@pytest.mark.django_db
+class TestCachedAuthentication:
+    """Tests for CachedModelBackend"""
+
+    def test_logged_in_request_runs_no_auth_queries(self, client, influencer_user, django_assert_num_queries):
+        """세션과 사용자가 캐시되면 로그인 사용자의 요청에 인증 쿼리가 없다"""
+        login(client, influencer_user)
+        client.get(reverse('campaigns:home'))
+
+        # 홈 페이지 캐시 적중(목록 세대 조회만) + 세션/사용자 캐시 적중
+        with django_assert_num_queries(1):
+            response = client.get(reverse('campaigns:home'))
+
+        assert 'Test Influencer님' in response.content.decode()
+
+    def test_snapshot_user_defers_other_fields(self, influencer_user):
+        """스냅샷에서 만든 사용자는 나머지 필드를 지연 로딩하고, 저장 시 로딩된 필드만 쓴다"""
+        get_auth_user(influencer_user.pk)
+        user = get_auth_user(str(influencer_user.pk))
+
+        assert user.role == 'influencer'
+        assert {'email', 'contact', 'password'} <= user.get_deferred_fields()
+
+        user.name = '새 이름'
+        user.save()
+
+        influencer_user.refresh_from_db()
+        assert influencer_user.name == '새 이름'
+        assert influencer_user.contact == '010-9876-5432'
+        assert influencer_user.check_password('testpass123')
+
+    def test_profile_change_refreshes_snapshot(self, client, influencer_user):
+        """사용자 정보가 바뀌면 다음 요청에 반영된다"""
+        login(client, influencer_user)
+        client.get(reverse('proposals:my_proposals'))
+
+        influencer_user.name = '바뀐 이름'
+        influencer_user.save()
+
+        response = client.get(reverse('proposals:my_proposals'))
+        assert '바뀐 이름님' in response.content.decode()
+
+    def test_deactivated_user_is_logged_out(self, client, influencer_user):
+        """비활성화된 사용자는 캐시가 남아 있어도 다음 요청부터 로그아웃된다"""
+        login(client, influencer_user)
+        client.get(reverse('proposals:my_proposals'))
+
+        influencer_user.is_active = False
+        influencer_user.save()
+
+        response = client.get(reverse('proposals:my_proposals'))
+        assert response.status_code == 302
+        assert reverse('users:login') in response.url
+
+    def test_queryset_deactivation_logs_out(self, client, influencer_user):
+        """QuerySet.update()로 비활성화해도(관리자 액션, 셸) 다음 요청부터 로그아웃된다"""
+        login(client, influencer_user)
+        client.get(reverse('proposals:my_proposals'))
+
+        User.objects.filter(pk=influencer_user.pk).update(is_active=False)
+
+        response = client.get(reverse('proposals:my_proposals'))
+        assert response.status_code == 302
+        assert reverse('users:login') in response.url
+
+    def test_queryset_password_update_ends_sessions(self, client, influencer_user):
+        """QuerySet.update()로 비밀번호를 바꿔도 기존 세션은 무효가 된다"""
+        login(client, influencer_user)
+        client.get(reverse('proposals:my_proposals'))
+
+        User.objects.filter(pk=influencer_user.pk).update(password=make_password('newpass456'))
+
+        response = client.get(reverse('proposals:my_proposals'))
+        assert response.status_code == 302
+
+    def test_unrelated_queryset_update_keeps_snapshot(self, influencer_user, django_assert_num_queries):
+        """스냅샷에 없는 필드만 바꾸는 update()는 추가 쿼리 없이 스냅샷을 유지한다"""
+        get_auth_user(influencer_user.pk)
+
+        with django_assert_num_queries(1):
+            User.objects.filter(pk=influencer_user.pk).update(contact='010-0000-1111')
+
+        assert cache.get(auth_user_cache_key(influencer_user.pk)) is not None
+
+    def test_password_change_ends_other_sessions(self, client, influencer_user):
+        """비밀번호가 바뀌면 기존 세션은 무효가 된다"""
+        login(client, influencer_user)
+        client.get(reverse('proposals:my_proposals'))
+
+        influencer_user.set_password('newpass456')
+        influencer_user.save()
+
+        response = client.get(reverse('proposals:my_proposals'))
+        assert response.status_code == 302
+
+    def test_logout_drops_snapshot(self, client, influencer_user):
+        """로그아웃하면 스냅샷이 삭제된다"""
+        login(client, influencer_user)
+        client.get(reverse('proposals:my_proposals'))
+        assert cache.get(auth_user_cache_key(influencer_user.pk)) is not None
+
+        client.post(reverse('users:logout'))
+
+        assert cache.get(auth_user_cache_key(influencer_user.pk)) is None
+
+    def test_admin_delete_drops_snapshot(self, influencer_user, advertiser_user):
+        """관리자에서 사용자를 삭제하면 스냅샷도 삭제된다"""
+        get_auth_user(influencer_user.pk)
+        request = RequestFactory().post('/')
+        request.user = advertiser_user
+
+        UserAdmin(User, AdminSite()).delete_queryset(request, User.objects.filter(pk=influencer_user.pk))
+
+        assert cache.get(auth_user_cache_key(influencer_user.pk)) is None
+        assert get_auth_user(influencer_user.pk) is None
+
+
+class TestAuthCacheChecks:
+    """Tests for the users.E001 / users.E002 system checks"""
+
+    def test_cached_auth_on_per_process_cache_is_refused(self):
+        """프로세스별 캐시(LocMem)에서 캐시된 세션과 인증 백엔드를 쓰면 오류다"""
+        errors = check_auth_cache_is_shared(None)
+
+        assert [error.id for error in errors] == ['users.E001', 'users.E002']
+
+    def test_cached_auth_on_shared_cache_passes(self, settings):
+        """공유 캐시(Redis)에서는 통과한다"""
+        settings.CACHES = {'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': 'redis://localhost:6379/0',
+        }}
+
+        assert check_auth_cache_is_shared(None) == []
+
+    def test_database_sessions_on_per_process_cache_pass(self, settings):
+        """프로세스별 캐시에서는 DB 세션과 기본 인증 백엔드를 쓰면 통과한다"""
+        settings.SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+        settings.AUTHENTICATION_BACKENDS = ['django.contrib.auth.backends.ModelBackend']
+
+        assert check_auth_cache_is_shared(None) == []
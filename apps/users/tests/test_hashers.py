@@ -0,0 +1,146 @@
+"""
+Tests for the password hashing policy (apps.users.hashers) and the bounded hashing pool
+"""
+
+import threading
+import pytest
+from django.contrib.auth.hashers import check_password, identify_hasher, make_password
+from django.test import override_settings
+from django.urls import reverse
+from apps.common.exceptions import ServiceUnavailableException
+from apps.users.hashing import get_hashing_executor, run_bounded
+from apps.users.models import User
+
+
+@pytest.fixture(autouse=True)
+def cheap_scrypt(settings):
+    """테스트 속도를 위해 scrypt 비용을 낮춘다"""
+    settings.PASSWORD_SCRYPT_WORK_FACTOR = 2**10
+    settings.PASSWORD_SCRYPT_PARALLELISM = 1
+
+
+@pytest.fixture
+def blocked_pool(settings):
+    """A single-worker pool whose only worker is busy until the test ends"""
+    settings.PASSWORD_HASHING_WORKERS = 1
+    settings.PASSWORD_HASHING_QUEUE_TIMEOUT = 0.05
+    release = threading.Event()
+    running = threading.Event()
+
+    def hold():
+        running.set()
+        release.wait()
+
+    get_hashing_executor().submit(hold)
+    running.wait()
+    yield
+    release.set()
+
+
+def login(client, email, password='testpass123'):
+    return client.post(reverse('users:login'), {'email': email, 'password': password})
+
+
+class TestHashingPolicy:
+    """Tests for the configured hashers"""
+
+    def test_new_hashes_use_preferred_algorithm_and_costs(self):
+        """새 해시는 설정된 알고리즘과 비용으로 만든다"""
+        encoded = make_password('testpass123')
+
+        assert encoded.startswith('scrypt$1024$')
+        assert identify_hasher(encoded).decode(encoded)['parallelism'] == 1
+        assert check_password('testpass123', encoded)
+
+    @pytest.mark.django_db
+    def test_login_rehashes_when_costs_change(self, client):
+        """비용 설정이 바뀌면 다음 로그인 때 새 비용으로 다시 해시한다"""
+        user = User.objects.create_user(
+            email='user@test.com', password='testpass123', name='사용자',
+            contact='010-1111-2222', role='influencer'
+        )
+
+        with override_settings(PASSWORD_SCRYPT_WORK_FACTOR=2**11):
+            response = login(client, user.email)
+
+        assert response.status_code == 302
+        user.refresh_from_db()
+        assert user.password.startswith('scrypt$2048$')
+        assert user.check_password('testpass123')
+
+    @pytest.mark.django_db
+    def test_login_upgrades_legacy_pbkdf2_hash(self, client):
+        """다른 알고리즘(PBKDF2)의 해시는 로그인 때 scrypt로 바뀐다"""
+        with override_settings(PASSWORD_PBKDF2_ITERATIONS=1000):
+            user = User.objects.create(
+                email='legacy@test.com', name='기존 사용자', contact='010-3333-4444', role='influencer',
+                password=make_password('testpass123', hasher='pbkdf2_sha256')
+            )
+            login(client, user.email)
+
+        user.refresh_from_db()
+        assert identify_hasher(user.password).algorithm == 'scrypt'
+
+    @pytest.mark.django_db
+    def test_wrong_password_does_not_rehash(self, client):
+        """비밀번호가 틀리면 해시를 바꾸지 않는다"""
+        user = User.objects.create_user(
+            email='user@test.com', password='testpass123', name='사용자',
+            contact='010-1111-2222', role='influencer'
+        )
+        password = user.password
+
+        with override_settings(PASSWORD_SCRYPT_WORK_FACTOR=2**11):
+            login(client, user.email, password='wrongpass')
+
+        user.refresh_from_db()
+        assert user.password == password
+
+
+class TestBoundedHashing:
+    """Tests for apps.users.hashing"""
+
+    def test_hashes_run_on_pool_threads(self):
+        """해싱은 풀 스레드에서 실행된다"""
+        assert run_bounded(lambda: threading.current_thread().name).startswith('password-hashing')
+
+    def test_verify_on_single_worker_does_not_deadlock(self, settings):
+        """풀 안의 verify가 encode를 다시 호출해도 워커 하나로 끝난다"""
+        settings.PASSWORD_HASHING_WORKERS = 1
+        assert check_password('testpass123', make_password('testpass123'))
+
+    def test_zero_workers_hash_inline(self, settings):
+        """워커 수가 0이면 호출한 스레드에서 해싱한다"""
+        settings.PASSWORD_HASHING_WORKERS = 0
+        assert run_bounded(threading.current_thread) is threading.current_thread()
+
+    def test_saturated_pool_fails_fast(self, blocked_pool):
+        """모든 워커가 사용 중이면 대기 시간 후 ServiceUnavailableException을 던진다"""
+        with pytest.raises(ServiceUnavailableException):
+            make_password('testpass123')
+
+    @pytest.mark.django_db
+    def test_saturated_pool_login_returns_503(self, client, blocked_pool):
+        """해싱 풀이 포화되면 로그인은 503으로 응답한다"""
+        response = login(client, 'user@test.com')
+
+        assert response.status_code == 503
+        assert '잠시 후 다시 시도' in response.content.decode()
+
+    @pytest.mark.django_db
+    def test_saturated_pool_signup_returns_503_without_user(self, client, blocked_pool):
+        """해싱 풀이 포화되면 회원가입은 사용자를 만들지 않고 503으로 응답한다"""
+        response = client.post(reverse('users:signup'), {
+            'email': 'influencer@test.com',
+            'password': 'Password123',
+            'password_confirm': 'Password123',
+            'name': '인플루언서',
+            'contact': '010-1234-5678',
+            'role': 'influencer',
+            'birth_date': '1990-01-01',
+            'sns_link': 'https://blog.naver.com/test',
+            'terms_agreed': True
+        })
+
+        assert response.status_code == 503
+        assert not User.objects.filter(email='influencer@test.com').exists()
@@ -4,11 +4,12 @@ Test cases for user services following TDD approach.
 
 import pytest
 from datetime import date
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
 from apps.users.models import User, AdvertiserProfile, InfluencerProfile
 from apps.users.dto import SignupDTO
 from apps.users.services.signup_service import SignupService
-from apps.common.exceptions import DuplicateActionException
+from apps.common.exceptions import DuplicateActionException, UniqueConflictException
 
 
 @pytest.mark.django_db
@@ -181,3 +182,52 @@ class TestSignupService:
         assert isinstance(user, User)
         assert user.id is not None
         assert user.pk is not None
+
+    def test_signup_service_writes_only_user_and_profile(self):
+        """중복 확인은 유니크 인덱스에 맡기고, 트랜잭션에서는 사용자와 프로필만 INSERT한다"""
+        dto = SignupDTO(
+            email='test@test.com',
+            password='Password123',
+            name='테스트',
+            contact='010-1234-5678',
+            role='influencer',
+            birth_date=date(1990, 1, 1),
+            sns_link='https://test.com'
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            SignupService().execute(dto)
+
+        statements = [
+            query['sql'].split()[0] for query in queries.captured_queries
+            if not query['sql'].startswith(('SAVEPOINT', 'RELEASE SAVEPOINT'))
+        ]
+        assert statements == ['INSERT', 'INSERT']
+
+    def test_signup_service_maps_integrity_error_to_fields(self):
+        """유니크 인덱스 위반은 겹친 필드별 오류로 바뀐다"""
+        User.objects.create_user(
+            email='existing@test.com',
+            password='testpass123',
+            name='Existing User',
+            contact='010-1234-5678',
+            role='influencer'
+        )
+        dto = SignupDTO(
+            email='existing@test.com',
+            password='Password123',
+            name='New User',
+            contact='010-1234-5678',
+            role='influencer',
+            birth_date=date(1990, 1, 1),
+            sns_link='https://test.com'
+        )
+
+        with pytest.raises(UniqueConflictException) as exc_info:
+            SignupService().execute(dto)
+
+        assert exc_info.value.errors == {
+            'email': '이미 가입된 이메일입니다.',
+            'contact': '이미 가입된 연락처입니다.',
+        }
+        assert User.objects.filter(email='existing@test.com').count() == 1
@@ -229,3 +229,32 @@ class TestSignupFormValidation:
         form = SignupForm(data=form_data)
         assert not form.is_valid()
         assert 'business_registration_number' in form.errors
+
+    def test_signup_form_checks_duplicates_in_one_query(self, django_assert_num_queries):
+        """이메일/연락처/사업자등록번호 중복은 한 번의 쿼리로 확인하고, 겹친 필드마다 오류를 표시한다"""
+        User.objects.create_user(
+            email='existing@example.com',
+            password='testpass123',
+            name='Existing User',
+            contact='010-0000-0000',
+            role='influencer'
+        )
+        form_data = {
+            'email': 'existing@EXAMPLE.com',
+            'password': 'Password123',
+            'password_confirm': 'Password123',
+            'name': '새 광고주',
+            'contact': '010-0000-0000',
+            'role': 'advertiser',
+            'company_name': '새 회사',
+            'business_registration_number': '123-45-67890',
+            'terms_agreed': True
+        }
+        form = SignupForm(data=form_data)
+
+        with django_assert_num_queries(1):
+            assert not form.is_valid()
+
+        assert form.errors['email'] == ['이미 가입된 이메일입니다.']
+        assert form.errors['contact'] == ['이미 가입된 연락처입니다.']
+        assert 'business_registration_number' not in form.errors
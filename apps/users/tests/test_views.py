@@ -6,6 +6,7 @@ import pytest
 from django.urls import reverse
 from django.test import Client
 from apps.users.models import User, AdvertiserProfile, InfluencerProfile
+from apps.users.selectors.user_selector import UserSelector
 
 
 @pytest.mark.django_db
@@ -156,3 +157,38 @@ class TestSignupView:
         assert response.status_code == 200
         assert 'form' in response.context
         assert 'email' in response.context['form'].errors
+
+    def test_signup_view_conflict_after_validation_shows_field_error(self, client: Client, monkeypatch):
+        """폼 검증 뒤 다른 가입이 먼저 저장돼도 겹친 필드에 오류를 표시한다"""
+        User.objects.create_user(
+            email='existing@test.com',
+            password='testpass123',
+            name='Existing User',
+            contact='010-0000-0000',
+            role='influencer'
+        )
+        # 폼의 중복 확인(첫 조회) 시점에는 아직 저장되지 않았던 것처럼 만든다
+        find_conflicts = UserSelector.find_signup_conflicts
+        calls = []
+
+        def find_after_validation(**kwargs):
+            calls.append(kwargs)
+            return find_conflicts(**kwargs) if len(calls) > 1 else set()
+
+        monkeypatch.setattr(UserSelector, 'find_signup_conflicts', staticmethod(find_after_validation))
+
+        response = client.post('/accounts/signup/', {
+            'email': 'existing@test.com',
+            'password': 'Password123',
+            'password_confirm': 'Password123',
+            'name': '새 사용자',
+            'contact': '010-1111-1111',
+            'role': 'influencer',
+            'birth_date': '1990-01-01',
+            'sns_link': 'https://test.com',
+            'terms_agreed': True
+        })
+
+        assert response.status_code == 200
+        assert response.context['form'].errors['email'] == ['이미 가입된 이메일입니다.']
+        assert 'contact' not in response.context['form'].errors
@@ -2,12 +2,16 @@
 Views for user authentication and registration.
 """
 
+from django.conf import settings
 from django.shortcuts import render, redirect
 from django.views import View
 from django.contrib.auth import login, logout, authenticate
 from django.contrib import messages
 
-from apps.common.exceptions import DuplicateActionException
+from apps.common.exceptions import (
+    DuplicateActionException, ServiceUnavailableException, UniqueConflictException
+)
+from .cache import invalidate_auth_user
 from .forms import SignupForm
 from .dto import SignupDTO
 from .services.signup_service import SignupService
@@ -57,7 +61,7 @@ class SignupView(View):
             user = service.execute(dto)
 
             # Auto login
-            login(request, user, backend='django.contrib.auth.backends.ModelBackend')
+            login(request, user, backend=settings.AUTHENTICATION_BACKENDS[0])
 
             messages.success(request, '회원가입이 완료되었습니다.')
 
@@ -67,9 +71,17 @@ class SignupView(View):
             else:
                 return redirect('campaigns:home')
 
+        except UniqueConflictException as e:
+            # 검증 후 다른 가입이 먼저 들어온 경우: 겹친 필드에 오류를 표시한다
+            for field, message in e.errors.items():
+                form.add_error(field, message)
+            return render(request, self.template_name, {'form': form})
         except DuplicateActionException as e:
             form.add_error(None, str(e))
             return render(request, self.template_name, {'form': form})
+        except ServiceUnavailableException as e:
+            form.add_error(None, str(e))
+            return render(request, self.template_name, {'form': form}, status=503)
         except Exception as e:
             messages.error(request, '회원가입 처리 중 오류가 발생했습니다.')
             return render(request, self.template_name, {'form': form})
@@ -99,8 +111,12 @@ class LoginView(View):
             messages.error(request, '이메일과 비밀번호를 모두 입력해주세요.')
             return render(request, self.template_name)
 
-        # Authenticate user
-        user = authenticate(request, username=email, password=password)
+        # Authenticate user (password hashing may be saturated, see apps.users.hashing)
+        try:
+            user = authenticate(request, username=email, password=password)
+        except ServiceUnavailableException as e:
+            messages.error(request, str(e))
+            return render(request, self.template_name, {'email': email}, status=503)
 
         if user is not None:
             login(request, user)
@@ -125,6 +141,9 @@ class LogoutView(View):
     """
     def post(self, request):
         """Process logout"""
+        user_id = request.user.pk
         logout(request)
+        if user_id is not None:
+            invalidate_auth_user(user_id)
         messages.success(request, '로그아웃되었습니다.')
         return redirect('campaigns:home')
@@ -0,0 +1,15 @@
+"""
+HTTP benchmark suite for the hot pages.
+
+Runs every scenario through the Django test client against the configured
+database (seed it first with `python manage.py seed_load_data`), reports
+p50/p95/p99 latency and requests/sec, writes the results as JSON and fails
+when a scenario regressed beyond a threshold compared to a baseline run.
+
+Usage:
+    python -m benchmarks [--iterations 200] [--output results.json]
+        [--baseline previous.json] [--max-regression 0.2] [--metric p95_ms]
+
+Password hashing throughput (hashes/sec per core) is measured separately:
+    python -m benchmarks.hashing [--iterations 20] [--threads 4]
+"""
@@ -0,0 +1,107 @@
+"""
+Command-line entry point: `python -m benchmarks --help`
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Benchmark the hot pages against the configured (seeded) database.'
+    )
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument(
+        '--scenario',
+        action='append',
+        help='Run only this scenario (repeatable), e.g. campaigns:home'
+    )
+    parser.add_argument('--output', help='Write results JSON to this file')
+    parser.add_argument('--baseline', help='Results JSON of a previous run to compare against')
+    parser.add_argument(
+        '--max-regression',
+        type=float,
+        default=0.2,
+        help='Allowed relative slowdown against the baseline (default: 0.2 = 20%%)'
+    )
+    parser.add_argument(
+        '--metric',
+        default='p95_ms',
+        choices=['p50_ms', 'p95_ms', 'p99_ms', 'mean_ms'],
+        help='Metric compared against the baseline (default: p95_ms)'
+    )
+    args = parser.parse_args(argv)
+    if args.iterations < 2:
+        parser.error('--iterations must be at least 2')
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
+    # 쿼리 수는 Server-Timing 헤더에서 읽는다
+    os.environ.setdefault('REQUEST_METRICS_SERVER_TIMING', 'True')
+    import django
+    django.setup()
+
+    from .runner import BenchmarkError, compare, run
+    from .scenarios import SCENARIOS, ScenarioSetupError
+
+    # 요청마다 남는 RequestMetricsMiddleware 로그가 측정을 방해하지 않도록 한다
+    logging.getLogger('apps').setLevel(logging.WARNING)
+
+    scenarios = SCENARIOS
+    if args.scenario:
+        unknown = set(args.scenario) - {s.name for s in SCENARIOS}
+        if unknown:
+            print(f"Unknown scenario(s): {', '.join(sorted(unknown))}", file=sys.stderr)
+            return 2
+        scenarios = [s for s in SCENARIOS if s.name in args.scenario]
+
+    try:
+        results = run(scenarios, args.iterations, args.warmup)
+    except (BenchmarkError, ScenarioSetupError) as e:
+        print(f'Benchmark failed: {e}', file=sys.stderr)
+        return 1
+
+    _print_table(results)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.max_regression, args.metric)
+        for r in regressions:
+            print(
+                f"REGRESSION {r['scenario']}: {r['metric']} "
+                f"{r['baseline']} -> {r['current']} (x{r['ratio']})",
+                file=sys.stderr
+            )
+        if regressions:
+            return 1
+
+    return 0
+
+
+def _print_table(results):
+    print(f"{'scenario':32} {'p50':>9} {'p95':>9} {'p99':>9} {'rps':>8} {'queries':>7}")
+    for name, r in results['scenarios'].items():
+        queries = '-' if r['queries'] is None else r['queries']
+        print(
+            f"{name:32} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f} "
+            f"{r['rps']:>8.1f} {queries:>7}"
+        )
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Password hashing throughput of the configured hashers (apps.users.hashers).
+
+Hashes a password `iterations` times on each of `threads` threads, inline
+rather than through the bounded pool, and reports hashes/sec overall and
+per core, so the PASSWORD_* cost settings and PASSWORD_HASHING_WORKERS can
+be sized against the deployment's CPU count and expected login rate.
+
+Usage:
+    python -m benchmarks.hashing [--iterations 20] [--threads 1 --threads 4]
+        [--hasher scrypt] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List
+
+PASSWORD = 'benchmark-password-123'
+
+
+def measure(hasher, iterations: int, threads: int) -> Dict:
+    """
+    Hash PASSWORD `iterations` times on each of `threads` threads.
+
+    Returns:
+        dict with the cost parameters, hashes/sec, hashes/sec per core and
+        mean milliseconds per hash
+    """
+    from django.test.utils import override_settings
+
+    salt = hasher.salt()
+    cores = min(threads, os.cpu_count() or 1)
+
+    def work(_):
+        durations = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            hasher.encode(PASSWORD, salt)
+            durations.append((time.perf_counter() - start) * 1000)
+        return durations
+
+    # 풀의 동시 실행 제한 없이 해시 자체의 비용을 잰다
+    with override_settings(PASSWORD_HASHING_WORKERS=0):
+        encoded = hasher.encode(PASSWORD, salt)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            durations = [ms for chunk in pool.map(work, range(threads)) for ms in chunk]
+        elapsed = time.perf_counter() - started
+
+    rate = len(durations) / elapsed
+    return {
+        'hasher': hasher.algorithm,
+        'params': {
+            key: value for key, value in hasher.decode(encoded).items()
+            if isinstance(value, int)
+        },
+        'threads': threads,
+        'hashes': len(durations),
+        'mean_ms': round(statistics.fmean(durations), 3),
+        'hashes_per_s': round(rate, 2),
+        'hashes_per_s_per_core': round(rate / cores, 2),
+    }
+
+
+def run(algorithms: List[str], iterations: int, threads: List[int]) -> Dict:
+    """Measure every requested hasher at every thread count"""
+    from django.contrib.auth.hashers import get_hashers_by_algorithm
+
+    hashers = get_hashers_by_algorithm()
+    return {
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'cpu_count': os.cpu_count(),
+        'iterations': iterations,
+        'results': [
+            measure(hashers[algorithm], iterations, count)
+            for algorithm in algorithms
+            for count in threads
+        ],
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.hashing',
+        description='Measure password hashes per second (per core) of the configured hashers.'
+    )
+    parser.add_argument('--iterations', type=int, default=20, help='Hashes per thread')
+    parser.add_argument(
+        '--threads',
+        type=int,
+        action='append',
+        help='Concurrent hashing threads (repeatable, default: 1 and the CPU count)'
+    )
+    parser.add_argument(
+        '--hasher',
+        action='append',
+        help='Measure only this algorithm (repeatable, default: every available one)'
+    )
+    parser.add_argument('--output', help='Write results JSON to this file')
+    args = parser.parse_args(argv)
+    if args.iterations < 1:
+        parser.error('--iterations must be at least 1')
+    if args.threads and min(args.threads) < 1:
+        parser.error('--threads must be at least 1')
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
+    import django
+    django.setup()
+
+    from django.contrib.auth.hashers import get_hashers_by_algorithm
+
+    hashers = get_hashers_by_algorithm()
+    algorithms = args.hasher or [
+        algorithm for algorithm, hasher in hashers.items() if _available(hasher)
+    ]
+    unknown = set(algorithms) - set(hashers)
+    if unknown:
+        print(f"Unknown hasher(s): {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+    unavailable = [algorithm for algorithm in algorithms if not _available(hashers[algorithm])]
+    if unavailable:
+        print(f"Hasher library not installed: {', '.join(unavailable)}", file=sys.stderr)
+        return 2
+
+    threads = args.threads or sorted({1, os.cpu_count() or 1})
+    results = run(algorithms, args.iterations, threads)
+
+    _print_table(results)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+
+    return 0
+
+
+def _available(hasher) -> bool:
+    try:
+        if hasher.library:
+            hasher._load_library()
+    except ValueError:
+        return False
+    return True
+
+
+def _print_table(results):
+    print(f"{'hasher':14} {'params':40} {'threads':>7} {'ms/hash':>9} {'hashes/s':>9} {'per core':>9}")
+    for r in results['results']:
+        params = ' '.join(f'{key}={value}' for key, value in r['params'].items())
+        print(
+            f"{r['hasher']:14} {params:40} {r['threads']:>7} {r['mean_ms']:>9.1f} "
+            f"{r['hashes_per_s']:>9.2f} {r['hashes_per_s_per_core']:>9.2f}"
+        )
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Benchmark runner: timing, summary statistics and baseline comparison.
+"""
+
+import re
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from django.db import transaction
+from django.test import Client
+
+from .scenarios import Request, Scenario
+
+METRICS = ('p50_ms', 'p95_ms', 'p99_ms', 'mean_ms')
+
+SERVER_TIMING_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+class BenchmarkError(Exception):
+    """Raised when a scenario returns an unexpected response"""
+
+
+def run_scenario(scenario: Scenario, iterations: int, warmup: int) -> Dict:
+    """
+    Send the scenario's request `warmup + iterations` times and summarize.
+
+    Returns:
+        dict with latency percentiles (ms), requests/sec, status and the
+        query count reported by RequestMetricsMiddleware (None if disabled)
+    """
+    request = scenario.build()
+    client = Client()
+    if request.user is not None:
+        client.force_login(request.user)
+
+    for _ in range(warmup):
+        _send(client, request)
+
+    durations = []
+    query_count = None
+    started = time.perf_counter()
+    for _ in range(iterations):
+        duration, response = _send(client, request)
+        if response.status_code != request.expected_status:
+            raise BenchmarkError(
+                f'{scenario.name}: expected HTTP {request.expected_status}, '
+                f'got {response.status_code}'
+            )
+        durations.append(duration)
+        match = SERVER_TIMING_QUERIES.search(response.get('Server-Timing', ''))
+        if match:
+            query_count = int(match.group(1))
+    elapsed = time.perf_counter() - started
+
+    return summarize(durations, elapsed) | {
+        'method': request.method.upper(),
+        'path': request.path,
+        'status_code': request.expected_status,
+        'queries': query_count,
+    }
+
+
+def _send(client: Client, request: Request):
+    method = getattr(client, request.method)
+    if not request.rollback:
+        start = time.perf_counter()
+        response = method(request.path, request.data)
+        return (time.perf_counter() - start) * 1000, response
+
+    with transaction.atomic():
+        start = time.perf_counter()
+        response = method(request.path, request.data)
+        duration = (time.perf_counter() - start) * 1000
+        transaction.set_rollback(True)
+    return duration, response
+
+
+def summarize(durations_ms: List[float], elapsed_s: float) -> Dict:
+    """Percentiles (inclusive method) and throughput of one scenario"""
+    cuts = statistics.quantiles(durations_ms, n=100, method='inclusive')
+    return {
+        'iterations': len(durations_ms),
+        'p50_ms': round(cuts[49], 3),
+        'p95_ms': round(cuts[94], 3),
+        'p99_ms': round(cuts[98], 3),
+        'mean_ms': round(statistics.fmean(durations_ms), 3),
+        'rps': round(len(durations_ms) / elapsed_s, 1),
+    }
+
+
+def run(scenarios: List[Scenario], iterations: int, warmup: int) -> Dict:
+    """Run every scenario and return the JSON-serializable result document"""
+    return {
+        'commit': _git_commit(),
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'iterations': iterations,
+        'warmup': warmup,
+        'scenarios': {
+            scenario.name: run_scenario(scenario, iterations, warmup)
+            for scenario in scenarios
+        },
+    }
+
+
+def compare(current: Dict, baseline: Dict, max_regression: float,
+            metric: str = 'p95_ms') -> List[Dict]:
+    """
+    Scenarios whose `metric` grew by more than `max_regression` (0.2 = +20%).
+
+    Scenarios missing from either run are ignored.
+    """
+    regressions = []
+    for name, result in current['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if not previous or not previous.get(metric):
+            continue
+        ratio = result[metric] / previous[metric]
+        if ratio > 1 + max_regression:
+            regressions.append({
+                'scenario': name,
+                'metric': metric,
+                'baseline': previous[metric],
+                'current': result[metric],
+                'ratio': round(ratio, 3),
+            })
+    return regressions
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,142 @@
+"""
+Benchmark scenarios.
+
+Each scenario picks its fixtures from the seeded database once and returns
+a Request describing what to send. POST scenarios are wrapped in a
+transaction that is rolled back after every request, so each iteration
+sees the same state and the seeded database is left untouched.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Callable, Dict, Optional
+
+from django.db.models import Count, Exists, OuterRef
+from django.urls import reverse
+
+from apps.campaigns.models import Campaign
+from apps.proposals.models import Proposal
+from apps.users.models import User
+
+
+class ScenarioSetupError(Exception):
+    """Raised when the database has no data a scenario needs"""
+
+
+@dataclass(frozen=True)
+class Request:
+    """A single benchmarked HTTP request"""
+    method: str
+    path: str
+    user: Optional[User] = None
+    data: Dict = field(default_factory=dict)
+    expected_status: int = 200
+    rollback: bool = False
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Named benchmark scenario"""
+    name: str
+    build: Callable[[], Request]
+
+
+def _first(queryset, message):
+    obj = queryset.first()
+    if obj is None:
+        raise ScenarioSetupError(message)
+    return obj
+
+
+def _most_applied_campaign(**filters):
+    return _first(
+        Campaign.objects.filter(**filters).order_by('-total_proposals', 'id'),
+        f'No campaign matching {filters or "any"}; run seed_load_data first'
+    )
+
+
+def home() -> Request:
+    return Request('get', reverse('campaigns:home'))
+
+
+def detail() -> Request:
+    campaign = _most_applied_campaign(status='recruiting')
+    return Request('get', reverse('campaigns:detail', kwargs={'pk': campaign.id}))
+
+
+def advertiser_detail() -> Request:
+    campaign = _most_applied_campaign()
+    return Request(
+        'get',
+        reverse('campaigns:advertiser_detail', kwargs={'pk': campaign.id}),
+        user=campaign.advertiser,
+    )
+
+
+def my_proposals() -> Request:
+    influencer = _first(
+        User.objects.filter(role='influencer').annotate(
+            proposal_count=Count('proposals')
+        ).filter(proposal_count__gt=0).order_by('-proposal_count', 'id'),
+        'No influencer with proposals; run seed_load_data first'
+    )
+    return Request('get', reverse('proposals:my_proposals'), user=influencer)
+
+
+def apply() -> Request:
+    today = date.today()
+    campaign = _most_applied_campaign(
+        status='recruiting',
+        recruitment_start_date__lte=today,
+        recruitment_end_date__gte=today,
+    )
+    influencer = _first(
+        User.objects.filter(
+            role='influencer', influencer_profile__isnull=False
+        ).annotate(
+            applied=Exists(Proposal.objects.filter(
+                campaign_id=campaign.id, influencer_id=OuterRef('pk')
+            ))
+        ).filter(applied=False).order_by('id'),
+        f'Every influencer already applied to campaign {campaign.id}'
+    )
+    return Request(
+        'post',
+        reverse('proposals:apply', kwargs={'pk': campaign.id}),
+        user=influencer,
+        data={
+            'cover_letter': '벤치마크 지원서입니다.',
+            'desired_visit_date': (today + timedelta(days=7)).isoformat(),
+        },
+        expected_status=302,
+        rollback=True,
+    )
+
+
+def select_influencers() -> Request:
+    campaign = _most_applied_campaign(
+        status='recruitment_ended', submitted_proposals__gt=0
+    )
+    selected_ids = list(
+        campaign.proposals.filter(status='submitted').order_by('id').values_list(
+            'id', flat=True
+        )[:campaign.recruitment_count]
+    )
+    return Request(
+        'post',
+        reverse('campaigns:select_influencers', kwargs={'pk': campaign.id}),
+        user=campaign.advertiser,
+        data={'selected_proposals[]': [str(pk) for pk in selected_ids]},
+        expected_status=302,
+        rollback=True,
+    )
+
+
+SCENARIOS = [
+    Scenario('campaigns:home', home),
+    Scenario('campaigns:detail', detail),
+    Scenario('campaigns:advertiser_detail', advertiser_detail),
+    Scenario('proposals:my_proposals', my_proposals),
+    Scenario('proposals:apply', apply),
+    Scenario('campaigns:select_influencers', select_influencers),
+]
@@ -0,0 +1,31 @@
+"""
+Tests for the password hashing benchmark
+"""
+
+from django.contrib.auth.hashers import get_hasher
+from benchmarks.hashing import measure, run
+
+
+class TestMeasure:
+    """Tests for measure and run"""
+
+    def test_reports_rate_per_core_and_params(self, settings):
+        """해시 수, 초당 해시 수(코어당)와 비용 파라미터를 보고한다"""
+        settings.PASSWORD_PBKDF2_ITERATIONS = 1000
+
+        result = measure(get_hasher('pbkdf2_sha256'), iterations=3, threads=2)
+
+        assert result['hashes'] == 6
+        assert result['params'] == {'iterations': 1000}
+        assert result['hashes_per_s'] > 0
+        assert result['hashes_per_s_per_core'] >= result['hashes_per_s'] / 2
+
+    def test_run_measures_every_thread_count(self, settings):
+        """요청한 해셔와 스레드 수 조합마다 결과를 낸다"""
+        settings.PASSWORD_SCRYPT_WORK_FACTOR = 2**10
+        settings.PASSWORD_SCRYPT_PARALLELISM = 1
+
+        results = run(['scrypt'], iterations=2, threads=[1, 2])
+
+        assert [(r['hasher'], r['threads']) for r in results['results']] == [('scrypt', 1), ('scrypt', 2)]
+        assert results['results'][0]['params']['work_factor'] == 1024
@@ -0,0 +1,71 @@
+"""
+Tests for the benchmark runner
+"""
+
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from apps.proposals.models import Proposal
+from benchmarks.runner import compare, run, summarize
+from benchmarks.scenarios import SCENARIOS
+
+
+def results(**p95_by_scenario):
+    return {
+        'scenarios': {
+            name: {'p95_ms': p95} for name, p95 in p95_by_scenario.items()
+        }
+    }
+
+
+class TestSummarize:
+    """Tests for summarize"""
+
+    def test_percentiles_and_throughput(self):
+        """백분위수와 초당 요청 수를 계산한다"""
+        summary = summarize([float(ms) for ms in range(1, 101)], elapsed_s=2.0)
+
+        assert summary['iterations'] == 100
+        assert summary['p50_ms'] == pytest.approx(50.5)
+        assert summary['p95_ms'] == pytest.approx(95.05)
+        assert summary['p99_ms'] == pytest.approx(99.01)
+        assert summary['rps'] == 50.0
+
+
+class TestCompare:
+    """Tests for compare"""
+
+    def test_reports_regression_beyond_threshold(self):
+        """임계값을 넘는 성능 저하만 보고한다"""
+        regressions = compare(
+            results(home=13.0, detail=11.0),
+            results(home=10.0, detail=10.0),
+            max_regression=0.2
+        )
+
+        assert [r['scenario'] for r in regressions] == ['home']
+        assert regressions[0]['ratio'] == 1.3
+
+    def test_ignores_scenarios_missing_from_baseline(self):
+        """기준 결과에 없는 시나리오는 비교하지 않는다"""
+        assert compare(results(home=50.0), results(), max_regression=0.2) == []
+
+
+@pytest.mark.django_db
+class TestRun:
+    """Smoke test of every scenario against a small seeded database"""
+
+    def test_all_scenarios_run_and_roll_back_writes(self):
+        """모든 시나리오가 실행되고 POST 시나리오는 데이터를 남기지 않는다"""
+        call_command(
+            'seed_load_data', advertisers=2, influencers=30, campaigns=20,
+            proposals=200, seed=3, stdout=StringIO()
+        )
+        before = list(Proposal.objects.order_by('id').values_list('id', 'status'))
+
+        document = run(SCENARIOS, iterations=2, warmup=1)
+
+        assert set(document['scenarios']) == {s.name for s in SCENARIOS}
+        for summary in document['scenarios'].values():
+            assert summary['p95_ms'] > 0
+        assert list(Proposal.objects.order_by('id').values_list('id', 'status')) == before
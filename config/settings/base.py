@@ -4,6 +4,9 @@ Base settings for experiencer-platform project.
 
 from pathlib import Path
 from decouple import config
+from django.core.exceptions import ImproperlyConfigured
+
+from .cache import cache_backend, is_shared_cache
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -29,6 +32,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'apps.common.middleware.RequestMetricsMiddleware',  # per-view query metrics (log, Server-Timing)
+    'apps.common.middleware.ReplicaPinningMiddleware',  # read-your-writes with a read replica
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Serve static files
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -70,6 +75,21 @@ DATABASES = {
     }
 }
 
+# Read replica for selector reads (apps.common.routers)
+# 로컬에서는 SQLite 파일 두 개로 재현한다 (replica는 읽기 전용으로 연다)
+DATABASE_REPLICA_PATH = config('DATABASE_REPLICA_PATH', default=None)
+if DATABASE_REPLICA_PATH:
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': f"file:{BASE_DIR / DATABASE_REPLICA_PATH}?mode=ro",
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['apps.common.routers.ReplicaRouter']
+
+# Seconds requests stay on the primary after a write (ReplicaPinningMiddleware)
+REPLICA_PIN_SECONDS = config('REPLICA_PIN_SECONDS', default=5, cast=int)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -89,6 +109,34 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing policy (apps.users.hashers)
+# PASSWORD_HASHER: algorithm for new hashes (scrypt | argon2 | pbkdf2_sha256, argon2 needs argon2-cffi).
+# Hashes made with another algorithm or other costs are re-hashed on the next login.
+PASSWORD_HASHER = config('PASSWORD_HASHER', default='scrypt')
+_PASSWORD_HASHER_CLASSES = {
+    'scrypt': 'apps.users.hashers.ScryptPasswordHasher',
+    'argon2': 'apps.users.hashers.Argon2PasswordHasher',
+    'pbkdf2_sha256': 'apps.users.hashers.PBKDF2PasswordHasher',
+}
+if PASSWORD_HASHER not in _PASSWORD_HASHER_CLASSES:
+    raise ImproperlyConfigured(
+        f"Unsupported PASSWORD_HASHER '{PASSWORD_HASHER}' (use one of {', '.join(_PASSWORD_HASHER_CLASSES)})"
+    )
+PASSWORD_HASHERS = [_PASSWORD_HASHER_CLASSES.pop(PASSWORD_HASHER), *_PASSWORD_HASHER_CLASSES.values()]
+
+PASSWORD_SCRYPT_WORK_FACTOR = config('PASSWORD_SCRYPT_WORK_FACTOR', default=2**14, cast=int)
+PASSWORD_SCRYPT_BLOCK_SIZE = config('PASSWORD_SCRYPT_BLOCK_SIZE', default=8, cast=int)
+PASSWORD_SCRYPT_PARALLELISM = config('PASSWORD_SCRYPT_PARALLELISM', default=5, cast=int)
+PASSWORD_ARGON2_TIME_COST = config('PASSWORD_ARGON2_TIME_COST', default=2, cast=int)
+PASSWORD_ARGON2_MEMORY_COST = config('PASSWORD_ARGON2_MEMORY_COST', default=102400, cast=int)
+PASSWORD_ARGON2_PARALLELISM = config('PASSWORD_ARGON2_PARALLELISM', default=8, cast=int)
+PASSWORD_PBKDF2_ITERATIONS = config('PASSWORD_PBKDF2_ITERATIONS', default=870000, cast=int)
+
+# Threads per process that hash passwords (0 = hash inline) and seconds a hash
+# may wait for one before the request fails with 503 (apps.users.hashing)
+PASSWORD_HASHING_WORKERS = config('PASSWORD_HASHING_WORKERS', default=2, cast=int)
+PASSWORD_HASHING_QUEUE_TIMEOUT = config('PASSWORD_HASHING_QUEUE_TIMEOUT', default=2.0, cast=float)
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.0/topics/i18n/
@@ -120,3 +168,72 @@ AUTH_USER_MODEL = 'users.User'
 LOGIN_URL = '/accounts/login/'
 LOGIN_REDIRECT_URL = '/'
 LOGOUT_REDIRECT_URL = '/'
+
+# Request metrics (apps.common.middleware.RequestMetricsMiddleware)
+REQUEST_METRICS_ENABLED = config('REQUEST_METRICS_ENABLED', default=True, cast=bool)
+REQUEST_METRICS_SLOW_SQL_MS = config('REQUEST_METRICS_SLOW_SQL_MS', default=100.0, cast=float)
+# Server-Timing 헤더를 모든 요청에 보낼지 (기본은 DEBUG 또는 staff 요청에만)
+REQUEST_METRICS_SERVER_TIMING = config('REQUEST_METRICS_SERVER_TIMING', default=False, cast=bool)
+
+# /health/metrics/ 접근 토큰 (X-Health-Token 헤더, 비어 있으면 staff만 조회)
+HEALTH_METRICS_TOKEN = config('HEALTH_METRICS_TOKEN', default='')
+
+# Cache (config/settings/cache.py)
+# 여러 워커/크론 프로세스가 같은 캐시를 보려면 CACHE_URL로 Redis 또는 Memcached를 지정한다.
+# 기본값(locmem://)은 프로세스별 메모리 캐시라 무효화가 다른 프로세스에 전달되지 않는다.
+CACHES = {
+    'default': cache_backend(config('CACHE_URL', default='locmem://')),
+}
+
+# 로그아웃/비활성화/비밀번호 변경이 모든 워커에 보여야 하므로, 공유 캐시가 있을 때만
+# 요청마다의 사용자 조회(apps.users.cache)와 세션을 캐시에서 읽는다 (apps.users.checks)
+_SHARED_CACHE = is_shared_cache(CACHES['default'])
+AUTHENTICATION_BACKENDS = [
+    'apps.users.backends.CachedModelBackend' if _SHARED_CACHE
+    else 'django.contrib.auth.backends.ModelBackend'
+]
+
+# Sessions: with a shared cache read from it and written through to the database
+SESSION_ENGINE = config(
+    'SESSION_ENGINE',
+    default='django.contrib.sessions.backends.cached_db' if _SHARED_CACHE
+    else 'django.contrib.sessions.backends.db'
+)
+
+# Seconds a rendered campaign detail fragment stays cached (apps.campaigns.cache)
+CAMPAIGN_DETAIL_CACHE_TIMEOUT = config('CAMPAIGN_DETAIL_CACHE_TIMEOUT', default=600, cast=int)
+
+# Full-page cache of the home page (apps.campaigns.page_cache)
+HOME_PAGE_CACHE_ENABLED = config('HOME_PAGE_CACHE_ENABLED', default=True, cast=bool)
+HOME_PAGE_CACHE_TIMEOUT = config('HOME_PAGE_CACHE_TIMEOUT', default=300, cast=int)
+
+# Seconds an authenticated user's snapshot stays cached (apps.users.cache)
+AUTH_USER_CACHE_TIMEOUT = config('AUTH_USER_CACHE_TIMEOUT', default=300, cast=int)
+
+# 인플루언서별 지원 체험단 ID 캐시 (apps.proposals.cache): 지원 직후 다른 워커도 보도록
+# 공유 캐시가 있을 때만 켠다 (apps.proposals.checks), 없으면 매번 DB에서 조회한다
+APPLIED_CAMPAIGNS_CACHE_ENABLED = config(
+    'APPLIED_CAMPAIGNS_CACHE_ENABLED', default=_SHARED_CACHE, cast=bool
+)
+# Seconds an influencer's applied campaign ID set stays cached (apps.proposals.cache)
+APPLIED_CAMPAIGNS_CACHE_TIMEOUT = config('APPLIED_CAMPAIGNS_CACHE_TIMEOUT', default=3600, cast=int)
+
+# Rows fetched per cursor round trip by the applicant CSV export (apps.campaigns.exports)
+APPLICANT_EXPORT_CHUNK_SIZE = config('APPLICANT_EXPORT_CHUNK_SIZE', default=2000, cast=int)
+
+# Logging
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'apps': {
+            'handlers': ['console'],
+            'level': config('APPS_LOG_LEVEL', default='INFO'),
+        },
+    },
+}
@@ -0,0 +1,61 @@
+"""
+Cache settings (CACHE_URL).
+
+The caches of this project (applied campaign sets, sessions and auth
+snapshots) are only correct across gunicorn workers, the cron process and
+admin requests when every process shares one backend; without one,
+sessions and the per-request user lookup use the database (config/settings/
+base.py, checked by apps.users.checks). The home page and detail
+fragments are versioned by database values and stay correct per process,
+just less shared:
+- redis://[:password@]host:port/db (or rediss://): Redis (redis-py)
+- memcached://host:port[,host:port...]: Memcached (pymemcache)
+- locmem:// (default): per-process memory. Invalidation only reaches the
+  process that made the write; use it for development and tests, or a
+  single-process deployment.
+"""
+
+from urllib.parse import urlsplit
+
+from django.core.exceptions import ImproperlyConfigured
+
+LOCMEM_BACKEND = 'django.core.cache.backends.locmem.LocMemCache'
+
+BACKENDS = {
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'rediss': 'django.core.cache.backends.redis.RedisCache',
+    'memcached': 'django.core.cache.backends.memcached.PyMemcacheCache',
+    'locmem': LOCMEM_BACKEND,
+}
+
+
+def cache_backend(url: str) -> dict:
+    """
+    Build a CACHES entry from a cache URL.
+
+    Args:
+        url: Cache URL (see module docstring)
+
+    Returns:
+        dict: CACHES['default'] settings
+
+    Raises:
+        ImproperlyConfigured: If the URL scheme is not supported
+    """
+    parts = urlsplit(url)
+    backend = BACKENDS.get(parts.scheme)
+    if backend is None:
+        raise ImproperlyConfigured(
+            f"Unsupported CACHE_URL scheme '{parts.scheme}' (use one of {', '.join(BACKENDS)})"
+        )
+
+    if parts.scheme.startswith('redis'):
+        return {'BACKEND': backend, 'LOCATION': url}
+    if parts.scheme == 'memcached':
+        return {'BACKEND': backend, 'LOCATION': parts.netloc.split(',')}
+    return {'BACKEND': backend, 'LOCATION': parts.netloc}
+
+
+def is_shared_cache(settings: dict) -> bool:
+    """Whether a CACHES entry is visible to every process (not process-local memory)"""
+    return settings.get('BACKEND') != LOCMEM_BACKEND
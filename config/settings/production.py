@@ -4,6 +4,8 @@ For Railway deployment.
 """
 
 from .base import *
+from .postgres import postgres_database
+from .sqlite import sqlite_database
 from decouple import config
 
 DEBUG = config('DEBUG', default=False, cast=bool)
@@ -14,20 +16,23 @@ ALLOWED_HOSTS = ['*']
 # Database Configuration
 # Railway provides DATABASE_URL when PostgreSQL is added
 import os
-import dj_database_url
 
 # Use PostgreSQL if DATABASE_URL is set, otherwise fallback to SQLite
 database_url = config('DATABASE_URL', default=None)
 
 if database_url:
-    # PostgreSQL (Production)
+    # PostgreSQL (Production) - psycopg connection pool per worker process
     DATABASES = {
-        'default': dj_database_url.config(
-            default=database_url,
-            conn_max_age=600,
-            conn_health_checks=True,
-        )
+        'default': postgres_database(database_url)
     }
+
+    # Streaming replica for selector reads (apps.common.routers)
+    replica_url = config('DATABASE_REPLICA_URL', default=None)
+    if replica_url:
+        DATABASES['replica'] = {
+            **postgres_database(replica_url),
+            'TEST': {'MIRROR': 'default'},
+        }
 else:
     # SQLite Fallback with Railway Volume support
     # Railway 볼륨 마운트 경로 (1단계에서 설정한 Mount Path와 일치해야 함)
@@ -42,11 +47,9 @@ else:
         db_path = config('DATABASE_PATH', default='/tmp/db.sqlite3')
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
+    # WAL, pragmas and BEGIN IMMEDIATE for concurrent gunicorn workers
     DATABASES = {
-        'default': {
-            'ENGINE': 'django.db.backends.sqlite3',
-            'NAME': db_path,
-        }
+        'default': sqlite_database(db_path)
     }
 
 # Security settings - Disabled for Railway deployment
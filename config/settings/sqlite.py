@@ -0,0 +1,51 @@
+"""
+SQLite connection settings for multi-process (gunicorn) deployments.
+
+Every new connection runs the PRAGMAs below via Django's `init_command`:
+- journal_mode=WAL: readers no longer block on the writer (and vice versa)
+- synchronous=NORMAL: fsync at checkpoints only, safe with WAL
+- mmap_size / cache_size: keep hot pages of the (small) database in memory
+- temp_store=MEMORY: sorts and temp indexes avoid disk
+
+Write transactions start with BEGIN IMMEDIATE (`transaction_mode`), so a
+second writer waits up to SQLITE_BUSY_TIMEOUT_MS for the write lock
+instead of failing with "database is locked" on lock upgrade.
+
+All values are overridable via environment variables (python-decouple).
+"""
+
+from decouple import config
+
+
+def sqlite_database(name) -> dict:
+    """
+    Build a DATABASES entry for SQLite with production pragmas.
+
+    Args:
+        name: Database file path
+
+    Returns:
+        dict: DATABASES['default'] settings
+    """
+    pragmas = {
+        'journal_mode': config('SQLITE_JOURNAL_MODE', default='WAL'),
+        'synchronous': config('SQLITE_SYNCHRONOUS', default='NORMAL'),
+        'mmap_size': config('SQLITE_MMAP_SIZE', default=268435456, cast=int),
+        # 음수는 KiB 단위 (-65536 = 64MB)
+        'cache_size': config('SQLITE_CACHE_SIZE', default=-65536, cast=int),
+        'temp_store': config('SQLITE_TEMP_STORE', default='MEMORY'),
+    }
+    busy_timeout_ms = config('SQLITE_BUSY_TIMEOUT_MS', default=5000, cast=int)
+
+    return {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': name,
+        'OPTIONS': {
+            'init_command': ';'.join(
+                f'PRAGMA {pragma}={value}' for pragma, value in pragmas.items()
+            ),
+            'transaction_mode': config('SQLITE_TRANSACTION_MODE', default='IMMEDIATE'),
+            # sqlite3 모듈의 busy handler (초 단위)
+            'timeout': busy_timeout_ms / 1000,
+        },
+    }
@@ -16,9 +16,12 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
+from apps.common.views import HealthMetricsView, HealthView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('health/', HealthView.as_view(), name='health'),  # 로드 밸런서 헬스 체크 (primary DB)
+    path('health/metrics/', HealthMetricsView.as_view(), name='health_metrics'),  # DB 상태 및 커넥션 풀 점유율
     path('accounts/', include('apps.users.urls', namespace='users')),
     path('my/', include('apps.proposals.urls', namespace='proposals')),
     path('', include(('apps.campaigns.urls', 'campaigns'))),  # 홈 페이지를 루트에 매핑
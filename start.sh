@@ -14,6 +14,12 @@ touch /data/db.sqlite3
 echo "Running database migrations..."
 python manage.py migrate --noinput
 
+# 3-1. 모집 기간이 지난 체험단 마감 처리
+# 배포할 때마다 한 번 실행합니다. 매일 자정 직후 실행은 저장소 설정에 없으므로
+# Railway 대시보드에서 직접 Cron 서비스를 만들어야 합니다 (docs/techstack.md '마감 처리 스케줄').
+echo "Closing expired campaigns..."
+python manage.py close_expired_campaigns
+
 # 4. (기존 설정 유지) 정적 파일 수집 (Static files)
 # CSS, JS 같은 정적 파일들을 한 곳으로 모읍니다.
 echo "Collecting static files..."
@@ -22,5 +28,7 @@ python manage.py collectstatic --noinput
 # 5. (기존 설정 유지) Gunicorn 웹 서버 시작
 # 최종적으로 웹 서버를 실행하여 외부 요청을 받을 수 있게 합니다.
 # exec는 프로세스 관리를 더 효율적으로 만들어줍니다.
+# 워커당 스레드를 두어, 비밀번호 해싱(최대 PASSWORD_HASHING_WORKERS개)이 진행되는 동안에도
+# 나머지 스레드가 페이지를 렌더링하게 합니다.
 echo "Starting gunicorn..."
-exec gunicorn config.wsgi:application --bind 0.0.0.0:$PORT
\ No newline at end of file
+exec gunicorn config.wsgi:application --bind 0.0.0.0:$PORT --threads ${GUNICORN_THREADS:-4}
\ No newline at end of file